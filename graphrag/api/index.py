@@ -17,7 +17,7 @@ from graphrag.config.models.graph_rag_config import GraphRagConfig
 from graphrag.index.run.run_pipeline import run_pipeline
 from graphrag.index.run.utils import create_callback_chain
 from graphrag.index.typing.pipeline_run_result import PipelineRunResult
-from graphrag.index.typing.workflow import WorkflowFunction
+from graphrag.index.typing.workflow import WorkflowDependencies, WorkflowFunction
 from graphrag.index.workflows.factory import PipelineFactory
 from graphrag.logger.base import ProgressLogger
 from graphrag.logger.null_progress import NullProgressLogger
@@ -29,6 +29,7 @@ async def build_index(
     config: GraphRagConfig,
     method: IndexingMethod = IndexingMethod.Standard,
     is_update_run: bool = False,
+    is_resume_run: bool = False,
     memory_profile: bool = False,
     callbacks: list[WorkflowCallbacks] | None = None,
     progress_logger: ProgressLogger | None = None,
@@ -41,8 +42,12 @@ async def build_index(
         The configuration.
     method : IndexingMethod default=IndexingMethod.Standard
         Styling of indexing to perform (full LLM, NLP + LLM, etc.).
+    is_update_run : bool default=False
+        Whether to incrementally update an existing index with new documents.
+    is_resume_run : bool default=False
+        Whether to resume a previous run, skipping workflows whose recorded checkpoint is still valid.
     memory_profile : bool
-        Whether to enable memory profiling.
+        Whether to trace each workflow with tracemalloc and cProfile, writing the results to the profiles/ output folder.
     callbacks : list[WorkflowCallbacks] | None default=None
         A list of callbacks to register.
     progress_logger : ProgressLogger | None default=None
@@ -62,9 +67,6 @@ async def build_index(
 
     outputs: list[PipelineRunResult] = []
 
-    if memory_profile:
-        log.warning("New pipeline does not yet support memory profiling.")
-
     pipeline = PipelineFactory.create_pipeline(config, method)
 
     workflow_callbacks.pipeline_start(pipeline.names())
@@ -75,6 +77,8 @@ async def build_index(
         callbacks=workflow_callbacks,
         logger=logger,
         is_update_run=is_update_run,
+        is_resume_run=is_resume_run,
+        profile=memory_profile,
     ):
         outputs.append(output)
         if output.errors and len(output.errors) > 0:
@@ -87,6 +91,13 @@ async def build_index(
     return outputs
 
 
-def register_workflow_function(name: str, workflow: WorkflowFunction):
-    """Register a custom workflow function. You can then include the name in the settings.yaml workflows list."""
-    PipelineFactory.register(name, workflow)
+def register_workflow_function(
+    name: str,
+    workflow: WorkflowFunction,
+    dependencies: WorkflowDependencies | None = None,
+):
+    """Register a custom workflow function. You can then include the name in the settings.yaml workflows list.
+
+    Declaring the tables the workflow reads and writes lets it be checkpointed and scheduled concurrently.
+    """
+    PipelineFactory.register(name, workflow, dependencies)
@@ -21,6 +21,11 @@ class JsonPipelineCache(PipelineCache):
         self._storage = storage
         self._encoding = encoding
 
+    @property
+    def storage(self) -> PipelineStorage:
+        """Return the storage backing the cache."""
+        return self._storage
+
     async def get(self, key: str) -> str | None:
         """Get method definition."""
         if await self.has(key):
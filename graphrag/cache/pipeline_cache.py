@@ -6,7 +6,10 @@
 from __future__ import annotations
 
 from abc import ABCMeta, abstractmethod
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from graphrag.storage.pipeline_storage import PipelineStorage
 
 
 class PipelineCache(metaclass=ABCMeta):
@@ -65,3 +68,12 @@ class PipelineCache(metaclass=ABCMeta):
         Args:
             - name - The name to create the sub cache with.
         """
+
+    @property
+    def storage(self) -> PipelineStorage | None:
+        """Return the storage backing the cache, if it persists to one.
+
+        Data that does not fit the cache's entry format, such as binary files, can be kept next to
+        the cache entries in this storage.
+        """
+        return None
@@ -5,10 +5,12 @@
 
 import json
 import logging
+from dataclasses import asdict
 from io import TextIOWrapper
 from pathlib import Path
 
 from graphrag.callbacks.noop_workflow_callbacks import NoopWorkflowCallbacks
+from graphrag.logger.progress import Concurrency
 
 log = logging.getLogger(__name__)
 
@@ -73,6 +75,16 @@ class FileWorkflowCallbacks(NoopWorkflowCallbacks):
         message = f"{message} details={details}"
         log.info(message)
 
+    def concurrency(self, concurrency: Concurrency):
+        """Handle when an adaptive concurrency limiter changes its limit."""
+        self._out_stream.write(
+            json.dumps(
+                {"type": "concurrency", "data": asdict(concurrency)},
+                ensure_ascii=False,
+            )
+            + "\n"
+        )
+
 
 def _print_warning(skk):
     log.warning(skk)
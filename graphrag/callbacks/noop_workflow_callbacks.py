@@ -5,7 +5,7 @@
 
 from graphrag.callbacks.workflow_callbacks import WorkflowCallbacks
 from graphrag.index.typing.pipeline_run_result import PipelineRunResult
-from graphrag.logger.progress import Progress
+from graphrag.logger.progress import Concurrency, Progress
 
 
 class NoopWorkflowCallbacks(WorkflowCallbacks):
@@ -26,6 +26,9 @@ class NoopWorkflowCallbacks(WorkflowCallbacks):
     def progress(self, progress: Progress) -> None:
         """Handle when progress occurs."""
 
+    def concurrency(self, concurrency: Concurrency) -> None:
+        """Handle when an adaptive concurrency limiter changes its limit."""
+
     def error(
         self,
         message: str,
@@ -6,7 +6,7 @@
 from typing import Protocol
 
 from graphrag.index.typing.pipeline_run_result import PipelineRunResult
-from graphrag.logger.progress import Progress
+from graphrag.logger.progress import Concurrency, Progress
 
 
 class WorkflowCallbacks(Protocol):
@@ -36,6 +36,10 @@ class WorkflowCallbacks(Protocol):
         """Handle when progress occurs."""
         ...
 
+    def concurrency(self, concurrency: Concurrency) -> None:
+        """Handle when an adaptive concurrency limiter changes its limit."""
+        ...
+
     def error(
         self,
         message: str,
@@ -5,7 +5,7 @@
 
 from graphrag.callbacks.workflow_callbacks import WorkflowCallbacks
 from graphrag.index.typing.pipeline_run_result import PipelineRunResult
-from graphrag.logger.progress import Progress
+from graphrag.logger.progress import Concurrency, Progress
 
 
 class WorkflowCallbacksManager(WorkflowCallbacks):
@@ -51,6 +51,12 @@ class WorkflowCallbacksManager(WorkflowCallbacks):
             if hasattr(callback, "progress"):
                 callback.progress(progress)
 
+    def concurrency(self, concurrency: Concurrency) -> None:
+        """Handle when an adaptive concurrency limiter changes its limit."""
+        for callback in self._callbacks:
+            if hasattr(callback, "concurrency"):
+                callback.concurrency(concurrency)
+
     def error(
         self,
         message: str,
@@ -131,7 +131,8 @@ def _index_cli(
         bool, typer.Option(help="Run the indexing pipeline with verbose logging")
     ] = False,
     memprofile: Annotated[
-        bool, typer.Option(help="Run the indexing pipeline with memory profiling")
+        bool,
+        typer.Option(help="Run the indexing pipeline with memory and CPU profiling"),
     ] = False,
     logger: Annotated[
         LoggerType, typer.Option(help="The progress logger to use.")
@@ -158,6 +159,12 @@ def _index_cli(
             resolve_path=True,
         ),
     ] = None,
+    resume: Annotated[
+        bool,
+        typer.Option(
+            help="Resume a previous run that recorded checkpoints (see the checkpoints setting), skipping workflows whose outputs are already up to date."
+        ),
+    ] = False,
 ):
     """Build a knowledge graph index."""
     from graphrag.cli.index import index_cli
@@ -173,6 +180,7 @@ def _index_cli(
         skip_validation=skip_validation,
         output_dir=output,
         method=method,
+        resume=resume,
     )
 
 
@@ -201,7 +209,8 @@ def _update_cli(
         bool, typer.Option(help="Run the indexing pipeline with verbose logging")
     ] = False,
     memprofile: Annotated[
-        bool, typer.Option(help="Run the indexing pipeline with memory profiling")
+        bool,
+        typer.Option(help="Run the indexing pipeline with memory and CPU profiling"),
     ] = False,
     logger: Annotated[
         LoggerType, typer.Option(help="The progress logger to use.")
@@ -12,6 +12,7 @@ import graphrag.api as api
 from graphrag.callbacks.noop_query_callbacks import NoopQueryCallbacks
 from graphrag.config.load_config import load_config
 from graphrag.config.models.graph_rag_config import GraphRagConfig
+from graphrag.index.utils.text_units import has_spans, materialize_text
 from graphrag.logger.print_progress import PrintProgressLogger
 from graphrag.utils.api import create_storage_from_config
 from graphrag.utils.storage import load_table_from_storage, storage_has_table
@@ -19,6 +20,8 @@ from graphrag.utils.storage import load_table_from_storage, storage_has_table
 if TYPE_CHECKING:
     import pandas as pd
 
+    from graphrag.storage.pipeline_storage import PipelineStorage
+
 logger = PrintProgressLogger("")
 
 
@@ -501,9 +504,7 @@ def _resolve_output_files(
             for name in output_list:
                 if name not in dataframe_dict:
                     dataframe_dict[name] = []
-                df_value = asyncio.run(
-                    load_table_from_storage(name=name, storage=storage_obj)
-                )
+                df_value = asyncio.run(_load_table(name=name, storage=storage_obj))
                 dataframe_dict[name].append(df_value)
 
             # for optional output files, do not append if the dataframe does not exist
@@ -526,7 +527,7 @@ def _resolve_output_files(
     dataframe_dict["multi-index"] = False
     storage_obj = create_storage_from_config(config.output)
     for name in output_list:
-        df_value = asyncio.run(load_table_from_storage(name=name, storage=storage_obj))
+        df_value = asyncio.run(_load_table(name=name, storage=storage_obj))
         dataframe_dict[name] = df_value
 
     # for optional output files, set the dict entry to None instead of erroring out if it does not exist
@@ -541,3 +542,12 @@ def _resolve_output_files(
             else:
                 dataframe_dict[optional_file] = None
     return dataframe_dict
+
+
+async def _load_table(name: str, storage: "PipelineStorage") -> "pd.DataFrame":
+    """Load an output table, reading the text of text units stored as spans back from the documents."""
+    table = await load_table_from_storage(name=name, storage=storage)
+    if name == "text_units" and has_spans(table) and table["text"].isna().any():
+        documents = await load_table_from_storage(name="documents", storage=storage)
+        table = materialize_text(table, documents)
+    return table
@@ -75,6 +75,8 @@ class ChunksDefaults:
     encoding_model: str = "cl100k_base"
     prepend_metadata: bool = False
     chunk_size_includes_metadata: bool = False
+    store_spans: bool = False
+    num_processes: int = 1
 
 
 @dataclass
@@ -155,6 +157,8 @@ class EmbedTextDefaults:
     names: list[str] = field(default_factory=list)
     strategy: None = None
     vector_store_id: str = DEFAULT_VECTOR_STORE_ID
+    vector_cache: bool = False
+    concurrent_batches: int = 1
 
 
 @dataclass
@@ -181,6 +185,8 @@ class ExtractGraphDefaults:
         default_factory=lambda: ["organization", "person", "geo", "event"]
     )
     max_gleanings: int = 1
+    pack_tokens: int = 0
+    adaptive_gleaning: bool = False
     strategy: None = None
     encoding_model: None = None
     model_id: str = DEFAULT_CHAT_MODEL_ID
@@ -219,6 +225,7 @@ class ExtractGraphNLPDefaults:
     normalize_edge_weights: bool = True
     text_analyzer: TextAnalyzerDefaults = field(default_factory=TextAnalyzerDefaults)
     concurrent_requests: int = 25
+    async_mode: AsyncType = AsyncType.Threaded
 
 
 @dataclass
@@ -291,6 +298,8 @@ class LanguageModelDefaults:
     max_retries: int = 10
     max_retry_wait: float = 10.0
     concurrent_requests: int = 25
+    adaptive_concurrency: bool = False
+    max_concurrent_requests: int = 100
     responses: None = None
     async_mode: AsyncType = AsyncType.Threaded
 
@@ -356,6 +365,15 @@ class SnapshotsDefaults:
 
     embeddings: bool = False
     graphml: bool = False
+    raw_graph: bool = False
+
+
+@dataclass
+class StreamingDefaults:
+    """Default values for streaming."""
+
+    enabled: bool = False
+    batch_size: int = 1000
 
 
 @dataclass
@@ -364,6 +382,8 @@ class SummarizeDescriptionsDefaults:
 
     prompt: None = None
     max_length: int = 500
+    skip_within_length: bool = False
+    tree_reduce: bool = False
     strategy: None = None
     model_id: str = DEFAULT_CHAT_MODEL_ID
 
@@ -418,6 +438,7 @@ class GraphRagConfigDefaults:
     embed_text: EmbedTextDefaults = field(default_factory=EmbedTextDefaults)
     chunks: ChunksDefaults = field(default_factory=ChunksDefaults)
     snapshots: SnapshotsDefaults = field(default_factory=SnapshotsDefaults)
+    streaming: StreamingDefaults = field(default_factory=StreamingDefaults)
     extract_graph: ExtractGraphDefaults = field(default_factory=ExtractGraphDefaults)
     extract_graph_nlp: ExtractGraphNLPDefaults = field(
         default_factory=ExtractGraphNLPDefaults
@@ -440,6 +461,9 @@ class GraphRagConfigDefaults:
         default_factory=lambda: {DEFAULT_VECTOR_STORE_ID: VectorStoreDefaults()}
     )
     workflows: None = None
+    concurrent_workflows: bool = False
+    table_memory_limit: int = 0
+    checkpoints: bool = False
 
 
 language_model_defaults = LanguageModelDefaults()
@@ -132,6 +132,7 @@ class AsyncType(str, Enum):
 
     AsyncIO = "asyncio"
     Threaded = "threaded"
+    Process = "process"
 
 
 class ChunkStrategyType(str, Enum):
@@ -139,6 +140,7 @@ class ChunkStrategyType(str, Enum):
 
     tokens = "tokens"
     sentence = "sentence"
+    content = "content"
 
     def __repr__(self):
         """Get a string representation."""
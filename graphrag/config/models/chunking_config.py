@@ -40,3 +40,11 @@ class ChunkingConfig(BaseModel):
         description="Count metadata in max tokens.",
         default=graphrag_config_defaults.chunks.chunk_size_includes_metadata,
     )
+    store_spans: bool = Field(
+        description="Store text units as spans of their documents instead of copies of the text.",
+        default=graphrag_config_defaults.chunks.store_spans,
+    )
+    num_processes: int = Field(
+        description="The number of worker processes to chunk with. 1 chunks in the indexing process.",
+        default=graphrag_config_defaults.chunks.num_processes,
+    )
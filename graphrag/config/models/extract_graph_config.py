@@ -26,6 +26,14 @@ class ExtractGraphConfig(BaseModel):
         description="The maximum number of entity gleanings to use.",
         default=graphrag_config_defaults.extract_graph.max_gleanings,
     )
+    adaptive_gleaning: bool = Field(
+        description="Decide per text unit whether a gleaning round is likely to find more records, instead of always running max_gleanings rounds.",
+        default=graphrag_config_defaults.extract_graph.adaptive_gleaning,
+    )
+    pack_tokens: int = Field(
+        description="Pack consecutive text units into a single extraction request up to this many tokens. 0 sends one request per text unit.",
+        default=graphrag_config_defaults.extract_graph.pack_tokens,
+    )
     strategy: dict | None = Field(
         description="Override the default entity extraction strategy",
         default=graphrag_config_defaults.extract_graph.strategy,
@@ -57,5 +65,7 @@ class ExtractGraphConfig(BaseModel):
             if self.prompt
             else None,
             "max_gleanings": self.max_gleanings,
+            "adaptive_gleaning": self.adaptive_gleaning,
+            "pack_tokens": self.pack_tokens,
             "encoding_name": model_config.encoding_model,
         }
@@ -30,6 +30,7 @@ from graphrag.config.models.output_config import OutputConfig
 from graphrag.config.models.prune_graph_config import PruneGraphConfig
 from graphrag.config.models.reporting_config import ReportingConfig
 from graphrag.config.models.snapshots_config import SnapshotsConfig
+from graphrag.config.models.streaming_config import StreamingConfig
 from graphrag.config.models.summarize_descriptions_config import (
     SummarizeDescriptionsConfig,
 )
@@ -198,6 +199,12 @@ class GraphRagConfig(BaseModel):
     )
     """The snapshots configuration to use."""
 
+    streaming: StreamingConfig = Field(
+        description="The micro-batch streaming configuration to use.",
+        default=StreamingConfig(),
+    )
+    """The micro-batch streaming configuration to use."""
+
     extract_graph: ExtractGraphConfig = Field(
         description="The entity extraction configuration to use.",
         default=ExtractGraphConfig(),
@@ -282,6 +289,24 @@ class GraphRagConfig(BaseModel):
     )
     """List of workflows to run, in execution order."""
 
+    concurrent_workflows: bool = Field(
+        description="Run workflows with no data dependency on each other concurrently.",
+        default=graphrag_config_defaults.concurrent_workflows,
+    )
+    """Run workflows with no data dependency on each other concurrently."""
+
+    table_memory_limit: int = Field(
+        description="The memory in MB used to hand tables between workflows in memory while they are persisted in the background. Off (0) by default, so tables are read and written through storage.",
+        default=graphrag_config_defaults.table_memory_limit,
+    )
+    """The memory in MB used to hand tables between workflows in memory."""
+
+    checkpoints: bool = Field(
+        description="Record a checkpoint after each workflow, so an interrupted run can be resumed. Resumed runs always record checkpoints.",
+        default=graphrag_config_defaults.checkpoints,
+    )
+    """Record a checkpoint after each workflow, so an interrupted run can be resumed."""
+
     def _validate_vector_store_db_uri(self) -> None:
         """Validate the vector store configuration."""
         for store in self.vector_store.values():
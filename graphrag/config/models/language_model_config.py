@@ -240,6 +240,14 @@ class LanguageModelConfig(BaseModel):
         description="Whether to use concurrent requests for the LLM service.",
         default=language_model_defaults.concurrent_requests,
     )
+    adaptive_concurrency: bool = Field(
+        description="Whether to adapt the number of concurrent requests to the rate limits and latency of the LLM service. concurrent_requests is used as the starting point.",
+        default=language_model_defaults.adaptive_concurrency,
+    )
+    max_concurrent_requests: int = Field(
+        description="The maximum number of concurrent requests when adaptive concurrency is enabled.",
+        default=language_model_defaults.max_concurrent_requests,
+    )
     responses: list[str | BaseModel] | None = Field(
         default=language_model_defaults.responses,
         description="Static responses to use in mock mode.",
@@ -248,6 +256,20 @@ class LanguageModelConfig(BaseModel):
         description="The async mode to use.", default=language_model_defaults.async_mode
     )
 
+    def _validate_async_mode(self) -> None:
+        """Validate the async mode.
+
+        Model calls are IO bound and their transforms cannot be shipped to worker processes.
+
+        Raises
+        ------
+        ValueError
+            If the async mode is process.
+        """
+        if self.async_mode == AsyncType.Process:
+            msg = "async_mode process is not supported for language models, use asyncio or threaded."
+            raise ValueError(msg)
+
     def _validate_azure_settings(self) -> None:
         """Validate the Azure settings.
 
@@ -271,4 +293,5 @@ class LanguageModelConfig(BaseModel):
         self._validate_api_key()
         self._validate_azure_settings()
         self._validate_encoding_model()
+        self._validate_async_mode()
         return self
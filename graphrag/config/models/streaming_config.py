@@ -0,0 +1,21 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Parameterization settings for the default configuration."""
+
+from pydantic import BaseModel, Field
+
+from graphrag.config.defaults import graphrag_config_defaults
+
+
+class StreamingConfig(BaseModel):
+    """Configuration section for micro-batch streaming of chunking and graph extraction."""
+
+    enabled: bool = Field(
+        description="A flag indicating whether to chunk and extract the graph in micro-batches.",
+        default=graphrag_config_defaults.streaming.enabled,
+    )
+    batch_size: int = Field(
+        description="The number of document groups to chunk and extract per micro-batch. Without group-by columns, all documents form a single micro-batch.",
+        default=graphrag_config_defaults.streaming.batch_size,
+    )
@@ -22,6 +22,14 @@ class SummarizeDescriptionsConfig(BaseModel):
         description="The description summarization maximum length.",
         default=graphrag_config_defaults.summarize_descriptions.max_length,
     )
+    skip_within_length: bool = Field(
+        description="Whether to keep description lists that fit within max_length as they are instead of summarizing them.",
+        default=graphrag_config_defaults.summarize_descriptions.skip_within_length,
+    )
+    tree_reduce: bool = Field(
+        description="Whether to summarize long description lists as a tree of concurrent requests instead of a sequence.",
+        default=graphrag_config_defaults.summarize_descriptions.tree_reduce,
+    )
     strategy: dict | None = Field(
         description="The override strategy to use.",
         default=graphrag_config_defaults.summarize_descriptions.strategy,
@@ -49,4 +57,6 @@ class SummarizeDescriptionsConfig(BaseModel):
             if self.prompt
             else None,
             "max_summary_length": self.max_length,
+            "skip_within_length": self.skip_within_length,
+            "tree_reduce": self.tree_reduce,
         }
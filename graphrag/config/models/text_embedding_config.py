@@ -41,6 +41,14 @@ class TextEmbeddingConfig(BaseModel):
         description="The vector store ID to use for text embeddings.",
         default=graphrag_config_defaults.embed_text.vector_store_id,
     )
+    vector_cache: bool = Field(
+        description="Whether to store embeddings by text content in the cache and only embed texts without a stored embedding.",
+        default=graphrag_config_defaults.embed_text.vector_cache,
+    )
+    concurrent_batches: int = Field(
+        description="The number of vector store insert batches to embed concurrently while finished batches are written to the vector store.",
+        default=graphrag_config_defaults.embed_text.concurrent_batches,
+    )
 
     def resolved_strategy(self, model_config: LanguageModelConfig) -> dict:
         """Get the resolved text embedding strategy."""
@@ -61,4 +69,6 @@ class TextEmbeddingConfig(BaseModel):
             "num_threads": model_config.concurrent_requests,
             "batch_size": self.batch_size,
             "batch_max_completion_tokens": self.batch_max_completion_tokens,
+            "vector_cache": self.vector_cache,
+            "concurrent_batches": self.concurrent_batches,
         }
@@ -65,6 +65,13 @@ ALL_DETAILS = "all_details"
 TEXT = "text"
 N_TOKENS = "n_tokens"
 
+# text unit spans
+DOCUMENT_ID = "document_id"
+START_CHAR = "start_char"
+END_CHAR = "end_char"
+START_TOKEN = "start_token"  # noqa: S105
+END_TOKEN = "end_token"  # noqa: S105
+
 CREATION_DATE = "creation_date"
 METADATA = "metadata"
 
@@ -152,6 +159,15 @@ TEXT_UNITS_FINAL_COLUMNS = [
     COVARIATE_IDS,
 ]
 
+# optional columns of text units stored as spans of their document
+TEXT_UNITS_SPAN_COLUMNS = [
+    DOCUMENT_ID,
+    START_CHAR,
+    END_CHAR,
+    START_TOKEN,
+    END_TOKEN,
+]
+
 DOCUMENTS_FINAL_COLUMNS = [
     ID,
     SHORT_ID,
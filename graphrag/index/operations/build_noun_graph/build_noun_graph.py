@@ -4,15 +4,20 @@
 """Graph extraction using NLP."""
 
 import math
+from typing import Any
 
 import pandas as pd
 
 from graphrag.cache.noop_pipeline_cache import NoopPipelineCache
 from graphrag.cache.pipeline_cache import PipelineCache
 from graphrag.config.enums import AsyncType
+from graphrag.config.models.extract_graph_nlp_config import TextAnalyzerConfig
 from graphrag.index.operations.build_noun_graph.np_extractors.base import (
     BaseNounPhraseExtractor,
 )
+from graphrag.index.operations.build_noun_graph.np_extractors.factory import (
+    create_noun_phrase_extractor,
+)
 from graphrag.index.utils.derive_from_rows import derive_from_rows
 from graphrag.index.utils.hashing import gen_sha512_hash
 
@@ -23,11 +28,22 @@ async def build_noun_graph(
     normalize_edge_weights: bool,
     num_threads: int = 4,
     cache: PipelineCache | None = None,
+    async_mode: AsyncType = AsyncType.Threaded,
+    text_analyzer_config: TextAnalyzerConfig | None = None,
 ) -> tuple[pd.DataFrame, pd.DataFrame]:
-    """Build a noun graph from text units."""
+    """
+    Build a noun graph from text units.
+
+    The process async mode needs text_analyzer_config to build the analyzer in each worker.
+    """
     text_units = text_unit_df.loc[:, ["id", "text"]]
     nodes_df = await _extract_nodes(
-        text_units, text_analyzer, num_threads=num_threads, cache=cache
+        text_units,
+        text_analyzer,
+        num_threads=num_threads,
+        cache=cache,
+        async_mode=async_mode,
+        text_analyzer_config=text_analyzer_config,
     )
     edges_df = _extract_edges(nodes_df, normalize_edge_weights=normalize_edge_weights)
 
@@ -39,6 +55,8 @@ async def _extract_nodes(
     text_analyzer: BaseNounPhraseExtractor,
     num_threads: int = 4,
     cache: PipelineCache | None = None,
+    async_mode: AsyncType = AsyncType.Threaded,
+    text_analyzer_config: TextAnalyzerConfig | None = None,
 ) -> pd.DataFrame:
     """
     Extract initial nodes and edges from text units.
@@ -49,22 +67,30 @@ async def _extract_nodes(
     cache = cache or NoopPipelineCache()
     cache = cache.child("extract_noun_phrases")
 
-    async def extract(row):
-        text = row["text"]
-        attrs = {"text": text, "analyzer": str(text_analyzer)}
-        key = gen_sha512_hash(attrs, attrs.keys())
-        result = await cache.get(key)
-        if not result:
-            result = text_analyzer.extract(text)
-            await cache.set(key, result)
-        return result
-
-    text_unit_df["noun_phrases"] = await derive_from_rows(
-        text_unit_df,
-        extract,
-        num_threads=num_threads,
-        async_type=AsyncType.Threaded,
-    )
+    if async_mode == AsyncType.Process:
+        if text_analyzer_config is None:
+            msg = "The process async mode needs the text analyzer config to build the analyzer in each worker."
+            raise ValueError(msg)
+        text_unit_df["noun_phrases"] = await _extract_noun_phrases_in_processes(
+            text_unit_df, text_analyzer, text_analyzer_config, num_threads, cache
+        )
+    else:
+
+        async def extract(row):
+            text = row["text"]
+            key = _cache_key(text, text_analyzer)
+            result = await cache.get(key)
+            if not result:
+                result = text_analyzer.extract(text)
+                await cache.set(key, result)
+            return result
+
+        text_unit_df["noun_phrases"] = await derive_from_rows(
+            text_unit_df,
+            extract,
+            num_threads=num_threads,
+            async_type=async_mode,
+        )
 
     noun_node_df = text_unit_df.explode("noun_phrases")
     noun_node_df = noun_node_df.rename(
@@ -81,6 +107,55 @@ async def _extract_nodes(
     return grouped_node_df.loc[:, ["title", "frequency", "text_unit_ids"]]
 
 
+async def _extract_noun_phrases_in_processes(
+    text_unit_df: pd.DataFrame,
+    text_analyzer: BaseNounPhraseExtractor,
+    text_analyzer_config: TextAnalyzerConfig,
+    num_processes: int,
+    cache: PipelineCache,
+) -> list[list[str] | None]:
+    """Run the analyzer in worker processes, looking up and filling the cache from this process."""
+    keys = [_cache_key(text, text_analyzer) for text in text_unit_df["text"]]
+    noun_phrases = [await cache.get(key) for key in keys]
+    missing = [index for index, result in enumerate(noun_phrases) if not result]
+    if len(missing) == 0:
+        return noun_phrases
+
+    extracted = await derive_from_rows(
+        text_unit_df.iloc[missing],
+        _extract_noun_phrases,
+        num_threads=num_processes,
+        async_type=AsyncType.Process,
+        initializer=_init_worker,
+        initargs=(text_analyzer_config,),
+    )
+    for index, result in zip(missing, extracted, strict=True):
+        noun_phrases[index] = result
+        await cache.set(keys[index], result)
+    return noun_phrases
+
+
+_worker_analyzer: BaseNounPhraseExtractor | None = None
+
+
+def _init_worker(text_analyzer_config: TextAnalyzerConfig) -> None:
+    """Build the analyzer, and load its NLP model, once for the lifetime of a worker process."""
+    global _worker_analyzer
+    _worker_analyzer = create_noun_phrase_extractor(text_analyzer_config)
+
+
+def _extract_noun_phrases(row: dict[str, Any]) -> list[str]:
+    if _worker_analyzer is None:
+        msg = "The noun phrase extractor was not initialized in this worker process."
+        raise ValueError(msg)
+    return _worker_analyzer.extract(row["text"])
+
+
+def _cache_key(text: str, text_analyzer: BaseNounPhraseExtractor) -> str:
+    attrs = {"text": text, "analyzer": str(text_analyzer)}
+    return gen_sha512_hash(attrs, attrs.keys())
+
+
 def _extract_edges(
     nodes_df: pd.DataFrame,
     normalize_edge_weights: bool = True,
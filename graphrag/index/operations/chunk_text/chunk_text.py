@@ -1,17 +1,30 @@
 # Copyright (c) 2024 Microsoft Corporation.
 # Licensed under the MIT License
 
-"""A module containing _get_num_total, chunk, run_strategy and load_strategy methods definitions."""
+"""A module containing _get_num_total, chunk, chunk_text_groups, run_strategy and load_strategy methods definitions."""
 
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from itertools import pairwise
 from typing import Any, cast
 
+import numpy as np
 import pandas as pd
+import tiktoken
 
 from graphrag.callbacks.workflow_callbacks import WorkflowCallbacks
 from graphrag.config.models.chunking_config import ChunkingConfig, ChunkStrategyType
+from graphrag.data_model.schemas import (
+    DOCUMENT_ID,
+    END_CHAR,
+    END_TOKEN,
+    START_CHAR,
+    START_TOKEN,
+)
 from graphrag.index.operations.chunk_text.typing import (
     ChunkInput,
     ChunkStrategy,
+    TextChunk,
 )
 from graphrag.logger.progress import ProgressTicker, progress_ticker
 
@@ -53,6 +66,16 @@ def chunk_text(
     ```yaml
     strategy: sentence
     ```
+
+    ### content
+    This strategy chunks on token boundaries picked by a rolling hash of the content, so chunks are
+    at most `size` tokens and an edit only changes the chunks around it. The strategy config is as follows:
+
+    ```yaml
+    strategy: content
+    size: 1200 # Optional, The maximum chunk size to use, default: 1200
+    overlap: 100 # Optional, The chunk overlap to use, default: 100
+    ```
     """
     strategy_exec = load_strategy(strategy)
 
@@ -79,6 +102,171 @@ def chunk_text(
     )
 
 
+def chunk_text_groups(
+    groups: Sequence[Sequence[tuple[str, str]]],
+    sizes: Sequence[int],
+    overlap: int,
+    encoding_model: str,
+    strategy: ChunkStrategyType,
+    callbacks: WorkflowCallbacks,
+    spans: bool = False,
+    num_processes: int = 1,
+) -> pd.DataFrame:
+    """
+    Chunk several groups of (document_id, text) tuples, each with its own chunk size.
+
+    Chunks never span groups. Returns one row per chunk with the `group` index it belongs to, its
+    `document_ids`, `text` and `n_tokens`, in group order. The token and content strategies encode
+    the texts of all groups in one pass.
+
+    With `spans`, the token and content strategies also return the `document_id`, `start_char`,
+    `end_char`, `start_token` and `end_token` of each chunk that is an exact slice of one document,
+    and nulls for the other chunks.
+
+    With `num_processes` above 1, contiguous runs of groups are chunked in worker processes that
+    keep their encoder warm. Groups are chunked independently, so the output is the same as
+    chunking them in this process.
+    """
+    texts = [[text for _, text in group] for group in groups]
+    tick = progress_ticker(callbacks.progress, sum(len(group) for group in groups))
+    if num_processes > 1 and len(groups) > 1:
+        chunked = _chunk_groups_in_processes(
+            texts, sizes, overlap, encoding_model, strategy, spans, tick, num_processes
+        )
+    else:
+        chunked = _chunk_groups(
+            texts, sizes, overlap, encoding_model, strategy, spans, tick
+        )
+
+    group_index = []
+    document_ids = []
+    chunk_texts = []
+    n_tokens = []
+    span_chunks = []
+    for index, (group, chunks) in enumerate(zip(groups, chunked, strict=True)):
+        for chunk in chunks:
+            group_index.append(index)
+            document_ids.append([
+                group[doc_idx][0] for doc_idx in chunk.source_doc_indices
+            ])
+            chunk_texts.append(chunk.text_chunk)
+            n_tokens.append(chunk.n_tokens)
+            if spans:
+                span_chunks.append((group, chunk))
+    output = pd.DataFrame({
+        "group": group_index,
+        "document_ids": document_ids,
+        "text": chunk_texts,
+        "n_tokens": n_tokens,
+    })
+    if spans:
+        output[DOCUMENT_ID] = [
+            group[chunk.source_doc_indices[0]][0]
+            if chunk.start_char is not None
+            else None
+            for group, chunk in span_chunks
+        ]
+        for column in [START_CHAR, END_CHAR, START_TOKEN, END_TOKEN]:
+            output[column] = pd.array(
+                [getattr(chunk, column) for _, chunk in span_chunks], dtype="Int64"
+            )
+    return output
+
+
+def _chunk_groups(
+    texts: Sequence[list[str]],
+    sizes: Sequence[int],
+    overlap: int,
+    encoding_model: str,
+    strategy: ChunkStrategyType,
+    spans: bool,
+    tick: ProgressTicker,
+) -> list[list[TextChunk]]:
+    if strategy in (ChunkStrategyType.tokens, ChunkStrategyType.content):
+        from graphrag.index.operations.chunk_text.strategies import run_tokens_groups
+
+        config = ChunkingConfig(
+            size=max(sizes, default=1), overlap=overlap, encoding_model=encoding_model
+        )
+        return run_tokens_groups(
+            texts,
+            config,
+            tick,
+            sizes,
+            spans=spans,
+            content_defined=strategy == ChunkStrategyType.content,
+        )
+
+    strategy_exec = load_strategy(strategy)
+    return [
+        list(
+            strategy_exec(
+                group,
+                ChunkingConfig(
+                    size=size, overlap=overlap, encoding_model=encoding_model
+                ),
+                tick,
+            )
+        )
+        for group, size in zip(texts, sizes, strict=True)
+    ]
+
+
+def _chunk_groups_in_processes(
+    texts: Sequence[list[str]],
+    sizes: Sequence[int],
+    overlap: int,
+    encoding_model: str,
+    strategy: ChunkStrategyType,
+    spans: bool,
+    tick: ProgressTicker,
+    num_processes: int,
+) -> list[list[TextChunk]]:
+    partitions = _partition_groups(texts, num_processes * 4)
+    with ProcessPoolExecutor(
+        max_workers=num_processes,
+        initializer=_init_worker,
+        initargs=(encoding_model,),
+    ) as pool:
+        futures = [
+            pool.submit(
+                _chunk_groups,
+                texts[start:stop],
+                sizes[start:stop],
+                overlap,
+                encoding_model,
+                strategy,
+                spans,
+                # progress is reported here as partitions complete
+                ProgressTicker(None, 0),
+            )
+            for start, stop in partitions
+        ]
+        chunked = []
+        # collect in submission order, which keeps the groups in order
+        for (start, stop), future in zip(partitions, futures, strict=True):
+            chunked.extend(future.result())
+            tick(sum(len(group) for group in texts[start:stop]))
+    return chunked
+
+
+def _partition_groups(
+    texts: Sequence[list[str]], num_partitions: int
+) -> list[tuple[int, int]]:
+    """Split the groups into contiguous runs of about the same number of characters."""
+    lengths = np.cumsum([sum(len(f"{text}") for text in group) for group in texts])
+    bounds = np.searchsorted(
+        lengths, np.linspace(0, lengths[-1], num_partitions + 1)[1:-1], side="right"
+    )
+    edges = sorted({0, *bounds.tolist(), len(texts)})
+    return list(pairwise(edges))
+
+
+def _init_worker(encoding_model: str) -> None:
+    """Load the encoding once per worker process, tiktoken keeps it for later lookups."""
+    tiktoken.get_encoding(encoding_model)
+
+
 def run_strategy(
     strategy_exec: ChunkStrategy,
     input: ChunkInput,
@@ -118,6 +306,10 @@ def load_strategy(strategy: ChunkStrategyType) -> ChunkStrategy:
             from graphrag.index.operations.chunk_text.strategies import run_tokens
 
             return run_tokens
+        case ChunkStrategyType.content:
+            from graphrag.index.operations.chunk_text.strategies import run_content
+
+            return run_content
         case ChunkStrategyType.sentence:
             # NLTK
             from graphrag.index.operations.chunk_text.bootstrap import bootstrap
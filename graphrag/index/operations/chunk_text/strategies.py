@@ -3,7 +3,7 @@
 
 """A module containing chunk strategies."""
 
-from collections.abc import Iterable
+from collections.abc import Iterable, Sequence
 
 import nltk
 import tiktoken
@@ -13,6 +13,7 @@ from graphrag.index.operations.chunk_text.typing import TextChunk
 from graphrag.index.text_splitting.text_splitting import (
     Tokenizer,
     split_multiple_texts_on_tokens,
+    split_text_groups_on_tokens,
 )
 from graphrag.logger.progress import ProgressTicker
 
@@ -32,6 +33,28 @@ def get_encoding_fn(encoding_name):
     return encode, decode
 
 
+def get_batch_encoding_fn(encoding_name):
+    """Get a function that encodes batches of texts with the encoding model, using multiple threads."""
+    enc = tiktoken.get_encoding(encoding_name)
+
+    def encode_batch(texts: list[str]) -> list[list[int]]:
+        return enc.encode_batch([
+            text if isinstance(text, str) else f"{text}" for text in texts
+        ])
+
+    return encode_batch
+
+
+def get_token_offsets_fn(encoding_name):
+    """Get a function that returns the character offset of each token in the decoded text."""
+    enc = tiktoken.get_encoding(encoding_name)
+
+    def token_offsets(tokens: list[int]) -> list[int]:
+        return enc.decode_with_offsets(tokens)[1]
+
+    return token_offsets
+
+
 def run_tokens(
     input: list[str],
     config: ChunkingConfig,
@@ -43,6 +66,7 @@ def run_tokens(
     encoding_name = config.encoding_model
 
     encode, decode = get_encoding_fn(encoding_name)
+    encode_batch = get_batch_encoding_fn(encoding_name)
     return split_multiple_texts_on_tokens(
         input,
         Tokenizer(
@@ -50,8 +74,69 @@ def run_tokens(
             tokens_per_chunk=tokens_per_chunk,
             encode=encode,
             decode=decode,
+            encode_batch=encode_batch,
+        ),
+        tick,
+    )
+
+
+def run_content(
+    input: list[str],
+    config: ChunkingConfig,
+    tick: ProgressTicker,
+) -> Iterable[TextChunk]:
+    """Chunks text into chunks of up to `size` tokens whose boundaries are anchored on the content.
+
+    Boundaries follow a rolling hash of the tokens rather than fixed offsets, so an edit only
+    changes the chunks around it and the other chunks keep their text and ids.
+    """
+    encode, decode = get_encoding_fn(config.encoding_model)
+    encode_batch = get_batch_encoding_fn(config.encoding_model)
+    return split_multiple_texts_on_tokens(
+        input,
+        Tokenizer(
+            chunk_overlap=config.overlap,
+            tokens_per_chunk=config.size,
+            encode=encode,
+            decode=decode,
+            encode_batch=encode_batch,
+        ),
+        tick,
+        content_defined=True,
+    )
+
+
+def run_tokens_groups(
+    groups: Sequence[list[str]],
+    config: ChunkingConfig,
+    tick: ProgressTicker,
+    sizes: Sequence[int] | None = None,
+    spans: bool = False,
+    content_defined: bool = False,
+) -> list[list[TextChunk]]:
+    """Chunks several groups of texts based on encoding tokens, encoding all of them in one pass.
+
+    `sizes` optionally overrides the chunk size of each group. With `spans`, chunks that are a
+    slice of a single text record their character and token offsets in it. With
+    `content_defined`, chunk boundaries are picked by the content as in `run_content`.
+    """
+    encode, decode = get_encoding_fn(config.encoding_model)
+    encode_batch = get_batch_encoding_fn(config.encoding_model)
+    return split_text_groups_on_tokens(
+        groups,
+        Tokenizer(
+            chunk_overlap=config.overlap,
+            tokens_per_chunk=config.size,
+            encode=encode,
+            decode=decode,
+            encode_batch=encode_batch,
+            token_offsets=get_token_offsets_fn(config.encoding_model)
+            if spans
+            else None,
         ),
         tick,
+        tokens_per_chunk=sizes,
+        content_defined=content_defined,
     )
 
 
@@ -17,6 +17,14 @@ class TextChunk:
     text_chunk: str
     source_doc_indices: list[int]
     n_tokens: int | None = None
+    start_char: int | None = None
+    """Start of the chunk in its source text, set when the chunk is an exact slice of a single text."""
+    end_char: int | None = None
+    """End (exclusive) of the chunk in its source text."""
+    start_token: int | None = None
+    """Start of the chunk in the tokens of its source text."""
+    end_token: int | None = None
+    """End (exclusive) of the chunk in the tokens of its source text."""
 
 
 ChunkInput = str | list[str] | list[tuple[str, str]]
@@ -3,17 +3,18 @@
 
 """A module containing embed_text, load_strategy and create_row_from_embedding_data methods definition."""
 
+import asyncio
 import logging
 from enum import Enum
 from typing import Any
 
-import numpy as np
 import pandas as pd
 
 from graphrag.cache.pipeline_cache import PipelineCache
 from graphrag.callbacks.workflow_callbacks import WorkflowCallbacks
 from graphrag.config.embeddings import create_collection_name
 from graphrag.index.operations.embed_text.strategies.typing import TextEmbeddingStrategy
+from graphrag.index.utils.concurrency import create_limiter
 from graphrag.vector_stores.base import BaseVectorStore, VectorStoreDocument
 from graphrag.vector_stores.factory import VectorStoreFactory
 
@@ -164,23 +165,30 @@ async def _text_embed_with_vector_store(
         msg = f"Column {id_column} not found in input dataframe with columns {input.columns}"
         raise ValueError(msg)
 
-    total_rows = 0
-    for row in input[embed_column]:
-        if isinstance(row, list):
-            total_rows += len(row)
-        else:
-            total_rows += 1
-
-    i = 0
-    starting_index = 0
+    concurrent_batches: int = strategy_config.get("concurrent_batches") or 1
+    batch_starts = range(0, input.shape[0], insert_batch_size)
+    if concurrent_batches > 1:
+        return await _text_embed_pipelined(
+            callbacks=callbacks,
+            cache=cache,
+            embed_column=embed_column,
+            strategy_exec=strategy_exec,
+            strategy_config=strategy_config,
+            vector_store=vector_store,
+            batches=[
+                input.iloc[start : start + insert_batch_size] for start in batch_starts
+            ],
+            overwrite=overwrite,
+            title=title,
+            id_column=id_column,
+            concurrent_batches=concurrent_batches,
+        )
 
     all_results = []
 
-    while insert_batch_size * i < input.shape[0]:
-        batch = input.iloc[insert_batch_size * i : insert_batch_size * (i + 1)]
+    for i, start in enumerate(batch_starts):
+        batch = input.iloc[start : start + insert_batch_size]
         texts: list[str] = batch[embed_column].to_numpy().tolist()
-        titles: list[str] = batch[title].to_numpy().tolist()
-        ids: list[str] = batch[id_column].to_numpy().tolist()
         result = await strategy_exec(texts, callbacks, cache, strategy_config)
         if result.embeddings:
             embeddings = [
@@ -188,26 +196,110 @@ async def _text_embed_with_vector_store(
             ]
             all_results.extend(embeddings)
 
-        vectors = result.embeddings or []
-        documents: list[VectorStoreDocument] = []
-        for doc_id, doc_text, doc_title, doc_vector in zip(
-            ids, texts, titles, vectors, strict=True
-        ):
-            if type(doc_vector) is np.ndarray:
-                doc_vector = doc_vector.tolist()
-            document = VectorStoreDocument(
+        documents = _create_documents(
+            batch, embed_column, title, id_column, result.embeddings or []
+        )
+        await asyncio.to_thread(
+            vector_store.load_documents, documents, overwrite and i == 0
+        )
+
+    return all_results
+
+
+async def _text_embed_pipelined(
+    callbacks: WorkflowCallbacks,
+    cache: PipelineCache,
+    embed_column: str,
+    strategy_exec: TextEmbeddingStrategy,
+    strategy_config: dict[str, Any],
+    vector_store: BaseVectorStore,
+    batches: list[pd.DataFrame],
+    overwrite: bool,
+    title: str,
+    id_column: str,
+    concurrent_batches: int,
+):
+    """Embed up to `concurrent_batches` insert batches at a time while a writer task loads finished batches into the vector store.
+
+    The batches share one limiter on the model's concurrent requests, and the queue between the
+    embedding and writer tasks is bounded, so embedding cannot run far ahead of a slow vector
+    store. Writes run in a worker thread, one at a time.
+    """
+    num_threads = strategy_config.get("num_threads", 4)
+    strategy_config["limiter"] = create_limiter(
+        strategy_config.get("llm"), num_threads, callbacks, "embed_text"
+    ) or asyncio.Semaphore(num_threads)
+
+    batch_indices = iter(range(len(batches)))
+    batch_embeddings: list[list] = [[] for _ in batches]
+    queue: asyncio.Queue[list[VectorStoreDocument] | None] = asyncio.Queue(
+        maxsize=concurrent_batches
+    )
+
+    async def embed_batches() -> None:
+        for i in batch_indices:
+            batch = batches[i]
+            texts: list[str] = batch[embed_column].to_numpy().tolist()
+            result = await strategy_exec(texts, callbacks, cache, strategy_config)
+            batch_embeddings[i] = result.embeddings or []
+            await queue.put(
+                _create_documents(
+                    batch, embed_column, title, id_column, batch_embeddings[i]
+                )
+            )
+
+    async def embed() -> None:
+        await asyncio.gather(*(embed_batches() for _ in range(concurrent_batches)))
+        await queue.put(None)
+
+    async def write() -> None:
+        first = True
+        while (documents := await queue.get()) is not None:
+            await asyncio.to_thread(
+                vector_store.load_documents, documents, overwrite and first
+            )
+            first = False
+
+    tasks = [asyncio.create_task(embed()), asyncio.create_task(write())]
+    try:
+        await asyncio.gather(*tasks)
+    finally:
+        for task in tasks:
+            task.cancel()
+
+    return [
+        embedding
+        for embeddings in batch_embeddings
+        for embedding in embeddings
+        if embedding is not None
+    ]
+
+
+def _create_documents(
+    batch: pd.DataFrame,
+    embed_column: str,
+    title: str,
+    id_column: str,
+    vectors: list,
+) -> list[VectorStoreDocument]:
+    documents: list[VectorStoreDocument] = []
+    for doc_id, doc_text, doc_title, doc_vector in zip(
+        batch[id_column].to_numpy().tolist(),
+        batch[embed_column].to_numpy().tolist(),
+        batch[title].to_numpy().tolist(),
+        vectors,
+        strict=True,
+    ):
+        # vectors stay float32 arrays, the vector store packs them as they are
+        documents.append(
+            VectorStoreDocument(
                 id=doc_id,
                 text=doc_text,
                 vector=doc_vector,
                 attributes={"title": doc_title},
             )
-            documents.append(document)
-
-        vector_store.load_documents(documents, overwrite and i == 0)
-        starting_index += len(documents)
-        i += 1
-
-    return all_results
+        )
+    return documents
 
 
 def _create_vector_store(
@@ -256,7 +348,7 @@ def load_strategy(strategy: TextEmbedStrategyType) -> TextEmbeddingStrategy:
             )
 
             return run_gemini
-        
+
         case _:
             msg = f"Unknown strategy: {strategy}"
             raise ValueError(msg)
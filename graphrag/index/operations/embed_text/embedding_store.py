@@ -0,0 +1,148 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""A module containing the EmbeddingStore model, a content-addressed store of text embeddings."""
+
+import asyncio
+import hashlib
+import io
+import logging
+import re
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from graphrag.storage.pipeline_storage import PipelineStorage
+
+log = logging.getLogger(__name__)
+
+_HASH_SIZE = hashlib.sha256().digest_size
+
+
+class _ModelVectors:
+    """The stored embeddings of one model: a float32 matrix with a row per text hash."""
+
+    def __init__(self, hashes: list[bytes], vectors: np.ndarray):
+        self.rows = {text_hash: row for row, text_hash in enumerate(hashes)}
+        self.vectors = vectors
+        self.pending: list[np.ndarray] = []
+
+    def get(self, text_hash: bytes) -> np.ndarray | None:
+        row = self.rows.get(text_hash)
+        if row is None:
+            return None
+        if row < len(self.vectors):
+            return self.vectors[row]
+        return self.pending[row - len(self.vectors)]
+
+    def add(self, text_hash: bytes, vector: np.ndarray) -> None:
+        if text_hash in self.rows:
+            return
+        self.rows[text_hash] = len(self.vectors) + len(self.pending)
+        self.pending.append(vector)
+
+    def consolidate(self) -> None:
+        if self.pending:
+            pending = np.stack(self.pending)
+            self.vectors = (
+                np.concatenate([self.vectors, pending])
+                if len(self.vectors)
+                else pending
+            )
+            self.pending = []
+
+
+class EmbeddingStore:
+    """Embeddings keyed by (model, text hash), shared across embedding fields and runs.
+
+    Each model's embeddings are kept in one Parquet file of the backing storage, with a fixed-size
+    binary column of SHA-256 text hashes and a fixed-size float32 list column of vectors. Files are
+    read on first use and rewritten by `flush` when new embeddings were added. Without a storage,
+    the store only lives for the run.
+    """
+
+    def __init__(self, storage: PipelineStorage | None = None):
+        self._storage = storage
+        self._models: dict[str, _ModelVectors] = {}
+        self._lock = asyncio.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    async def missing(self, model: str, texts: list[str]) -> list[str]:
+        """Return the distinct texts that have no stored embedding for the model, in order."""
+        vectors = await self._load(model)
+        missing = {}
+        for text in texts:
+            if vectors.get(_hash(text)) is None:
+                missing[text] = None
+        self.hits += len(texts) - len(missing)
+        self.misses += len(missing)
+        return list(missing)
+
+    async def get(self, model: str, texts: list[str]) -> list[np.ndarray | None]:
+        """Return the stored embedding of each text, or None for texts without one."""
+        vectors = await self._load(model)
+        return [vectors.get(_hash(text)) for text in texts]
+
+    async def add(self, model: str, texts: list[str], embeddings: list) -> None:
+        """Store the embeddings of texts, as float32."""
+        vectors = await self._load(model)
+        for text, embedding in zip(texts, embeddings, strict=True):
+            vectors.add(_hash(text), np.asarray(embedding, dtype=np.float32))
+
+    async def flush(self) -> None:
+        """Write the embeddings of every model that gained new ones to the storage."""
+        for model, vectors in self._models.items():
+            if not vectors.pending:
+                continue
+            vectors.consolidate()
+            if self._storage is None:
+                continue
+            await self._storage.set(_key(model), _to_parquet(vectors))
+        log.info(
+            "embedding store: %d texts reused, %d embedded", self.hits, self.misses
+        )
+
+    async def _load(self, model: str) -> _ModelVectors:
+        async with self._lock:
+            if model not in self._models:
+                self._models[model] = await self._read(model)
+            return self._models[model]
+
+    async def _read(self, model: str) -> _ModelVectors:
+        if self._storage is None or not await self._storage.has(_key(model)):
+            return _ModelVectors([], np.empty((0, 0), dtype=np.float32))
+        data = await self._storage.get(_key(model), as_bytes=True)
+        table = pq.read_table(io.BytesIO(data))
+        vectors = table.column("vector").combine_chunks()
+        dimensions = vectors.type.list_size
+        return _ModelVectors(
+            table.column("hash").to_pylist(),
+            vectors.flatten().to_numpy(zero_copy_only=False).reshape(-1, dimensions),
+        )
+
+
+def _hash(text: str) -> bytes:
+    return hashlib.sha256(text.encode("utf-8")).digest()
+
+
+def _key(model: str) -> str:
+    name = re.sub(r"[^\w.-]", "_", model)
+    return f"{name}.parquet"
+
+
+def _to_parquet(vectors: _ModelVectors) -> bytes:
+    hashes = [b""] * len(vectors.rows)
+    for text_hash, row in vectors.rows.items():
+        hashes[row] = text_hash
+    dimensions = vectors.vectors.shape[1]
+    table = pa.table({
+        "hash": pa.array(hashes, type=pa.binary(_HASH_SIZE)),
+        "vector": pa.FixedSizeListArray.from_arrays(
+            pa.array(vectors.vectors.reshape(-1), type=pa.float32()), dimensions
+        ),
+    })
+    buffer = io.BytesIO()
+    pq.write_table(table, buffer)
+    return buffer.getvalue()
@@ -6,7 +6,8 @@
 import os
 import asyncio
 import logging
-from typing import Any
+from contextlib import AbstractAsyncContextManager
+from typing import TYPE_CHECKING, Any
 from time import sleep
 
 import numpy as np
@@ -16,6 +17,7 @@ from graphrag.callbacks.workflow_callbacks import WorkflowCallbacks
 from graphrag.config.models.language_model_config import LanguageModelConfig
 from graphrag.index.operations.embed_text.strategies.typing import TextEmbeddingResult
 from graphrag.index.text_splitting.text_splitting import TokenTextSplitter
+from graphrag.index.utils.concurrency import create_limiter
 from graphrag.index.utils.is_null import is_null
 from graphrag.language_model.manager import ModelManager
 from graphrag.language_model.protocol.base import EmbeddingModel
@@ -24,8 +26,13 @@ from graphrag.logger.progress import ProgressTicker, progress_ticker
 from google import genai
 import litellm
 
+if TYPE_CHECKING:
+    from graphrag.index.operations.embed_text.embedding_store import EmbeddingStore
+
 log = logging.getLogger(__name__)
 
+GEMINI_EMBEDDING_MODEL = "text-embedding-004"
+
 
 async def run(
     input: list[str],
@@ -43,12 +50,23 @@ async def run(
     llm_config = LanguageModelConfig(**args["llm"])
     splitter = _get_splitter(llm_config, batch_max_completion_tokens)
     model = genai.Client(api_key=os.getenv("GEMINI_API_KEY"))
-    semaphore: asyncio.Semaphore = asyncio.Semaphore(args.get("num_threads", 4))
+    num_threads = args.get("num_threads", 4)
+    # concurrent calls of the strategy share the limiter of the operation, if it passes one
+    semaphore = (
+        args.get("limiter")
+        or create_limiter(args["llm"], num_threads, callbacks, "embed_text")
+        or asyncio.Semaphore(num_threads)
+    )
 
     # Break up the input texts. The sizes here indicate how many snippets are in each input text
     texts, input_sizes = _prepare_embed_texts(input, splitter)
+    # only embed the snippets the embedding store has not seen yet
+    store: EmbeddingStore | None = args.get("embedding_store")
+    missing = (
+        texts if store is None else await store.missing(GEMINI_EMBEDDING_MODEL, texts)
+    )
     text_batches = _create_text_batches(
-        texts,
+        missing,
         batch_size,
         batch_max_completion_tokens,
         splitter,
@@ -65,6 +83,9 @@ async def run(
 
     # Embed each chunk of snippets
     embeddings = await _execute(model, text_batches, ticker, semaphore)
+    if store is not None:
+        await store.add(GEMINI_EMBEDDING_MODEL, missing, embeddings)
+        embeddings = await store.get(GEMINI_EMBEDDING_MODEL, texts)
     embeddings = _reconstitute_embeddings(embeddings, input_sizes)
 
     return TextEmbeddingResult(embeddings=embeddings)
@@ -83,22 +104,26 @@ async def _execute(
     model: genai.Client,
     chunks: list[list[str]],
     tick: ProgressTicker,
-    semaphore: asyncio.Semaphore,
-) -> list[list[float]]:
-    
-    results = []
-    for chunk in chunks:
-        chunk_embeddings = [
-            embedding.values
-            for embedding in model.models.embed_content(
-                model="text-embedding-004", contents=chunk
-            ).embeddings
-        ]
-        result = np.array(chunk_embeddings)
-        results.append(result)
-        tick(1)
-    
-    return [item for sublist in results for item in sublist]
+    semaphore: AbstractAsyncContextManager[Any],
+) -> np.ndarray:
+    def embed_content(chunk: list[str]) -> list:
+        return model.models.embed_content(
+            model=GEMINI_EMBEDDING_MODEL, contents=chunk
+        ).embeddings
+
+    async def embed(chunk: list[str]):
+        async with semaphore:
+            # the client is blocking, keep it off the event loop
+            embeddings = await asyncio.to_thread(embed_content, chunk)
+            result = np.asarray(
+                [embedding.values for embedding in embeddings], dtype=np.float32
+            )
+            tick(1)
+        return result
+
+    results = await asyncio.gather(*[embed(chunk) for chunk in chunks])
+    # merge results in a single float32 block (reduce the collect dimension)
+    return _stack(results)
 
 
 def _create_text_batches(
@@ -152,11 +177,18 @@ def _prepare_embed_texts(
     return snippets, sizes
 
 
+def _stack(blocks: list[np.ndarray]) -> np.ndarray:
+    """Concatenate embedding blocks into one contiguous float32 block."""
+    if not blocks:
+        return np.empty((0, 0), dtype=np.float32)
+    return np.concatenate(blocks)
+
+
 def _reconstitute_embeddings(
-    raw_embeddings: list[list[float]], sizes: list[int]
-) -> list[list[float] | None]:
-    """Reconstitute the embeddings into the original input texts."""
-    embeddings: list[list[float] | None] = []
+    raw_embeddings: np.ndarray | list[np.ndarray], sizes: list[int]
+) -> list[np.ndarray | None]:
+    """Reconstitute the embeddings into the original input texts, as float32 vectors."""
+    embeddings: list[np.ndarray | None] = []
     cursor = 0
     for size in sizes:
         if size == 0:
@@ -166,9 +198,9 @@ def _reconstitute_embeddings(
             embeddings.append(embedding)
             cursor += 1
         else:
-            chunk = raw_embeddings[cursor : cursor + size]
+            chunk = np.asarray(raw_embeddings[cursor : cursor + size])
             average = np.average(chunk, axis=0)
             normalized = average / np.linalg.norm(average)
-            embeddings.append(normalized.tolist())
+            embeddings.append(normalized.astype(np.float32))
             cursor += size
     return embeddings
@@ -5,7 +5,8 @@
 
 import asyncio
 import logging
-from typing import Any
+from contextlib import AbstractAsyncContextManager
+from typing import TYPE_CHECKING, Any
 
 import numpy as np
 
@@ -14,11 +15,15 @@ from graphrag.callbacks.workflow_callbacks import WorkflowCallbacks
 from graphrag.config.models.language_model_config import LanguageModelConfig
 from graphrag.index.operations.embed_text.strategies.typing import TextEmbeddingResult
 from graphrag.index.text_splitting.text_splitting import TokenTextSplitter
+from graphrag.index.utils.concurrency import create_limiter
 from graphrag.index.utils.is_null import is_null
 from graphrag.language_model.manager import ModelManager
 from graphrag.language_model.protocol.base import EmbeddingModel
 from graphrag.logger.progress import ProgressTicker, progress_ticker
 
+if TYPE_CHECKING:
+    from graphrag.index.operations.embed_text.embedding_store import EmbeddingStore
+
 log = logging.getLogger(__name__)
 
 
@@ -44,12 +49,21 @@ async def run(
         callbacks=callbacks,
         cache=cache,
     )
-    semaphore: asyncio.Semaphore = asyncio.Semaphore(args.get("num_threads", 4))
+    num_threads = args.get("num_threads", 4)
+    # concurrent calls of the strategy share the limiter of the operation, if it passes one
+    semaphore = (
+        args.get("limiter")
+        or create_limiter(args["llm"], num_threads, callbacks, "embed_text")
+        or asyncio.Semaphore(num_threads)
+    )
 
     # Break up the input texts. The sizes here indicate how many snippets are in each input text
     texts, input_sizes = _prepare_embed_texts(input, splitter)
+    # only embed the snippets the embedding store has not seen yet
+    store: EmbeddingStore | None = args.get("embedding_store")
+    missing = texts if store is None else await store.missing(llm_config.model, texts)
     text_batches = _create_text_batches(
-        texts,
+        missing,
         batch_size,
         batch_max_completion_tokens,
         splitter,
@@ -66,6 +80,9 @@ async def run(
 
     # Embed each chunk of snippets
     embeddings = await _execute(model, text_batches, ticker, semaphore)
+    if store is not None:
+        await store.add(llm_config.model, missing, embeddings)
+        embeddings = await store.get(llm_config.model, texts)
     embeddings = _reconstitute_embeddings(embeddings, input_sizes)
 
     return TextEmbeddingResult(embeddings=embeddings)
@@ -84,19 +101,19 @@ async def _execute(
     model: EmbeddingModel,
     chunks: list[list[str]],
     tick: ProgressTicker,
-    semaphore: asyncio.Semaphore,
-) -> list[list[float]]:
+    semaphore: AbstractAsyncContextManager[Any],
+) -> np.ndarray:
     async def embed(chunk: list[str]):
         async with semaphore:
             chunk_embeddings = await model.aembed_batch(chunk)
-            result = np.array(chunk_embeddings)
+            result = np.asarray(chunk_embeddings, dtype=np.float32)
             tick(1)
         return result
 
     futures = [embed(chunk) for chunk in chunks]
     results = await asyncio.gather(*futures)
-    # merge results in a single list of lists (reduce the collect dimension)
-    return [item for sublist in results for item in sublist]
+    # merge results in a single float32 block (reduce the collect dimension)
+    return _stack(results)
 
 
 def _create_text_batches(
@@ -150,11 +167,18 @@ def _prepare_embed_texts(
     return snippets, sizes
 
 
+def _stack(blocks: list[np.ndarray]) -> np.ndarray:
+    """Concatenate embedding blocks into one contiguous float32 block."""
+    if not blocks:
+        return np.empty((0, 0), dtype=np.float32)
+    return np.concatenate(blocks)
+
+
 def _reconstitute_embeddings(
-    raw_embeddings: list[list[float]], sizes: list[int]
-) -> list[list[float] | None]:
-    """Reconstitute the embeddings into the original input texts."""
-    embeddings: list[list[float] | None] = []
+    raw_embeddings: np.ndarray | list[np.ndarray], sizes: list[int]
+) -> list[np.ndarray | None]:
+    """Reconstitute the embeddings into the original input texts, as float32 vectors."""
+    embeddings: list[np.ndarray | None] = []
     cursor = 0
     for size in sizes:
         if size == 0:
@@ -164,9 +188,9 @@ def _reconstitute_embeddings(
             embeddings.append(embedding)
             cursor += 1
         else:
-            chunk = raw_embeddings[cursor : cursor + size]
+            chunk = np.asarray(raw_embeddings[cursor : cursor + size])
             average = np.average(chunk, axis=0)
             normalized = average / np.linalg.norm(average)
-            embeddings.append(normalized.tolist())
+            embeddings.append(normalized.astype(np.float32))
             cursor += size
     return embeddings
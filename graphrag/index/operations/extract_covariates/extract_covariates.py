@@ -20,7 +20,9 @@ from graphrag.index.operations.extract_covariates.typing import (
     Covariate,
     CovariateExtractionResult,
 )
+from graphrag.index.utils.concurrency import create_limiter
 from graphrag.index.utils.derive_from_rows import derive_from_rows
+from graphrag.index.utils.text_units import deduplicate_text
 from graphrag.language_model.manager import ModelManager
 
 log = logging.getLogger(__name__)
@@ -50,9 +52,12 @@ async def extract_covariates(
     strategy = strategy or {}
     strategy_config = {**strategy}
 
+    # byte-identical texts are extracted once and their claims copied to every row sharing them
+    unique_input, codes = deduplicate_text(input, column)
+
     # if max_retries is not set, inject a dynamically assigned value based on the total number of expected LLM calls to be made
     if strategy_config.get("llm") and strategy_config["llm"]["max_retries"] == -1:
-        strategy_config["llm"]["max_retries"] = len(input)
+        strategy_config["llm"]["max_retries"] = len(unique_input)
 
     async def run_strategy(row):
         text = row[column]
@@ -64,19 +69,24 @@ async def extract_covariates(
             cache=cache,
             strategy_config=strategy_config,
         )
-        return [
-            create_row_from_claim_data(row, item, covariate_type)
-            for item in result.covariate_data
-        ]
+        return result.covariate_data
 
     results = await derive_from_rows(
-        input,
+        unique_input,
         run_strategy,
         callbacks,
         async_type=async_mode,
         num_threads=num_threads,
+        limiter=create_limiter(
+            strategy_config.get("llm"), num_threads, callbacks, "extract_covariates"
+        ),
+        cost=unique_input.get("n_tokens"),
     )
-    return pd.DataFrame([item for row in results for item in row or []])
+    return pd.DataFrame([
+        create_row_from_claim_data(row, item, covariate_type)
+        for row, code in zip(input.to_dict("records"), codes, strict=True)
+        for item in results[code] or []
+    ])
 
 
 def create_row_from_claim_data(row, covariate_data: Covariate, covariate_type: str):
@@ -3,25 +3,42 @@
 
 """A module containing entity_extract methods."""
 
+import asyncio
 import logging
+import re
+from itertools import pairwise
 from typing import Any
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 
 from graphrag.cache.pipeline_cache import PipelineCache
 from graphrag.callbacks.workflow_callbacks import WorkflowCallbacks
+from graphrag.config.defaults import graphrag_config_defaults
 from graphrag.config.enums import AsyncType
+from graphrag.index.operations.extract_graph.gleaning import GleaningPolicy
+from graphrag.index.operations.extract_graph.records import ExtractionRecords
 from graphrag.index.operations.extract_graph.typing import (
     Document,
     EntityExtractStrategy,
     ExtractEntityStrategyType,
 )
+from graphrag.index.run.profiling import record_attribution_fallbacks
+from graphrag.index.utils.concurrency import create_limiter
 from graphrag.index.utils.derive_from_rows import derive_from_rows
+from graphrag.index.utils.text_units import deduplicate_text
+from graphrag.index.utils.tokens import num_tokens_from_string
+from graphrag.storage.pipeline_storage import PipelineStorage
+from graphrag.utils.storage import write_table_to_storage
 
 log = logging.getLogger(__name__)
 
 
 DEFAULT_ENTITY_TYPES = ["organization", "person", "geo", "event"]
+PACK_SEPARATOR = "\n\n"
+_ROW = "__row"
 
 
 async def extract_graph(
@@ -34,10 +51,15 @@ async def extract_graph(
     async_mode: AsyncType = AsyncType.AsyncIO,
     entity_types=DEFAULT_ENTITY_TYPES,
     num_threads: int = 4,
+    snapshot_storage: PipelineStorage | None = None,
+    snapshot_suffix: str = "",
 ) -> tuple[pd.DataFrame, pd.DataFrame]:
     """
     Extract entities from a piece of text.
 
+    With a `snapshot_storage`, the extracted records are also written there before they are merged,
+    as the `non_merged_entities` and `non_merged_relationships` tables (followed by `snapshot_suffix`).
+
     ## Usage
     ```yaml
     args:
@@ -68,6 +90,9 @@ async def extract_graph(
         completion_delimiter: "<|COMPLETE|>" # Optional, the delimiter to use for the LLM to mark completion
         tuple_delimiter: "<|>" # Optional, the delimiter to use for the LLM to mark a tuple
         record_delimiter: "##" # Optional, the delimiter to use for the LLM to mark a record
+        pack_tokens: 0 # Optional, pack consecutive text units into one request of up to this many tokens
+        max_gleanings: 1 # Optional, the maximum number of gleaning rounds per request
+        adaptive_gleaning: false # Optional, skip gleaning rounds that are unlikely to find more records
 
         encoding_name: cl100k_base # Optional, The encoding to use for the LLM with gleanings
 
@@ -93,51 +118,94 @@ async def extract_graph(
         strategy.get("type", ExtractEntityStrategyType.graph_intelligence)
     )
     strategy_config = {**strategy}
+    gleaning_policy = GleaningPolicy(
+        strategy_config.get(
+            "max_gleanings", graphrag_config_defaults.extract_graph.max_gleanings
+        ),
+        adaptive=strategy_config.get("adaptive_gleaning", False),
+    )
+    strategy_config["gleaning_policy"] = gleaning_policy
+
+    # byte-identical text units are extracted once and their records copied to every duplicate
+    unique_units, codes = deduplicate_text(text_units, text_column)
+    copies = _duplicate_ids(text_units[id_column], unique_units[id_column], codes)
+    if copies:
+        log.info(
+            "extracting %d distinct texts of %d text units",
+            len(unique_units),
+            len(text_units),
+        )
+
+    packs = _pack_text_units(
+        unique_units,
+        text_column,
+        id_column,
+        strategy_config.get("pack_tokens") or 0,
+        strategy_config.get("encoding_name"),
+    )
 
     # if max_retries is not set, inject a dynamically assigned value based on the total number of expected LLM calls to be made
     if strategy_config.get("llm") and strategy_config["llm"]["max_retries"] == -1:
-        strategy_config["llm"]["max_retries"] = len(text_units)
-
-    num_started = 0
-
-    async def run_strategy(row):
-        nonlocal num_started
-        text = row[text_column]
-        id = row[id_column]
+        strategy_config["llm"]["max_retries"] = len(packs)
+
+    async def run_strategy(row) -> ExtractionRecords:
+        docs = row["documents"]
+        if len(docs) > 1:
+            docs = [
+                Document(
+                    text=PACK_SEPARATOR.join(doc.text for doc in docs), id=docs[0].id
+                )
+            ]
         result = await strategy_exec(
-            [Document(text=text, id=id)],
-            entity_types,
-            callbacks,
-            cache,
-            strategy_config,
+            docs, entity_types, callbacks, cache, strategy_config
+        )
+        records = result.records or ExtractionRecords.from_dicts(
+            result.entities, pd.DataFrame(result.relationships).to_dict("records")
         )
-        num_started += 1
-        return [result.entities, result.relationships, result.graph]
+        if len(row["documents"]) > 1:
+            records = _attribute_records(records, row["documents"])
+        return records
 
     results = await derive_from_rows(
-        text_units,
+        packs,
         run_strategy,
         callbacks,
         async_type=async_mode,
         num_threads=num_threads,
+        limiter=create_limiter(
+            strategy_config.get("llm"), num_threads, callbacks, "extract_graph"
+        ),
+        cost=packs["n_tokens"],
     )
 
-    entity_dfs = []
-    relationship_dfs = []
+    gleaning_policy.log_stats("extract_graph")
+
+    records = ExtractionRecords()
     for result in results:
         if result:
-            entity_dfs.append(pd.DataFrame(result[0]))
-            relationship_dfs.append(pd.DataFrame(result[1]))
-
-    if entity_dfs:
-        entities_df = pd.concat(entity_dfs, ignore_index=True)
-        entities_df.to_parquet("output/non_merged_entities.parquet")
-    if relationship_dfs:
-        relationships_df = pd.concat(relationship_dfs, ignore_index=True)
-        relationships_df.to_parquet("output/non_merged_relationships.parquet")
-
-    entities = _merge_entities(entity_dfs)
-    relationships = _merge_relationships(relationship_dfs)
+            records.extend(result)
+    entities_df = _fan_out(records.entities(), copies)
+    relationships_df = _fan_out(records.relationships(), copies)
+
+    snapshots = []
+    if snapshot_storage is not None:
+        snapshots = [
+            write_table_to_storage(
+                entities_df, f"non_merged_entities{snapshot_suffix}", snapshot_storage
+            ),
+            write_table_to_storage(
+                relationships_df,
+                f"non_merged_relationships{snapshot_suffix}",
+                snapshot_storage,
+            ),
+        ]
+
+    # the Arrow merges release the GIL, so they run in threads alongside the snapshot writes
+    entities, relationships, *_ = await asyncio.gather(
+        asyncio.to_thread(_merge_entities, entities_df),
+        asyncio.to_thread(_merge_relationships, relationships_df),
+        *snapshots,
+    )
 
     return (entities, relationships)
 
@@ -157,27 +225,219 @@ def _load_strategy(strategy_type: ExtractEntityStrategyType) -> EntityExtractStr
             raise ValueError(msg)
 
 
-def _merge_entities(entity_dfs) -> pd.DataFrame:
-    all_entities = pd.concat(entity_dfs, ignore_index=True)
-    return (
-        all_entities.groupby(["title", "type"], sort=False)
-        .agg(
-            description=("description", list),
-            text_unit_ids=("source_id", list),
-            frequency=("source_id", "count"),
-        )
-        .reset_index()
+def _pack_text_units(
+    text_units: pd.DataFrame,
+    text_column: str,
+    id_column: str,
+    pack_tokens: int,
+    encoding_name: str | None,
+) -> pd.DataFrame:
+    """Group consecutive text units into packs of at most `pack_tokens` tokens, one extraction request each.
+
+    A text unit larger than the budget gets a pack of its own. With no budget every text unit is its own pack.
+    """
+    documents = [
+        Document(text=text, id=id)
+        for text, id in zip(text_units[text_column], text_units[id_column], strict=True)
+    ]
+    if "n_tokens" in text_units.columns:
+        n_tokens = text_units["n_tokens"].fillna(0).astype(int).tolist()
+    elif pack_tokens > 0:
+        n_tokens = [
+            num_tokens_from_string(doc.text, encoding_name=encoding_name)
+            for doc in documents
+        ]
+    else:
+        n_tokens = [0] * len(documents)
+
+    if pack_tokens <= 0:
+        return pd.DataFrame({
+            "documents": [[doc] for doc in documents],
+            "n_tokens": n_tokens,
+        })
+
+    packs: list[list[Document]] = []
+    pack_sizes: list[int] = []
+    for doc, size in zip(documents, n_tokens, strict=True):
+        if packs and pack_sizes[-1] + size <= pack_tokens:
+            packs[-1].append(doc)
+            pack_sizes[-1] += size
+        else:
+            packs.append([doc])
+            pack_sizes.append(size)
+    log.info(
+        "packed %d text units into %d extraction requests", len(documents), len(packs)
     )
+    return pd.DataFrame({"documents": packs, "n_tokens": pack_sizes})
 
 
-def _merge_relationships(relationship_dfs) -> pd.DataFrame:
-    all_relationships = pd.concat(relationship_dfs, ignore_index=False)
-    return (
-        all_relationships.groupby(["source", "target"], sort=False)
-        .agg(
-            description=("description", list),
-            text_unit_ids=("source_id", list),
-            weight=("weight", "sum"),
+def _attribute_records(
+    records: ExtractionRecords, docs: list[Document]
+) -> ExtractionRecords:
+    """Attribute the records extracted from a pack back to the text units it was built from.
+
+    The extraction output carries no source markers, so an entity is attributed to the text units
+    that mention its name as a whole word and a relationship to those mentioning both of its ends
+    (or else either). Only records mentioned nowhere fall back to every text unit of the pack; they
+    are counted in the workflow stats. A relationship found in several text units splits its weight
+    between them, so merged weights do not grow with packing.
+    """
+    texts = [doc.text.upper() for doc in docs]
+    everywhere = set(range(len(docs)))
+    patterns: dict[str, re.Pattern[str] | None] = {}
+    fallbacks = 0
+
+    def mentions(title: str) -> set[int]:
+        if title not in patterns:
+            name = title.rsplit("...", 1)[0].upper()
+            patterns[title] = (
+                re.compile(rf"(?<!\w){re.escape(name)}(?!\w)") if name else None
+            )
+        pattern = patterns[title]
+        if pattern is None:
+            return set()
+        return {index for index, text in enumerate(texts) if pattern.search(text)}
+
+    attributed = ExtractionRecords()
+    for title, entity_type, descriptions in zip(
+        records.entity_titles,
+        records.entity_types,
+        records.entity_descriptions,
+        strict=True,
+    ):
+        found = mentions(title)
+        if not found:
+            found = everywhere
+            fallbacks += 1
+        for index in sorted(found):
+            for description in descriptions or [""]:
+                attributed.add_entity(title, entity_type, description, docs[index].id)
+
+    for source, target, descriptions, weight in zip(
+        records.relationship_sources,
+        records.relationship_targets,
+        records.relationship_descriptions,
+        records.relationship_weights,
+        strict=True,
+    ):
+        source_mentions = mentions(source)
+        target_mentions = mentions(target)
+        found = (source_mentions & target_mentions) or (
+            source_mentions | target_mentions
         )
-        .reset_index()
+        if not found:
+            found = everywhere
+            fallbacks += 1
+        for index in sorted(found):
+            for position, description in enumerate(descriptions or [""]):
+                attributed.add_relationship(
+                    source,
+                    target,
+                    description,
+                    docs[index].id,
+                    weight / len(found) if position == 0 else 0.0,
+                    add_missing_ends=False,
+                )
+    record_attribution_fallbacks(fallbacks)
+    return attributed
+
+
+def _duplicate_ids(
+    ids: pd.Series, unique_ids: pd.Series, codes: np.ndarray
+) -> dict[str, list[str]]:
+    """Map the id of each extracted text unit with duplicates to the ids of all text units sharing its text."""
+    if len(unique_ids) == len(ids):
+        return {}
+    groups = ids.groupby(unique_ids.to_numpy()[codes], sort=False).agg(list)
+    return {id: group for id, group in groups.items() if len(group) > 1}
+
+
+def _fan_out(records: pd.DataFrame, copies: dict[str, list[str]]) -> pd.DataFrame:
+    """Repeat the records of each deduplicated text unit for every text unit sharing its text."""
+    if not copies or len(records) == 0:
+        return records
+    source_ids = records["source_id"].map(lambda id: copies.get(id, id))
+    return records.assign(source_id=source_ids).explode("source_id", ignore_index=True)
+
+
+def _merge_entities(all_entities: pd.DataFrame) -> pd.DataFrame:
+    return _aggregate(
+        all_entities,
+        ["title", "type"],
+        [
+            ("description", "list", "description"),
+            ("source_id", "list", "text_unit_ids"),
+            ("source_id", "count", "frequency"),
+        ],
+    )
+
+
+def _merge_relationships(all_relationships: pd.DataFrame) -> pd.DataFrame:
+    return _aggregate(
+        all_relationships,
+        ["source", "target"],
+        [
+            ("description", "list", "description"),
+            ("source_id", "list", "text_unit_ids"),
+            ("weight", "sum", "weight"),
+        ],
     )
+
+
+def _aggregate(
+    frame: pd.DataFrame, keys: list[str], aggregations: list[tuple[str, str, str]]
+) -> pd.DataFrame:
+    """Group the rows of a table by `keys` with an Arrow hash aggregation.
+
+    Each aggregation is a (column, function, output column) triple, where the function is an Arrow
+    hash aggregation such as "list", "count" or "sum". Groups come out in order of first appearance
+    and lists keep the row order, like `groupby(keys, sort=False)` in pandas. List columns are
+    aggregated as dictionary indices and decoded once, so repeated strings such as text unit ids
+    share a single Python object. Null values in list columns come out as None.
+    """
+    outputs = [output for _, _, output in aggregations]
+    if len(frame) == 0:
+        return pd.DataFrame(columns=[*keys, *outputs])
+
+    columns = {key: pa.array(frame[key], type=pa.string()) for key in keys}
+    dictionaries = {}
+    listed = {column for column, function, _ in aggregations if function == "list"}
+    for column in dict.fromkeys(column for column, _, _ in aggregations):
+        if column in listed:
+            encoded = pc.dictionary_encode(pa.array(frame[column], type=pa.string()))
+            dictionary = encoded.dictionary.to_numpy(zero_copy_only=False)
+            # null values point one past the dictionary, where they decode to None
+            columns[column] = pc.fill_null(encoded.indices, len(dictionary))
+            dictionaries[column] = np.append(dictionary, None)
+        else:
+            columns[column] = pa.array(frame[column])
+    columns[_ROW] = pa.array(np.arange(len(frame)))
+
+    grouped = (
+        pa.table(columns)
+        .group_by(keys, use_threads=False)
+        .aggregate([
+            *((column, function) for column, function, _ in aggregations),
+            (_ROW, "min"),
+        ])
+    )
+    grouped = grouped.take(pc.sort_indices(grouped[f"{_ROW}_min"]))
+
+    output = {key: grouped[key].to_pandas() for key in keys}
+    for column, function, name in aggregations:
+        values = grouped[f"{column}_{function}"]
+        output[name] = (
+            _to_lists(values, dictionaries[column])
+            if function == "list"
+            else values.to_numpy()
+        )
+    return pd.DataFrame(output, columns=[*keys, *outputs])
+
+
+def _to_lists(values: pa.ChunkedArray, dictionary: np.ndarray) -> list[list[Any]]:
+    """Decode a list array of dictionary indices into Python lists."""
+    lists = values.combine_chunks()
+    offsets = lists.offsets.to_numpy()
+    offsets = (offsets - offsets[0]).tolist()
+    flat = dictionary[lists.flatten().to_numpy()].tolist()
+    return [flat[start:end] for start, end in pairwise(offsets)]
@@ -0,0 +1,126 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""A module containing the GleaningPolicy model, which decides whether a text unit gets another gleaning round."""
+
+import logging
+import threading
+from dataclasses import asdict, dataclass
+
+from graphrag.index.run.profiling import record_gleaning
+
+log = logging.getLogger(__name__)
+
+
+@dataclass
+class GleaningStats:
+    """Gleaning decisions and yield of an extraction run."""
+
+    gleanings: int = 0
+    """Gleaning rounds sent."""
+
+    skipped: int = 0
+    """Gleaning rounds the policy decided against, up to `max_gleanings` per text unit."""
+
+    records: int = 0
+    """Entity and relationship records returned by the gleaning rounds."""
+
+    truncated: int = 0
+    """Responses that looked cut off by the completion token limit."""
+
+
+class GleaningPolicy:
+    """Decides per text unit whether another gleaning round is worth a sequential round trip.
+
+    Without `adaptive`, every text unit gets `max_gleanings` rounds. With it, a text unit gets another
+    round when its last response was cut off by the completion token limit. Otherwise a text unit is
+    skipped when one of these holds:
+    - its previous gleaning round found nothing
+    - its records are sparser than `min_density` per 1000 tokens, since a sparse text unit has
+      little left to find
+    - after `warmup` rounds, gleanings across the run have yielded fewer than `min_yield` records
+      each on average
+    One in every `explore_every` skipped decisions gleans anyway, so the historical yield keeps
+    being measured.
+
+    The policy is shared by every text unit of a run, so its state is guarded by a thread lock.
+    """
+
+    def __init__(
+        self,
+        max_gleanings: int,
+        adaptive: bool = False,
+        min_density: float = 2.0,
+        min_yield: float = 1.0,
+        warmup: int = 20,
+        explore_every: int = 10,
+    ):
+        self.max_gleanings = max_gleanings
+        self.adaptive = adaptive
+        self.min_density = min_density
+        self.min_yield = min_yield
+        self.warmup = warmup
+        self.explore_every = explore_every
+        self.stats = GleaningStats()
+        self._declined = 0
+        self._lock = threading.Lock()
+
+    def should_glean(
+        self,
+        gleaning: int,
+        text_tokens: int,
+        records: int,
+        last_yield: int | None,
+        truncated: bool,
+    ) -> bool:
+        """Decide whether to run gleaning round `gleaning` (0-based) for a text unit.
+
+        `records` counts the records extracted from the text unit so far, `last_yield` the records
+        returned by its previous gleaning round (None before the first one), and `truncated` whether
+        its last response hit the completion token limit.
+        """
+        if gleaning >= self.max_gleanings:
+            return False
+        with self._lock:
+            if truncated:
+                self.stats.truncated += 1
+            glean = (
+                not self.adaptive
+                or truncated
+                or self._worthwhile(text_tokens, records, last_yield)
+            )
+            if glean:
+                self.stats.gleanings += 1
+            else:
+                self.stats.skipped += self.max_gleanings - gleaning
+        record_gleaning(
+            gleanings=int(glean), skipped=0 if glean else self.max_gleanings - gleaning
+        )
+        return glean
+
+    def record_yield(self, records: int) -> None:
+        """Record the records returned by a gleaning round."""
+        with self._lock:
+            self.stats.records += records
+        record_gleaning(records=records)
+
+    def log_stats(self, name: str) -> None:
+        """Log the gleaning stats of the run."""
+        if self.max_gleanings > 0:
+            log.info("%s gleaning stats: %s", name, asdict(self.stats))
+
+    def _worthwhile(
+        self, text_tokens: int, records: int, last_yield: int | None
+    ) -> bool:
+        if last_yield == 0:
+            return False
+        sparse = records * 1000 < self.min_density * max(text_tokens, 1)
+        unproductive = (
+            self.stats.gleanings >= self.warmup
+            and self.stats.records < self.min_yield * self.stats.gleanings
+        )
+        if not (sparse or unproductive):
+            return True
+        # keep sampling the yield of skipped text units
+        self._declined += 1
+        return self._declined % self.explore_every == 0
@@ -15,6 +15,8 @@ import networkx as nx
 import tiktoken
 
 from graphrag.config.defaults import ENCODING_MODEL, graphrag_config_defaults
+from graphrag.index.operations.extract_graph.gleaning import GleaningPolicy
+from graphrag.index.operations.extract_graph.records import ExtractionRecords
 from graphrag.index.typing.error_handler import ErrorHandlerFn
 from graphrag.index.utils.string import clean_str
 from graphrag.language_model.protocol.base import ChatModel
@@ -40,7 +42,7 @@ log = logging.getLogger(__name__)
 class GraphExtractionResult:
     """Unipartite graph extraction result class definition."""
 
-    output: nx.Graph
+    output: ExtractionRecords
     source_docs: dict[Any, Any]
 
 
@@ -75,6 +77,8 @@ class GraphExtractor:
         encoding_model: str | None = None,
         max_gleanings: int | None = None,
         on_error: ErrorHandlerFn | None = None,
+        gleaning_policy: GleaningPolicy | None = None,
+        max_completion_tokens: int | None = None,
     ):
         """Init method definition."""
         # TODO: streamline construction
@@ -99,9 +103,12 @@ class GraphExtractor:
             else graphrag_config_defaults.extract_graph.max_gleanings
         )
         self._on_error = on_error or (lambda _e, _s, _d: None)
+        self._gleaning_policy = gleaning_policy or GleaningPolicy(self._max_gleanings)
+        self._max_completion_tokens = max_completion_tokens
 
         # Construct the looping arguments
         encoding = tiktoken.get_encoding(encoding_model or ENCODING_MODEL)
+        self._encoding = encoding
         yes = f"{encoding.encode('Y')[0]}"
         no = f"{encoding.encode('N')[0]}"
         self._loop_args = {"logit_bias": {yes: 100, no: 100}, "max_completion_tokens": 1}
@@ -251,12 +258,22 @@ class GraphExtractor:
             # json=True,
         )
         results = response.output.content.replace("```", "").replace("\"\"\"", "") or ""
-        results_entity = results.split("entities:")[1].split("relationships:")[0]
-        results_relationship = results.split("relationships:")[1]
+        results_entity, results_relationship = _split_sections(results)
 
-        # Repeat to ensure we maximize entity count
+        text_tokens = (
+            len(self._encoding.encode(text)) if self._gleaning_policy.adaptive else 0
+        )
+        records = _count_records(results_entity, results_relationship)
+        truncated = self._gleaning_policy.adaptive and self._is_truncated(results)
+        last_yield = None
+
+        # Repeat to ensure we maximize entity count, as long as the gleaning policy expects more records
         for i in range(self._max_gleanings):
-            
+            if not self._gleaning_policy.should_glean(
+                i, text_tokens, records, last_yield, truncated
+            ):
+                break
+
             new_response = await self._model.achat(
                 CONTINUE_PROMPT.format(
                     previous_entities_and_relationships=results,
@@ -268,14 +285,34 @@ class GraphExtractor:
             )
             
             new_results = new_response.output.content.replace("```", "").replace("\"\"\"", "") or ""
-            new_results_entity = new_results.split("entities:")[1].split("relationships:")[0]
-            new_results_relationship = new_results.split("relationships:")[1]
+            new_results_entity, new_results_relationship = _split_sections(new_results)
             
             results_entity += "\n" + new_results_entity
             results_relationship += "\n" + new_results_relationship
+
+            last_yield = _count_records(new_results_entity, new_results_relationship)
+            records += last_yield
+            truncated = self._gleaning_policy.adaptive and self._is_truncated(
+                new_results
+            )
+            self._gleaning_policy.record_yield(last_yield)
             
         return f"entities: \n{results_entity}\nrelationships: \n{results_relationship}"
 
+    def _is_truncated(self, content: str) -> bool:
+        """Check whether a plain-text response, with its code fences removed, looks cut off by the completion token limit."""
+        if "relationships:" not in content:
+            return True
+        relationship_str = content.split("relationships:")[-1]
+        if _count_lines(relationship_str) % 5:
+            # the last relationship is incomplete
+            return True
+        if self._max_completion_tokens is None:
+            return False
+        # a response within a few tokens of the limit most likely ran into it
+        return (
+            len(self._encoding.encode(content)) >= 0.95 * self._max_completion_tokens
+        )
 
     async def _process_results(
         self,
@@ -518,135 +555,80 @@ class GraphExtractor:
     async def _process_results_plain(
         self,
         results: dict[int, str],
-    ) -> nx.Graph:
-        """Parse the JSON result to create an undirected unipartite graph.
+    ) -> ExtractionRecords:
+        """Parse the plain-text results into columnar entity and relationship records.
 
         Args:
-            - results - dict of results from the extraction chain in JSON format
+            - results - dict of results from the extraction chain in plain-text format
         Returns:
-            - output - unipartite graph in graphML format
+            - output - the extracted records, with the document index as source id
         """
-        import json
-        
-        graph = nx.Graph()
-        
-        for source_doc_id, extracted_data in results.items():
-            # Parse the JSON data
-            # print("-"*20, extracted_data)
-            # data = json.loads(extracted_data)
-            data = extracted_data
-            
-            if "entities:" in data and "relationships:" in data:
-                data = data.replace("```", "").replace("\"\"\"", "")
-                entity_str = data.split("entities:")[1].split("relationships:")[0]
-                relationship_str = data.split("relationships:")[1]
-                entity_lines = [line.strip() for line in entity_str.split("\n") if line.strip()]
-                relationship_lines = [line.strip() for line in relationship_str.split("\n") if line.strip()]
-                
-                try:
-                    assert len(entity_lines) % 3 == 0, "Entity lines are not in multiples of 3"
-                    assert len(relationship_lines) % 5 == 0, "Relationship lines are not in multiples of 5"
-                except AssertionError as e:
-                    log.error(f"Error in parsing entity or relationship lines: {e}")
-                    continue
-                
-                # Process entities
-                for i in range(0, len(entity_lines), 3):
-                    entity_name = clean_str(entity_lines[i].upper())
-                    entity_type = clean_str(entity_lines[i + 1].upper())
-                    entity_description = clean_str(entity_lines[i + 2].upper())
-                    entity_identifier = f"{entity_name}...{entity_type}"
-                    
-                    if entity_identifier in graph.nodes():
-                        node = graph.nodes[entity_identifier]
-                        if self._join_descriptions:
-                            node["description"] = "\n".join(
-                                list({
-                                    *_unpack_descriptions(node),
-                                    entity_description,
-                                })
-                            )
-                        else:
-                            if len(entity_description) > len(node["description"]):
-                                node["description"] = entity_description
-                        node["source_id"] = ", ".join(
-                            list({
-                                *_unpack_source_ids(node),
-                                str(source_doc_id),
-                            })
-                        )
-                        node["type"] = (
-                            entity_type if entity_type != "" else node["type"]
-                        )
-                    else:
-                        graph.add_node(
-                            entity_identifier,
-                            type=entity_type,
-                            description=entity_description,
-                            source_id=str(source_doc_id),
-                        )
-            
-            # Process relationships
-                for i in range(0, len(relationship_lines), 5):
-                    source_name = clean_str(relationship_lines[i].upper())
-                    source_type = clean_str(relationship_lines[i + 1].upper())
-                    target_name = clean_str(relationship_lines[i + 2].upper())
-                    target_type = clean_str(relationship_lines[i + 3].upper())
-                    edge_description = clean_str(relationship_lines[i + 4].upper())
-                    
-                    source = f"{source_name}...{source_type}"
-                    target = f"{target_name}...{target_type}"
-                    edge_source_id = clean_str(str(source_doc_id))
-                    
-                    # Handle weight if present, default to 1.0
-                    weight = 1.0
-                    
-                    # Add source node if not exists
-                    if source not in graph.nodes():
-                        graph.add_node(
-                            source,
-                            type=source_type,
-                            description="",
-                            source_id=edge_source_id,
-                        )
-                    
-                    # Add target node if not exists
-                    if target not in graph.nodes():
-                        graph.add_node(
-                            target,
-                            type=target_type,
-                            description="",
-                            source_id=edge_source_id,
-                        )
-                    
-                    # Update existing edge or add new one
-                    if graph.has_edge(source, target):
-                        edge_data = graph.get_edge_data(source, target)
-                        if edge_data is not None:
-                            weight += edge_data["weight"]
-                            if self._join_descriptions:
-                                edge_description = "\n".join(
-                                    list({
-                                        *_unpack_descriptions(edge_data),
-                                        edge_description,
-                                    })
-                                )
-                            edge_source_id = ", ".join(
-                                list({
-                                    *_unpack_source_ids(edge_data),
-                                    str(source_doc_id),
-                                })
-                            )
-                    
-                    graph.add_edge(
-                        source,
-                        target,
-                        weight=weight,
-                        description=edge_description,
-                        source_id=edge_source_id,
-                    )
-        
-        return graph
+        records = ExtractionRecords()
+
+        for source_doc_id, data in results.items():
+            if "entities:" not in data or "relationships:" not in data:
+                continue
+            data = data.replace("```", "").replace('"""', "")
+            entity_str = data.split("entities:")[1].split("relationships:")[0]
+            relationship_str = data.split("relationships:")[1]
+            entity_lines = [
+                line.strip() for line in entity_str.split("\n") if line.strip()
+            ]
+            relationship_lines = [
+                line.strip() for line in relationship_str.split("\n") if line.strip()
+            ]
+            if len(entity_lines) % 3 or len(relationship_lines) % 5:
+                log.error(
+                    "Error in parsing entity or relationship lines: expected multiples of 3 and 5 lines, got %d and %d",
+                    len(entity_lines),
+                    len(relationship_lines),
+                )
+                continue
+
+            source_id = str(source_doc_id)
+            for i in range(0, len(entity_lines), 3):
+                entity_name = clean_str(entity_lines[i].upper())
+                entity_type = clean_str(entity_lines[i + 1].upper())
+                records.add_entity(
+                    f"{entity_name}...{entity_type}",
+                    entity_type,
+                    clean_str(entity_lines[i + 2].upper()),
+                    source_id,
+                )
+
+            for i in range(0, len(relationship_lines), 5):
+                source_type = clean_str(relationship_lines[i + 1].upper())
+                target_type = clean_str(relationship_lines[i + 3].upper())
+                records.add_relationship(
+                    f"{clean_str(relationship_lines[i].upper())}...{source_type}",
+                    f"{clean_str(relationship_lines[i + 2].upper())}...{target_type}",
+                    clean_str(relationship_lines[i + 4].upper()),
+                    source_id,
+                    source_type=source_type,
+                    target_type=target_type,
+                )
+
+        return records
+
+
+def _count_lines(value: str) -> int:
+    return sum(1 for line in value.split("\n") if line.strip())
+
+
+def _split_sections(content: str) -> tuple[str, str]:
+    """Split a plain-text response into its entities and relationships sections.
+
+    A section that is missing, e.g. because the response was cut off before it, is empty.
+    """
+    _, _, content = content.partition("entities:")
+    entity_str, _, relationship_str = content.partition("relationships:")
+    return entity_str, relationship_str
+
+
+def _count_records(entity_str: str, relationship_str: str) -> int:
+    """Count the records of a plain-text response, three lines per entity and five per relationship."""
+    return _count_lines(entity_str) // 3 + _count_lines(relationship_str) // 5
+
 
 def _unpack_descriptions(data: Mapping) -> list[str]:
     value = data.get("description", None)
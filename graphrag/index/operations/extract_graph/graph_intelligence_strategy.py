@@ -3,8 +3,6 @@
 
 """A module containing run_graph_intelligence,  run_extract_graph and _create_text_splitter methods to run graph intelligence."""
 
-import networkx as nx
-
 from graphrag.cache.pipeline_cache import PipelineCache
 from graphrag.callbacks.workflow_callbacks import WorkflowCallbacks
 from graphrag.config.defaults import graphrag_config_defaults
@@ -66,6 +64,8 @@ async def run_extract_graph(
         on_error=lambda e, s, d: (
             callbacks.error("Entity Extraction Error", e, s, d) if callbacks else None
         ),
+        gleaning_policy=args.get("gleaning_policy"),
+        max_completion_tokens=(args.get("llm") or {}).get("max_completion_tokens"),
     )
     text_list = [doc.text.strip() for doc in docs]
 
@@ -79,26 +79,8 @@ async def run_extract_graph(
         },
     )
 
-    graph = results.output
+    records = results.output
     # Map the "source_id" back to the "id" field
-    for _, node in graph.nodes(data=True):  # type: ignore
-        if node is not None:
-            node["source_id"] = ",".join(
-                docs[int(id)].id for id in node["source_id"].split(",")
-            )
-
-    for _, _, edge in graph.edges(data=True):  # type: ignore
-        if edge is not None:
-            edge["source_id"] = ",".join(
-                docs[int(id)].id for id in edge["source_id"].split(",")
-            )
-
-    entities = [
-        ({"title": item[0], **(item[1] or {})})
-        for item in graph.nodes(data=True)
-        if item is not None
-    ]
-
-    relationships = nx.to_pandas_edgelist(graph)
+    records.map_source_ids(lambda index: docs[int(index)].id)
 
-    return EntityExtractionResult(entities, relationships, graph)
+    return EntityExtractionResult([], [], None, records)
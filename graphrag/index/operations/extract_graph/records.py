@@ -0,0 +1,179 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""A module containing the ExtractionRecords model, a columnar buffer of extracted entities and relationships."""
+
+from collections.abc import Callable, Iterable
+from typing import Any
+
+import pandas as pd
+
+ENTITY_COLUMNS = ["title", "type", "description", "source_id"]
+RELATIONSHIP_COLUMNS = ["source", "target", "description", "source_id", "weight"]
+
+
+class ExtractionRecords:
+    """Entities and relationships extracted from text units, buffered column by column.
+
+    Records of the same entity (or of the same undirected relationship) from one source are merged
+    as they are added: descriptions are collected once each and relationship weights are summed.
+    Records from different sources are kept apart, to be merged across the run in a single pass.
+    """
+
+    def __init__(self) -> None:
+        self.entity_titles: list[str] = []
+        self.entity_types: list[str] = []
+        self.entity_descriptions: list[list[str]] = []
+        self.entity_source_ids: list[str] = []
+        self.relationship_sources: list[str] = []
+        self.relationship_targets: list[str] = []
+        self.relationship_descriptions: list[list[str]] = []
+        self.relationship_source_ids: list[str] = []
+        self.relationship_weights: list[float] = []
+        self._entity_rows: dict[tuple[str, str], int] = {}
+        self._relationship_rows: dict[tuple[str, frozenset[str]], int] = {}
+
+    @property
+    def num_entities(self) -> int:
+        """Return the number of buffered entity records."""
+        return len(self.entity_titles)
+
+    @property
+    def num_relationships(self) -> int:
+        """Return the number of buffered relationship records."""
+        return len(self.relationship_sources)
+
+    def add_entity(
+        self, title: str, entity_type: str, description: str, source_id: str
+    ) -> None:
+        """Add an entity record, merging it into an earlier record of the same entity from the same source."""
+        row = self._entity_rows.get((source_id, title))
+        if row is None:
+            self._entity_rows[source_id, title] = self.num_entities
+            self.entity_titles.append(title)
+            self.entity_types.append(entity_type)
+            self.entity_descriptions.append([description] if description else [])
+            self.entity_source_ids.append(source_id)
+            return
+        if description and description not in self.entity_descriptions[row]:
+            self.entity_descriptions[row].append(description)
+        if entity_type:
+            self.entity_types[row] = entity_type
+
+    def add_relationship(
+        self,
+        source: str,
+        target: str,
+        description: str,
+        source_id: str,
+        weight: float = 1.0,
+        source_type: str = "",
+        target_type: str = "",
+        add_missing_ends: bool = True,
+    ) -> None:
+        """Add a relationship record, merging it into an earlier record of the same relationship from the same source.
+
+        Relationships are undirected, so (a, b) and (b, a) are the same relationship. With
+        `add_missing_ends`, ends that are not entities of the source yet are added as entities
+        without a description.
+        """
+        if add_missing_ends:
+            for title, entity_type in ((source, source_type), (target, target_type)):
+                if (source_id, title) not in self._entity_rows:
+                    self.add_entity(title, entity_type, "", source_id)
+        key = (source_id, frozenset((source, target)))
+        row = self._relationship_rows.get(key)
+        if row is None:
+            self._relationship_rows[key] = self.num_relationships
+            self.relationship_sources.append(source)
+            self.relationship_targets.append(target)
+            self.relationship_descriptions.append([description] if description else [])
+            self.relationship_source_ids.append(source_id)
+            self.relationship_weights.append(weight)
+            return
+        if description and description not in self.relationship_descriptions[row]:
+            self.relationship_descriptions[row].append(description)
+        self.relationship_weights[row] += weight
+
+    def extend(self, other: "ExtractionRecords") -> None:
+        """Append the records of another buffer. Records are not merged across buffers."""
+        self.entity_titles.extend(other.entity_titles)
+        self.entity_types.extend(other.entity_types)
+        self.entity_descriptions.extend(other.entity_descriptions)
+        self.entity_source_ids.extend(other.entity_source_ids)
+        self.relationship_sources.extend(other.relationship_sources)
+        self.relationship_targets.extend(other.relationship_targets)
+        self.relationship_descriptions.extend(other.relationship_descriptions)
+        self.relationship_source_ids.extend(other.relationship_source_ids)
+        self.relationship_weights.extend(other.relationship_weights)
+
+    def map_source_ids(self, mapping: Callable[[str], str]) -> None:
+        """Replace the source ids of all records, e.g. document indices with document ids."""
+        self.entity_source_ids = [mapping(id) for id in self.entity_source_ids]
+        self.relationship_source_ids = [
+            mapping(id) for id in self.relationship_source_ids
+        ]
+        self._entity_rows = {
+            (mapping(source_id), title): row
+            for (source_id, title), row in self._entity_rows.items()
+        }
+        self._relationship_rows = {
+            (mapping(source_id), ends): row
+            for (source_id, ends), row in self._relationship_rows.items()
+        }
+
+    def entities(self) -> pd.DataFrame:
+        """Return the entity records as a table, with the descriptions of each record joined by newlines."""
+        return pd.DataFrame(
+            {
+                "title": self.entity_titles,
+                "type": self.entity_types,
+                "description": [
+                    "\n".join(descriptions) for descriptions in self.entity_descriptions
+                ],
+                "source_id": self.entity_source_ids,
+            },
+            columns=ENTITY_COLUMNS,
+        )
+
+    def relationships(self) -> pd.DataFrame:
+        """Return the relationship records as a table, with the descriptions of each record joined by newlines."""
+        return pd.DataFrame(
+            {
+                "source": self.relationship_sources,
+                "target": self.relationship_targets,
+                "description": [
+                    "\n".join(descriptions)
+                    for descriptions in self.relationship_descriptions
+                ],
+                "source_id": self.relationship_source_ids,
+                "weight": pd.Series(self.relationship_weights, dtype="float64"),
+            },
+            columns=RELATIONSHIP_COLUMNS,
+        )
+
+    @classmethod
+    def from_dicts(
+        cls,
+        entities: Iterable[dict[str, Any]],
+        relationships: Iterable[dict[str, Any]],
+    ) -> "ExtractionRecords":
+        """Buffer entities and relationships given as dicts, as produced by custom strategies."""
+        records = cls()
+        for entity in entities:
+            records.add_entity(
+                entity["title"],
+                entity.get("type") or "",
+                entity.get("description") or "",
+                str(entity["source_id"]),
+            )
+        for relationship in relationships:
+            records.add_relationship(
+                relationship["source"],
+                relationship["target"],
+                relationship.get("description") or "",
+                str(relationship["source_id"]),
+                float(relationship.get("weight", 1.0)),
+                add_missing_ends=False,
+            )
+        return records
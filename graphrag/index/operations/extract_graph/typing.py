@@ -12,6 +12,7 @@ import networkx as nx
 
 from graphrag.cache.pipeline_cache import PipelineCache
 from graphrag.callbacks.workflow_callbacks import WorkflowCallbacks
+from graphrag.index.operations.extract_graph.records import ExtractionRecords
 
 ExtractedEntity = dict[str, Any]
 ExtractedRelationship = dict[str, Any]
@@ -34,6 +35,8 @@ class EntityExtractionResult:
     entities: list[ExtractedEntity]
     relationships: list[ExtractedRelationship]
     graph: nx.Graph | None
+    records: ExtractionRecords | None = None
+    """Columnar records of the extraction. Strategies that fill them leave `entities` and `relationships` empty."""
 
 
 EntityExtractStrategy = Callable[
@@ -21,6 +21,7 @@ from graphrag.index.operations.summarize_communities.typing import (
 from graphrag.index.operations.summarize_communities.utils import (
     get_levels,
 )
+from graphrag.index.utils.concurrency import create_limiter
 from graphrag.index.utils.derive_from_rows import derive_from_rows
 from graphrag.logger.progress import progress_ticker
 
@@ -56,6 +57,10 @@ async def summarize_communities(
     ).dropna()
 
     levels = get_levels(nodes)
+    # shared by all levels, so later levels start from the limit learned on earlier ones
+    limiter = create_limiter(
+        strategy_config.get("llm"), num_threads, callbacks, "summarize_communities"
+    )
 
     level_contexts = []
     for level in levels:
@@ -89,6 +94,7 @@ async def summarize_communities(
             callbacks=NoopWorkflowCallbacks(),
             num_threads=num_threads,
             async_type=async_mode,
+            limiter=limiter,
         )
         reports.extend([lr for lr in local_reports if lr is not None])
 
@@ -3,10 +3,12 @@
 
 """A module containing 'GraphExtractionResult' and 'GraphExtractor' models."""
 
+import asyncio
 import json
 from dataclasses import dataclass
 
 from graphrag.index.typing.error_handler import ErrorHandlerFn
+from graphrag.index.utils.concurrency import AdaptiveLimiter
 from graphrag.index.utils.tokens import num_tokens_from_string
 from graphrag.language_model.protocol.base import ChatModel
 from graphrag.prompts.index.summarize_descriptions import SUMMARIZE_PROMPT
@@ -17,7 +19,6 @@ DEFAULT_MAX_INPUT_TOKENS = 4_000
 DEFAULT_MAX_SUMMARY_LENGTH = 500
 
 
-
 @dataclass
 class SummarizationResult:
     """Unipartite graph extraction result class definition."""
@@ -36,6 +37,8 @@ class SummarizeExtractor:
     _on_error: ErrorHandlerFn
     _max_summary_length: int
     _max_input_tokens: int
+    _tree_reduce: bool
+    _limiter: asyncio.Semaphore | AdaptiveLimiter
 
     def __init__(
         self,
@@ -46,6 +49,8 @@ class SummarizeExtractor:
         on_error: ErrorHandlerFn | None = None,
         max_summary_length: int | None = None,
         max_input_tokens: int | None = None,
+        tree_reduce: bool = False,
+        limiter: asyncio.Semaphore | AdaptiveLimiter | None = None,
     ):
         """Init method definition."""
         # TODO: streamline construction
@@ -57,6 +62,9 @@ class SummarizeExtractor:
         self._on_error = on_error or (lambda _e, _s, _d: None)
         self._max_summary_length = max_summary_length or DEFAULT_MAX_SUMMARY_LENGTH
         self._max_input_tokens = max_input_tokens or DEFAULT_MAX_INPUT_TOKENS
+        self._tree_reduce = tree_reduce
+        # without a limiter of the caller, the tree is summarized one request at a time
+        self._limiter = limiter or asyncio.Semaphore(1)
 
     async def __call__(
         self,
@@ -91,6 +99,9 @@ class SummarizeExtractor:
         if len(descriptions) > 1:
             descriptions = sorted(descriptions)
 
+        if self._tree_reduce:
+            return await self._reduce_descriptions(sorted_id, descriptions)
+
         # Iterate over descriptions, adding all until the max input tokens is reached
         usable_tokens = self._max_input_tokens - num_tokens_from_string(
             self._summarization_prompt
@@ -122,6 +133,33 @@ class SummarizeExtractor:
 
         return result
 
+    async def _reduce_descriptions(
+        self, id: str | tuple[str, str], descriptions: list[str]
+    ) -> str:
+        """Summarize descriptions as a tree: token-bounded shards are summarized concurrently, then their summaries in turn, until they fit a single request.
+
+        Every request takes a slot of the limiter, so the fan-out of a level is bounded by the
+        concurrency of the operation rather than by the number of shards.
+        """
+        usable_tokens = self._max_input_tokens - num_tokens_from_string(
+            self._summarization_prompt
+        )
+        while True:
+            shards = _shard_descriptions(descriptions, usable_tokens)
+            if len(shards) == 1:
+                return await self._summarize_shard(id, shards[0])
+            descriptions = await asyncio.gather(
+                *(self._summarize_shard(id, shard) for shard in shards)
+            )
+
+    async def _summarize_shard(
+        self, id: str | tuple[str, str], descriptions: list[str]
+    ) -> str:
+        if len(descriptions) == 1:
+            return descriptions[0]
+        async with self._limiter:
+            return await self._summarize_descriptions_with_llm(id, descriptions)
+
     async def _summarize_descriptions_with_llm(
         self, id: str | tuple[str, str] | list[str], descriptions: list[str]
     ):
@@ -138,3 +176,25 @@ class SummarizeExtractor:
         )
         # Calculate result
         return str(response.output.content)
+
+
+def _shard_descriptions(descriptions: list[str], max_tokens: int) -> list[list[str]]:
+    """Split descriptions into consecutive shards of at most `max_tokens` tokens.
+
+    A shard always takes a second description, even past the budget, so every level of the tree
+    has fewer summaries than the level below it.
+    """
+    shards: list[list[str]] = []
+    shard: list[str] = []
+    shard_tokens = 0
+    for description in descriptions:
+        tokens = num_tokens_from_string(description)
+        if len(shard) > 1 and shard_tokens + tokens > max_tokens:
+            shards.append(shard)
+            shard = []
+            shard_tokens = 0
+        shard.append(description)
+        shard_tokens += tokens
+    if shard:
+        shards.append(shard)
+    return shards
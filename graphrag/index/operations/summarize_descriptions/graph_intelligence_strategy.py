@@ -63,6 +63,8 @@ async def run_summarize_descriptions(
         ),
         max_summary_length=args.get("max_summary_length", None),
         max_input_tokens=max_completion_tokens,
+        tree_reduce=args.get("tree_reduce", False),
+        limiter=args.get("limiter"),
     )
 
     result = await extractor(id=id, descriptions=descriptions)
@@ -5,17 +5,25 @@
 
 import asyncio
 import logging
+from contextlib import nullcontext
 from typing import Any
 
+import numpy as np
 import pandas as pd
+import tiktoken
 
+import graphrag.config.defaults as defs
 from graphrag.cache.pipeline_cache import PipelineCache
 from graphrag.callbacks.workflow_callbacks import WorkflowCallbacks
+from graphrag.index.operations.summarize_descriptions.description_summary_extractor import (
+    DEFAULT_MAX_SUMMARY_LENGTH,
+)
 from graphrag.index.operations.summarize_descriptions.typing import (
     SummarizationStrategy,
     SummarizeStrategyType,
 )
-from graphrag.logger.progress import ProgressTicker, progress_ticker
+from graphrag.index.utils.concurrency import create_limiter
+from graphrag.logger.progress import progress_ticker
 
 log = logging.getLogger(__name__)
 
@@ -80,74 +88,108 @@ async def summarize_descriptions(
     if strategy_config.get("llm") and strategy_config["llm"]["max_retries"] == -1:
         strategy_config["llm"]["max_retries"] = len(entities_df) + len(relationships_df)
 
-    async def get_summarized(
-        nodes: pd.DataFrame, edges: pd.DataFrame, semaphore: asyncio.Semaphore
-    ):
-        ticker_length = len(nodes) + len(edges)
-
-        ticker = progress_ticker(callbacks.progress, ticker_length)
-
-        node_futures = [
-            do_summarize_descriptions(
-                str(row.title),  # type: ignore
-                sorted(set(row.description)),  # type: ignore
-                ticker,
-                semaphore,
-            )
-            for row in nodes.itertuples(index=False)
-        ]
-
-        node_results = await asyncio.gather(*node_futures)
-
-        node_descriptions = [
-            {
-                "title": result.id,
-                "description": result.description,
-            }
-            for result in node_results
-        ]
-
-        edge_futures = [
-            do_summarize_descriptions(
-                (str(row.source), str(row.target)),  # type: ignore
-                sorted(set(row.description)),  # type: ignore
-                ticker,
-                semaphore,
-            )
-            for row in edges.itertuples(index=False)
-        ]
-
-        edge_results = await asyncio.gather(*edge_futures)
-
-        edge_descriptions = [
-            {
-                "source": result.id[0],
-                "target": result.id[1],
-                "description": result.description,
-            }
-            for result in edge_results
-        ]
-
-        entity_descriptions = pd.DataFrame(node_descriptions)
-        relationship_descriptions = pd.DataFrame(edge_descriptions)
-        return entity_descriptions, relationship_descriptions
-
-    async def do_summarize_descriptions(
-        id: str | tuple[str, str],
-        descriptions: list[str],
-        ticker: ProgressTicker,
-        semaphore: asyncio.Semaphore,
-    ):
-        async with semaphore:
-            results = await strategy_exec(
-                id, descriptions, callbacks, cache, strategy_config
+    max_summary_length = (
+        strategy_config.get("max_summary_length") or DEFAULT_MAX_SUMMARY_LENGTH
+    )
+    skip_within_length = strategy_config.get("skip_within_length", False)
+    encoding_name = (strategy_config.get("llm") or {}).get(
+        "encoding_model"
+    ) or defs.ENCODING_MODEL
+
+    # one work queue for entities and relationships, largest description volume first, so the
+    # longest summaries start early instead of stretching the tail of the run
+    entity_descriptions = _distinct_descriptions(entities_df)
+    relationship_descriptions = _distinct_descriptions(relationships_df)
+    ids: list[str | tuple[str, str]] = [
+        *map(str, entities_df["title"]),
+        *zip(
+            map(str, relationships_df["source"]),
+            map(str, relationships_df["target"]),
+            strict=True,
+        ),
+    ]
+    descriptions = entity_descriptions + relationship_descriptions
+    volumes = _token_volumes(descriptions, encoding_name)
+    summaries: list[str] = [""] * len(descriptions)
+
+    ticker = progress_ticker(callbacks.progress, len(descriptions))
+    semaphore = create_limiter(
+        strategy_config.get("llm"), num_threads, callbacks, "summarize_descriptions"
+    ) or asyncio.Semaphore(num_threads)
+
+    # a tree reduction takes a slot per model request instead of one for the whole list, which
+    # bounds its fan-out by the concurrency of the operation
+    tree_reduce = strategy_config.get("tree_reduce", False)
+    if tree_reduce:
+        strategy_config["limiter"] = semaphore
+
+    async def summarize(position: int) -> None:
+        async with nullcontext() if tree_reduce else semaphore:
+            result = await strategy_exec(
+                ids[position], descriptions[position], callbacks, cache, strategy_config
             )
+        summaries[position] = result.description
+        ticker(1)
+
+    queue = []
+    for position in np.argsort(-volumes, kind="stable").tolist():
+        description_list = descriptions[position]
+        if len(description_list) <= 1:
+            summaries[position] = description_list[0] if description_list else ""
             ticker(1)
-        return results
-
-    semaphore = asyncio.Semaphore(num_threads)
-
-    return await get_summarized(entities_df, relationships_df, semaphore)
+        elif skip_within_length and volumes[position] <= max_summary_length:
+            summaries[position] = "\n".join(description_list)
+            ticker(1)
+        else:
+            queue.append(summarize(position))
+    log.info(
+        "summarize_descriptions: %d of %d description lists sent for summarization",
+        len(queue),
+        len(descriptions),
+    )
+    await asyncio.gather(*queue)
+
+    num_entities = len(entity_descriptions)
+    entity_summaries = pd.DataFrame({
+        "title": ids[:num_entities],
+        "description": summaries[:num_entities],
+    })
+    relationship_summaries = pd.DataFrame({
+        "source": [source for source, _ in ids[num_entities:]],
+        "target": [target for _, target in ids[num_entities:]],
+        "description": summaries[num_entities:],
+    })
+    return entity_summaries, relationship_summaries
+
+
+def _distinct_descriptions(frame: pd.DataFrame) -> list[list[str]]:
+    """Return the distinct descriptions of each row in sorted order."""
+    return [sorted(set(descriptions)) for descriptions in frame["description"]]
+
+
+def _token_volumes(descriptions: list[list[str]], encoding_name: str) -> np.ndarray:
+    """Count the tokens of each description list, encoding every distinct description once."""
+    distinct = list({
+        description
+        for description_list in descriptions
+        for description in description_list
+    })
+    encoding = tiktoken.get_encoding(encoding_name)
+    tokens = dict(
+        zip(
+            distinct,
+            map(len, encoding.encode_ordinary_batch(distinct)),
+            strict=True,
+        )
+    )
+    return np.fromiter(
+        (
+            sum(tokens[description] for description in description_list)
+            for description_list in descriptions
+        ),
+        dtype=np.int64,
+        count=len(descriptions),
+    )
 
 
 def load_strategy(strategy_type: SummarizeStrategyType) -> SummarizationStrategy:
@@ -0,0 +1,250 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Workflow checkpoints, used to resume an interrupted pipeline run."""
+
+import hashlib
+import json
+import logging
+from pathlib import Path
+from typing import Any
+
+from graphrag.config.models.graph_rag_config import GraphRagConfig
+from graphrag.index.run.table_registry import TableRegistry
+from graphrag.index.typing.state import PipelineState
+from graphrag.index.typing.workflow import WorkflowDependencies
+from graphrag.storage.pipeline_storage import PipelineStorage
+
+log = logging.getLogger(__name__)
+
+CHECKPOINTS_STATE_KEY = "checkpoints"
+
+# model settings that tune throughput but do not change what the model returns
+_VOLATILE_MODEL_FIELDS = {
+    "api_key",
+    "async_mode",
+    "concurrent_requests",
+    "max_retries",
+    "max_retry_wait",
+    "proxy",
+    "request_timeout",
+    "requests_per_minute",
+    "retry_strategy",
+    "tokens_per_minute",
+}
+
+
+class PipelineCheckpoints:
+    """Records a completion fingerprint per workflow and decides which workflows can be skipped on resume.
+
+    A workflow fingerprint is built from the hashes of its input tables and its slice of the config.
+    Tables that are rewritten in place by a later workflow (e.g. entities in finalize_graph) are
+    preserved under a content-addressed key before being overwritten, so skipped workflows can hand
+    the exact version they produced to any workflow that has to run again. The preserved copies
+    only serve to resume an interrupted run and are deleted once a run completes.
+
+    Table hashes are taken from the bytes the pipeline wrote where it passes them to `record`, and
+    only read back from storage for tables of unknown origin. Tables of the `tables` registry that
+    are still being persisted are flushed before their stored version is read or replaced.
+    """
+
+    def __init__(
+        self,
+        config: GraphRagConfig,
+        storage: PipelineStorage,
+        state: PipelineState,
+        tables: TableRegistry | None = None,
+    ):
+        self._config = config
+        self._storage = storage
+        self._tables = tables
+        self._checkpoints = state.setdefault(
+            CHECKPOINTS_STATE_KEY, {"workflows": {}, "snapshots": []}
+        )
+        # the table versions the pipeline expects at the current step
+        self._expected: dict[str, str | None] = {}
+        # the table versions known to be in storage right now
+        self._stored: dict[str, str | None] = {}
+
+    @property
+    def _records(self) -> dict[str, dict[str, Any]]:
+        return self._checkpoints["workflows"]
+
+    async def write_table(self, name: str, data: bytes) -> None:
+        """Write a table produced outside of any workflow, preserving the version it replaces."""
+        await self._preserve(name)
+        await self._storage.set(f"{name}.parquet", data)
+        digest = _hash_bytes(data)
+        self._stored[name] = digest
+        self._expected[name] = digest
+
+    async def fingerprint(
+        self, name: str, dependencies: WorkflowDependencies
+    ) -> tuple[str, dict[str, str | None]]:
+        """Compute the fingerprint of a workflow given the inputs it would read now."""
+        inputs = {
+            table: await self._expected_hash(table) for table in dependencies.inputs
+        }
+        payload = json.dumps(
+            {
+                "workflow": name,
+                "inputs": inputs,
+                "config": _config_slice(self._config, dependencies.config),
+            },
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest(), inputs
+
+    async def try_skip(
+        self, name: str, dependencies: WorkflowDependencies, fingerprint: str
+    ) -> bool:
+        """Skip the workflow if its recorded fingerprint matches and the versions of its outputs are still available.
+
+        An output is available if it is stored as recorded or was preserved before being rewritten.
+        """
+        record = self._records.get(name)
+        if record is None or record["fingerprint"] != fingerprint:
+            return False
+        for table in dependencies.outputs:
+            digest = record["outputs"].get(table)
+            if digest is None:
+                return False
+            if await self._stored_hash(table) != digest and not await self._storage.has(
+                _snapshot_key(table, digest)
+            ):
+                return False
+        self._expected.update(record["outputs"])
+        return True
+
+    async def prepare(self, dependencies: WorkflowDependencies) -> list[str]:
+        """Make storage match the inputs the workflow expects and preserve the tables it will overwrite.
+
+        Returns the tables that were restored from a checkpoint.
+        """
+        restored = [
+            table for table in dependencies.inputs if await self._restore(table)
+        ]
+        for table in dependencies.outputs:
+            await self._preserve(table)
+        return restored
+
+    async def record(
+        self,
+        name: str,
+        dependencies: WorkflowDependencies,
+        fingerprint: str,
+        inputs: dict[str, str | None],
+        digests: dict[str, str],
+    ) -> None:
+        """Record the fingerprint and output versions of a completed workflow.
+
+        `digests` holds the hashes of the outputs whose written bytes are known; the others are
+        hashed from storage.
+        """
+        for table in dependencies.outputs:
+            self._stored.pop(table, None)
+        self._stored.update(digests)
+        outputs = {
+            table: await self._stored_hash(table) for table in dependencies.outputs
+        }
+        self._expected.update(outputs)
+        self._records[name] = {
+            "fingerprint": fingerprint,
+            "inputs": inputs,
+            "outputs": outputs,
+        }
+
+    def invalidate(self) -> None:
+        """Forget the known table versions after a workflow with undeclared dependencies ran."""
+        self._expected.clear()
+        self._stored.clear()
+
+    async def finalize(self) -> None:
+        """Restore the final version of every table and delete the preserved copies, after a completed run."""
+        for table in list(self._expected):
+            await self._restore(table)
+        for key in self._checkpoints["snapshots"]:
+            await self._storage.delete(key)
+        self._checkpoints["snapshots"] = []
+
+    async def _expected_hash(self, table: str) -> str | None:
+        if table not in self._expected:
+            self._expected[table] = await self._stored_hash(table)
+        return self._expected[table]
+
+    async def _stored_hash(self, table: str) -> str | None:
+        if table not in self._stored:
+            data = await self._read(table)
+            self._stored[table] = _hash_bytes(data) if data is not None else None
+        return self._stored[table]
+
+    async def _read(self, table: str) -> bytes | None:
+        await self._flush(table)
+        filename = f"{table}.parquet"
+        if not await self._storage.has(filename):
+            return None
+        return await self._storage.get(filename, as_bytes=True)
+
+    async def _preserve(self, table: str) -> None:
+        """Copy the stored version of a table aside if a checkpoint refers to it."""
+        known = {self._expected.get(table)} | {
+            record["outputs"].get(table) for record in self._records.values()
+        }
+        if await self._stored_hash(table) not in known - {None}:
+            return
+        key = _snapshot_key(table, self._stored[table])
+        if not await self._storage.has(key):
+            data = await self._read(table)
+            if data is None:
+                return
+            await self._storage.set(key, data)
+        if key not in self._checkpoints["snapshots"]:
+            self._checkpoints["snapshots"].append(key)
+
+    async def _restore(self, table: str) -> bool:
+        """Put the expected version of a table back into storage if a later workflow replaced it."""
+        expected = await self._expected_hash(table)
+        if expected is None or await self._stored_hash(table) == expected:
+            return False
+        key = _snapshot_key(table, expected)
+        if not await self._storage.has(key):
+            msg = f"Cannot resume: {table} was overwritten and no checkpoint of the expected version exists. Re-run the pipeline without resuming."
+            raise ValueError(msg)
+        log.info("restoring %s from checkpoint", table)
+        await self._preserve(table)
+        await self._flush(table)
+        await self._storage.set(
+            f"{table}.parquet", await self._storage.get(key, as_bytes=True)
+        )
+        self._stored[table] = expected
+        return True
+
+    async def _flush(self, table: str) -> None:
+        if self._tables is not None:
+            await self._tables.flush([table])
+
+
+def _hash_bytes(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _snapshot_key(table: str, digest: str) -> str:
+    return f"{table}.{digest[:16]}.checkpoint"
+
+
+def _config_slice(config: GraphRagConfig, sections: list[str]) -> dict[str, Any]:
+    """Dump the config sections a workflow depends on, replacing prompt paths with their content hash."""
+    dumped = config.model_dump(include=set(sections), mode="json")
+    for model in dumped.get("models", {}).values():
+        for field in _VOLATILE_MODEL_FIELDS:
+            model.pop(field, None)
+    for section in dumped.values():
+        if not isinstance(section, dict):
+            continue
+        for key, value in section.items():
+            if key.endswith("prompt") and isinstance(value, str):
+                prompt_path = Path(config.root_dir) / value
+                if prompt_path.is_file():
+                    section[key] = _hash_bytes(prompt_path.read_bytes())
+    return dumped
@@ -0,0 +1,239 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Per-workflow resource profiling.
+
+Table IO, LLM usage and cache lookups report into the profile of the workflow that is currently
+running. The active profile is kept in a context variable, so work done by concurrently scheduled
+workflows (and the tasks they spawn) is attributed to the right workflow.
+"""
+
+import cProfile
+import io
+import logging
+import marshal
+import mmap
+import pstats
+import time
+import tracemalloc
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from types import TracebackType
+
+log = logging.getLogger(__name__)
+
+_PAGE_SIZE = mmap.PAGESIZE
+
+_current_profile: ContextVar["WorkflowProfile | None"] = ContextVar(
+    "workflow_profile", default=None
+)
+
+
+@dataclass
+class WorkflowProfile:
+    """Resource usage of a single workflow run."""
+
+    overall: float = 0
+    """Wall-clock time in seconds."""
+
+    cpu_time: float = 0
+    """Process CPU time in seconds, including worker threads. Only measured when workflows run one at a time."""
+
+    rss: int = 0
+    """Resident set size of the process in bytes at the end of the workflow. Zero where it cannot be read, or when workflows run concurrently."""
+
+    rss_delta: int = 0
+    """Change of the resident set size of the process while the workflow ran, in bytes. Only measured when workflows run one at a time."""
+
+    peak_traced_memory: int = 0
+    """Peak memory allocated by Python while the workflow ran, in bytes. Only set when detailed profiling is enabled and workflows run one at a time."""
+
+    rows_read: int = 0
+    """Rows of the tables loaded from storage."""
+
+    rows_written: int = 0
+    """Rows of the tables written to storage."""
+
+    bytes_read: int = 0
+    """Bytes of the tables loaded from storage."""
+
+    bytes_written: int = 0
+    """Bytes of the tables written to storage."""
+
+    llm_calls: int = 0
+    """LLM requests sent, excluding cache hits."""
+
+    prompt_tokens: int = 0
+    """Prompt tokens reported by the LLM."""
+
+    completion_tokens: int = 0
+    """Completion tokens reported by the LLM."""
+
+    cache_hits: int = 0
+    """LLM cache lookups that returned a value."""
+
+    cache_misses: int = 0
+    """LLM cache lookups that returned nothing."""
+
+    rate_limit_wait: float = 0
+    """Seconds spent waiting on rate limiters before LLM requests were sent, summed over requests."""
+
+    gleanings: int = 0
+    """Graph extraction gleaning rounds sent."""
+
+    gleanings_skipped: int = 0
+    """Graph extraction gleaning rounds skipped by the gleaning policy."""
+
+    gleaning_records: int = 0
+    """Entity and relationship records returned by gleaning rounds."""
+
+    attribution_fallbacks: int = 0
+    """Records of packed extraction requests that no text unit of the pack mentions, attributed to the whole pack."""
+
+    def to_dict(self) -> dict[str, float]:
+        """Convert the profile to the format stored in PipelineRunStats."""
+        return asdict(self)
+
+
+class WorkflowProfiler:
+    """Context manager that collects the profile of a workflow run.
+
+    With `detailed` set, the workflow is also traced with tracemalloc and cProfile, and the resulting
+    artifacts are available in `artifacts` once the context exits.
+
+    CPU time, resident set size and the detailed traces are process-wide, so they are only collected
+    when the workflow is `exclusive`, i.e. no other workflow runs at the same time. Otherwise they
+    would be charged with the work of the other workflows, and cProfile cannot trace two at once.
+    """
+
+    def __init__(self, name: str, detailed: bool = False, exclusive: bool = True):
+        self.name = name
+        self.detailed = detailed and exclusive
+        self.exclusive = exclusive
+        self.profile = WorkflowProfile()
+        self.artifacts: dict[str, bytes] = {}
+        self._profiler: cProfile.Profile | None = None
+        self._stop_tracing = False
+
+    def __enter__(self) -> "WorkflowProfiler":
+        """Start collecting."""
+        self._token = _current_profile.set(self.profile)
+        if self.detailed:
+            self._start_detailed()
+        self._wall_start = time.time()
+        if self.exclusive:
+            self._cpu_start = time.process_time()
+            self._rss_start = _current_rss()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Stop collecting and fill in the timings."""
+        self.profile.overall = time.time() - self._wall_start
+        if self.exclusive:
+            self.profile.cpu_time = time.process_time() - self._cpu_start
+            self.profile.rss = _current_rss()
+            if self.profile.rss and self._rss_start:
+                self.profile.rss_delta = self.profile.rss - self._rss_start
+        if self.detailed:
+            self._stop_detailed()
+        _current_profile.reset(self._token)
+
+    def _start_detailed(self) -> None:
+        if tracemalloc.is_tracing():
+            tracemalloc.reset_peak()
+        else:
+            tracemalloc.start()
+            self._stop_tracing = True
+        self._profiler = cProfile.Profile()
+        try:
+            self._profiler.enable()
+        except ValueError:
+            # only one profiler can be active at a time, e.g. when the pipeline itself is profiled
+            log.warning("cannot profile %s, another profiler is active", self.name)
+            self._profiler = None
+
+    def _stop_detailed(self) -> None:
+        if self._profiler is not None:
+            self._profiler.disable()
+            self._profiler.create_stats()
+            self.artifacts[f"{self.name}.prof"] = marshal.dumps(self._profiler.stats)  # type: ignore
+            summary = io.StringIO()
+            pstats.Stats(self._profiler, stream=summary).sort_stats(
+                "cumulative"
+            ).print_stats(50)
+            self.artifacts[f"{self.name}.cpu.txt"] = summary.getvalue().encode()
+
+        _, self.profile.peak_traced_memory = tracemalloc.get_traced_memory()
+        snapshot = tracemalloc.take_snapshot()
+        top = snapshot.statistics("lineno")[:50]
+        self.artifacts[f"{self.name}.memory.txt"] = "\n".join(
+            str(stat) for stat in top
+        ).encode()
+        if self._stop_tracing:
+            tracemalloc.stop()
+
+
+def record_table_read(rows: int, size: int) -> None:
+    """Record a table loaded from storage."""
+    if (profile := _current_profile.get()) is not None:
+        profile.rows_read += rows
+        profile.bytes_read += size
+
+
+def record_table_write(rows: int, size: int) -> None:
+    """Record a table written to storage."""
+    if (profile := _current_profile.get()) is not None:
+        profile.rows_written += rows
+        profile.bytes_written += size
+
+
+def record_llm_usage(prompt_tokens: int, completion_tokens: int) -> None:
+    """Record a completed LLM request."""
+    if (profile := _current_profile.get()) is not None:
+        profile.llm_calls += 1
+        profile.prompt_tokens += prompt_tokens
+        profile.completion_tokens += completion_tokens
+
+
+def record_cache_lookup(hit: bool) -> None:
+    """Record an LLM cache lookup."""
+    if (profile := _current_profile.get()) is not None:
+        if hit:
+            profile.cache_hits += 1
+        else:
+            profile.cache_misses += 1
+
+
+def record_rate_limit_wait(seconds: float) -> None:
+    """Record time spent waiting on a rate limiter."""
+    if (profile := _current_profile.get()) is not None:
+        profile.rate_limit_wait += seconds
+
+
+def record_gleaning(gleanings: int = 0, skipped: int = 0, records: int = 0) -> None:
+    """Record gleaning rounds sent or skipped, and the records they returned."""
+    if (profile := _current_profile.get()) is not None:
+        profile.gleanings += gleanings
+        profile.gleanings_skipped += skipped
+        profile.gleaning_records += records
+
+
+def record_attribution_fallbacks(records: int) -> None:
+    """Record extracted records attributed to a whole pack of text units."""
+    if (profile := _current_profile.get()) is not None:
+        profile.attribution_fallbacks += records
+
+
+def _current_rss() -> int:
+    """Read the current resident set size of the process, or 0 where procfs is not available."""
+    try:
+        resident_pages = int(Path("/proc/self/statm").read_text().split()[1])
+    except (OSError, IndexError, ValueError):
+        return 0
+    return resident_pages * _PAGE_SIZE
@@ -3,12 +3,13 @@
 
 """Different methods to run the pipeline."""
 
+import asyncio
 import json
 import logging
 import re
 import time
 import traceback
-from collections.abc import AsyncIterable
+from collections.abc import AsyncIterable, Awaitable, Callable
 from dataclasses import asdict
 
 import pandas as pd
@@ -18,14 +19,18 @@ from graphrag.callbacks.noop_workflow_callbacks import NoopWorkflowCallbacks
 from graphrag.callbacks.workflow_callbacks import WorkflowCallbacks
 from graphrag.config.models.graph_rag_config import GraphRagConfig
 from graphrag.index.input.factory import create_input
+from graphrag.index.run.checkpoints import PipelineCheckpoints
+from graphrag.index.run.profiling import WorkflowProfile, WorkflowProfiler
 from graphrag.index.run.utils import create_run_context
 from graphrag.index.typing.context import PipelineRunContext
 from graphrag.index.typing.pipeline import Pipeline
 from graphrag.index.typing.pipeline_run_result import PipelineRunResult
+from graphrag.index.typing.workflow import WorkflowFunction
 from graphrag.index.update.incremental_index import (
     get_delta_docs,
     update_dataframe_outputs,
 )
+from graphrag.language_model.manager import ModelManager
 from graphrag.logger.base import ProgressLogger
 from graphrag.logger.progress import Progress
 from graphrag.storage.pipeline_storage import PipelineStorage
@@ -35,14 +40,30 @@ from graphrag.utils.storage import load_table_from_storage, write_table_to_stora
 log = logging.getLogger(__name__)
 
 
+class WorkflowError(Exception):
+    """Wraps an error raised by a workflow running concurrently with others."""
+
+    def __init__(self, workflow: str, error: Exception):
+        super().__init__(f"Error running workflow {workflow}: {error}")
+        self.workflow = workflow
+        self.error = error
+
+
 async def run_pipeline(
     pipeline: Pipeline,
     config: GraphRagConfig,
     callbacks: WorkflowCallbacks,
     logger: ProgressLogger,
     is_update_run: bool = False,
+    is_resume_run: bool = False,
+    profile: bool = False,
 ) -> AsyncIterable[PipelineRunResult]:
-    """Run all workflows using a simplified pipeline."""
+    """Run all workflows using a simplified pipeline.
+
+    When `is_resume_run` is set, workflows whose recorded checkpoint still matches their inputs and config are skipped.
+    Checkpoints are recorded in resumed runs and when `config.checkpoints` is enabled.
+    When `profile` is set, every workflow is traced with tracemalloc and cProfile and the results are written to the profiles/ folder of the output storage, unless workflows run concurrently.
+    """
     root_dir = config.root_dir
 
     storage = create_storage_from_config(config.output)
@@ -78,6 +99,8 @@ async def run_pipeline(
                 storage=delta_storage,
                 callbacks=callbacks,
                 logger=logger,
+                is_resume_run=is_resume_run,
+                profile=profile,
             ):
                 yield table
 
@@ -104,6 +127,8 @@ async def run_pipeline(
             storage=storage,
             callbacks=callbacks,
             logger=logger,
+            is_resume_run=is_resume_run,
+            profile=profile,
         ):
             yield table
 
@@ -116,6 +141,8 @@ async def _run_pipeline(
     storage: PipelineStorage,
     callbacks: WorkflowCallbacks,
     logger: ProgressLogger,
+    is_resume_run: bool = False,
+    profile: bool = False,
 ) -> AsyncIterable[PipelineRunResult]:
     start_time = time.time()
 
@@ -124,44 +151,178 @@ async def _run_pipeline(
     state = json.loads(state_json) if state_json else {}
 
     context = create_run_context(
-        storage=storage, cache=cache, callbacks=callbacks, state=state
+        storage=storage,
+        cache=cache,
+        callbacks=callbacks,
+        state=state,
+        table_memory_limit=config.table_memory_limit * 1024 * 1024,
     )
+    # checkpoints hash and preserve tables, which is only worth it when a run may be resumed
+    checkpoints = (
+        PipelineCheckpoints(config, storage, context.state, context.tables)
+        if config.checkpoints or is_resume_run
+        else None
+    )
+    # detailed profiles are process-wide, so they cannot be attributed to concurrent workflows
+    profile = profile and not config.concurrent_workflows
+    profiles = storage.child("profiles") if profile else None
 
     log.info("Final # of rows loaded: %s", len(dataset))
     context.stats.num_documents = len(dataset)
     last_workflow = "starting documents"
+    workflow_profiles: dict[str, WorkflowProfile] = {}
+
+    async def run_workflow(
+        name: str, workflow_function: WorkflowFunction
+    ) -> PipelineRunResult:
+        dependencies = pipeline.dependencies.get(name)
+        fingerprint, inputs = "", {}
+        if dependencies is None:
+            # the workflow may use the storage directly, so it must see every table written so far
+            await context.tables.flush()
+            if checkpoints is not None:
+                checkpoints.invalidate()
+        elif checkpoints is not None:
+            fingerprint, inputs = await checkpoints.fingerprint(name, dependencies)
+            if is_resume_run and await checkpoints.try_skip(
+                name, dependencies, fingerprint
+            ):
+                log.info("skipping workflow %s, checkpoint is up to date", name)
+                return PipelineRunResult(
+                    workflow=name, result=None, state=context.state, errors=None
+                )
+            context.tables.discard(await checkpoints.prepare(dependencies))
+
+        outputs = dependencies.outputs if dependencies is not None else None
+        versions = {table: context.tables.version(table) for table in outputs or []}
+        progress = logger.child(name, transient=False)
+        callbacks.workflow_start(name, None)
+        with WorkflowProfiler(
+            name, detailed=profile, exclusive=not config.concurrent_workflows
+        ) as profiler:
+            result = await workflow_function(config, context)
+        # declared outputs keep persisting in the background; the next workflow that needs them
+        # from storage, a checkpoint touching them, or the end of the run waits for them
+        if outputs is None:
+            await context.tables.flush()
+            context.tables.discard()
+        else:
+            # outputs written to the storage directly replace any version kept in memory
+            context.tables.discard([
+                table
+                for table in outputs
+                if context.tables.version(table) == versions[table]
+            ])
+        progress(Progress(percent=1))
+        callbacks.workflow_end(name, result)
+        workflow_profiles[name] = profiler.profile
+        context.stats.workflows[name] = profiler.profile.to_dict()
+        if profiles is not None:
+            for key, artifact in profiler.artifacts.items():
+                await profiles.set(key, artifact)
+
+        if dependencies is not None and checkpoints is not None:
+            # the outputs written through the registry are hashed from their serialized bytes
+            digests = {
+                table: digest
+                for table in dependencies.outputs
+                if context.tables.version(table) != versions[table]
+                and (digest := await context.tables.digest(table)) is not None
+            }
+            await checkpoints.record(name, dependencies, fingerprint, inputs, digests)
+            await _dump_json(context)
+
+        return PipelineRunResult(
+            workflow=name, result=result.result, state=context.state, errors=None
+        )
 
     try:
         await _dump_json(context)
-        await write_table_to_storage(dataset, "documents", context.storage)
+        if checkpoints is not None:
+            await checkpoints.write_table("documents", dataset.to_parquet())
+        else:
+            await write_table_to_storage(dataset, "documents", context.storage)
 
-        for name, workflow_function in pipeline.run():
-            last_workflow = name
-            progress = logger.child(name, transient=False)
-            callbacks.workflow_start(name, None)
-            work_time = time.time()
-            result = await workflow_function(config, context)
-            progress(Progress(percent=1))
-            callbacks.workflow_end(name, result)
-            yield PipelineRunResult(
-                workflow=name, result=result.result, state=context.state, errors=None
+        if config.concurrent_workflows:
+            log.info(
+                "workflows run concurrently, per-workflow CPU time, memory and detailed profiles are not collected"
             )
+            async for result in _run_workflows_concurrently(pipeline, run_workflow):
+                last_workflow = result.workflow
+                yield result
+        else:
+            for name, workflow_function in pipeline.run():
+                last_workflow = name
+                yield await run_workflow(name, workflow_function)
 
-            context.stats.workflows[name] = {"overall": time.time() - work_time}
-
+        await context.tables.flush()
+        # table writes that finished after their workflow are counted now
+        for name, workflow_profile in workflow_profiles.items():
+            context.stats.workflows[name] = workflow_profile.to_dict()
+        if checkpoints is not None:
+            await checkpoints.finalize()
         context.stats.total_runtime = time.time() - start_time
         await _dump_json(context)
 
+    except WorkflowError as e:
+        log.exception("error running workflow %s", e.workflow)
+        await _flush_tables(context)
+        callbacks.error("Error running pipeline!", e.error, traceback.format_exc())
+        yield PipelineRunResult(
+            workflow=e.workflow, result=None, state=context.state, errors=[e.error]
+        )
     except Exception as e:
         log.exception("error running workflow %s", last_workflow)
+        await _flush_tables(context)
         callbacks.error("Error running pipeline!", e, traceback.format_exc())
         yield PipelineRunResult(
             workflow=last_workflow, result=None, state=context.state, errors=[e]
         )
 
 
+async def _run_workflows_concurrently(
+    pipeline: Pipeline,
+    run_workflow: Callable[[str, WorkflowFunction], Awaitable[PipelineRunResult]],
+) -> AsyncIterable[PipelineRunResult]:
+    """Run each workflow as soon as the workflows it depends on have completed, yielding results as they finish."""
+    predecessors = pipeline.predecessors()
+    completed: set[int] = set()
+    running: dict[asyncio.Task, int] = {}
+
+    async def run(index: int) -> PipelineRunResult:
+        name, workflow_function = pipeline.workflows[index]
+        try:
+            return await run_workflow(name, workflow_function)
+        except Exception as e:
+            raise WorkflowError(name, e) from e
+
+    try:
+        while len(completed) < len(pipeline.workflows):
+            started = completed | set(running.values())
+            for index in range(len(pipeline.workflows)):
+                if index not in started and predecessors[index] <= completed:
+                    running[asyncio.create_task(run(index))] = index
+            done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                completed.add(running.pop(task))
+                yield task.result()
+    finally:
+        for task in running:
+            task.cancel()
+        await asyncio.gather(*running, return_exceptions=True)
+
+
+async def _flush_tables(context: PipelineRunContext) -> None:
+    """Persist the tables written before a failure, so they can be inspected or resumed from."""
+    try:
+        await context.tables.flush()
+    except Exception:
+        log.exception("error persisting tables")
+
+
 async def _dump_json(context: PipelineRunContext) -> None:
     """Dump the stats and context state to the storage."""
+    context.stats.rate_budgets = ModelManager().rate_budgets.stats()
     await context.storage.set(
         "stats.json", json.dumps(asdict(context.stats), indent=4, ensure_ascii=False)
     )
@@ -0,0 +1,167 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""A run-scoped registry that hands tables between workflows in memory."""
+
+import asyncio
+import hashlib
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass
+
+import pandas as pd
+
+from graphrag.index.run.profiling import record_table_read, record_table_write
+from graphrag.storage.pipeline_storage import PipelineStorage
+from graphrag.utils.storage import (
+    load_table_from_storage,
+    storage_has_table,
+)
+
+log = logging.getLogger(__name__)
+
+
+@dataclass
+class _Entry:
+    table: pd.DataFrame
+    size: int
+    persist: asyncio.Task
+
+
+class TableRegistry:
+    """Keeps the tables written by workflows in memory and persists them to storage in the background.
+
+    Workflows read and write their tables through the registry instead of the storage directly.
+    Written tables are served to the next workflow without a parquet round trip, while the
+    serialization and the storage write happen off the event loop. A written table is kept as is, so
+    the writer must not modify it afterwards; every load returns a copy, so a workflow mutating the
+    frame it read cannot change what others read or what is persisted.
+    When the kept tables exceed `memory_limit` bytes, the least recently used ones are dropped once
+    persisted. With a `memory_limit` of 0, every call goes straight to the storage.
+
+    The SHA-256 digest of the bytes each table is serialized to is available as soon as the
+    serialization is done, so checkpoints neither wait for the storage write nor read the table back.
+    """
+
+    def __init__(self, storage: PipelineStorage, memory_limit: int = 0):
+        self._storage = storage
+        self._memory_limit = memory_limit
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._pending: dict[str, asyncio.Task] = {}
+        self._versions: dict[str, int] = {}
+        self._digests: dict[str, str] = {}
+        self._serializing: dict[str, asyncio.Task[tuple[bytes, str]]] = {}
+
+    @property
+    def enabled(self) -> bool:
+        """Whether tables are kept in memory."""
+        return self._memory_limit > 0
+
+    @property
+    def size(self) -> int:
+        """The estimated memory held by the kept tables, in bytes."""
+        return sum(entry.size for entry in self._entries.values())
+
+    async def load(self, name: str) -> pd.DataFrame:
+        """Load a table, from memory if it is kept there and from storage otherwise."""
+        entry = self._entries.get(name)
+        if entry is None:
+            await self.flush([name])
+            return await load_table_from_storage(name, self._storage)
+        self._entries.move_to_end(name)
+        record_table_read(len(entry.table), 0)
+        return entry.table.copy()
+
+    async def write(self, name: str, table: pd.DataFrame) -> None:
+        """Write a table, keeping it in memory and persisting it in the background."""
+        self._versions[name] = self._versions.get(name, 0) + 1
+        self._digests.pop(name, None)
+        if not self.enabled:
+            data, digest = _serialize(table)
+            record_table_write(len(table), len(data))
+            await self._storage.set(f"{name}.parquet", data)
+            self._digests[name] = digest
+            return
+
+        previous = self._pending.pop(name, None)
+        serialize = asyncio.create_task(asyncio.to_thread(_serialize, table))
+        self._serializing[name] = serialize
+        persist = asyncio.create_task(
+            self._persist(name, len(table), serialize, previous)
+        )
+        self._pending[name] = persist
+        size = int(table.memory_usage(index=True, deep=True).sum())
+        self._entries.pop(name, None)
+        if size <= self._memory_limit:
+            self._entries[name] = _Entry(table, size, persist)
+        await self._evict()
+
+    async def has(self, name: str) -> bool:
+        """Check if a table exists in memory or in storage."""
+        return (
+            name in self._entries
+            or name in self._pending
+            or (await storage_has_table(name, self._storage))
+        )
+
+    def version(self, name: str) -> int:
+        """Return how many times a table was written through the registry."""
+        return self._versions.get(name, 0)
+
+    async def digest(self, name: str) -> str | None:
+        """Return the SHA-256 digest of the bytes the last write of a table is stored as.
+
+        Waits for the serialization of the table, but not for the storage write.
+        """
+        serialize = self._serializing.get(name)
+        if serialize is not None:
+            _, digest = await serialize
+            return digest
+        return self._digests.get(name)
+
+    async def flush(self, names: list[str] | None = None) -> None:
+        """Wait until the given tables (or all tables) are persisted to storage."""
+        names = list(self._pending) if names is None else names
+        for name in names:
+            persist = self._pending.get(name)
+            if persist is None:
+                continue
+            try:
+                await persist
+            finally:
+                if self._pending.get(name) is persist:
+                    del self._pending[name]
+
+    def discard(self, names: list[str] | None = None) -> None:
+        """Drop tables (or all tables) from memory, e.g. after their stored version was replaced."""
+        for name in list(self._entries) if names is None else names:
+            self._entries.pop(name, None)
+
+    async def _persist(
+        self,
+        name: str,
+        rows: int,
+        serialize: asyncio.Task[tuple[bytes, str]],
+        previous: asyncio.Task | None,
+    ) -> None:
+        data, digest = await serialize
+        if previous is not None:
+            # keep writes of the same table in order
+            await previous
+        record_table_write(rows, len(data))
+        await self._storage.set(f"{name}.parquet", data)
+        if self._serializing.get(name) is serialize:
+            # the serialized bytes are not needed anymore, only their digest
+            del self._serializing[name]
+            self._digests[name] = digest
+
+    async def _evict(self) -> None:
+        while self.size > self._memory_limit and self._entries:
+            name, entry = self._entries.popitem(last=False)
+            log.debug("evicting %s from the table registry", name)
+            await entry.persist
+
+
+def _serialize(table: pd.DataFrame) -> tuple[bytes, str]:
+    data = table.to_parquet()
+    return data, hashlib.sha256(data).hexdigest()
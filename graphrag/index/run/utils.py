@@ -9,6 +9,7 @@ from graphrag.callbacks.noop_workflow_callbacks import NoopWorkflowCallbacks
 from graphrag.callbacks.progress_workflow_callbacks import ProgressWorkflowCallbacks
 from graphrag.callbacks.workflow_callbacks import WorkflowCallbacks
 from graphrag.callbacks.workflow_callbacks_manager import WorkflowCallbacksManager
+from graphrag.index.run.table_registry import TableRegistry
 from graphrag.index.typing.context import PipelineRunContext
 from graphrag.index.typing.state import PipelineState
 from graphrag.index.typing.stats import PipelineRunStats
@@ -23,12 +24,15 @@ def create_run_context(
     callbacks: WorkflowCallbacks | None = None,
     stats: PipelineRunStats | None = None,
     state: PipelineState | None = None,
+    table_memory_limit: int = 0,
 ) -> PipelineRunContext:
     """Create the run context for the pipeline."""
+    storage = storage or MemoryPipelineStorage()
     return PipelineRunContext(
         stats=stats or PipelineRunStats(),
         cache=cache or InMemoryCache(),
-        storage=storage or MemoryPipelineStorage(),
+        storage=storage,
+        tables=TableRegistry(storage, table_memory_limit),
         callbacks=callbacks or NoopWorkflowCallbacks(),
         state=state or {},
     )
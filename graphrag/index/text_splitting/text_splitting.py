@@ -1,14 +1,17 @@
 # Copyright (c) 2024 Microsoft Corporation.
 # Licensed under the MIT License
 
-"""A module containing the 'Tokenizer', 'TextSplitter', 'NoopTextSplitter' and 'TokenTextSplitter' models."""
+"""A module containing the 'Tokenizer', 'TokenizedTexts', 'TextSplitter', 'NoopTextSplitter' and 'TokenTextSplitter' models."""
 
 import logging
+import math
 from abc import ABC, abstractmethod
-from collections.abc import Callable, Collection, Iterable
-from dataclasses import dataclass
+from collections.abc import Callable, Collection, Iterable, Iterator, Sequence
+from dataclasses import dataclass, replace
+from functools import partial
 from typing import Any, Literal, cast
 
+import numpy as np
 import pandas as pd
 import tiktoken
 
@@ -20,9 +23,22 @@ EncodedText = list[int]
 DecodeFn = Callable[[EncodedText], str]
 EncodeFn = Callable[[str], EncodedText]
 LengthFn = Callable[[str], int]
+EncodeBatchFn = Callable[[list[str]], list[EncodedText]]
+TokenOffsetsFn = Callable[[EncodedText], list[int]]
 
 log = logging.getLogger(__name__)
 
+# texts encoded per call of a batch encoder: large enough for it to spread the work over its
+# threads, small enough that the token ids only exist as Python lists for one batch at a time.
+ENCODE_BATCH_SIZE = 64
+# batches smaller than this are encoded text by text: tiktoken's encode_batch starts a thread pool
+# on every call, which costs more than it saves for a few texts, e.g. one text per split_text call
+MIN_ENCODE_BATCH_SIZE = 8
+# windows sliced and decoded together
+DECODE_BLOCK_SIZE = 1024
+# tokens that decide whether a content-defined chunk boundary falls after a token
+CONTENT_HASH_WINDOW = 32
+
 
 @dataclass(frozen=True)
 class Tokenizer:
@@ -36,6 +52,10 @@ class Tokenizer:
     """ Function to decode a list of token ids to a string"""
     encode: EncodeFn
     """ Function to encode a string to a list of token ids"""
+    encode_batch: EncodeBatchFn | None = None
+    """ Optional function to encode several strings at once, e.g. tiktoken's multi-threaded encode_batch"""
+    token_offsets: TokenOffsetsFn | None = None
+    """ Optional function returning the character offset of each token in the decoded text, used to record the span of each chunk"""
 
 
 class TextSplitter(ABC):
@@ -135,59 +155,271 @@ class TokenTextSplitter(TextSplitter):
             tokens_per_chunk=self._chunk_size,
             decode=self._tokenizer.decode,
             encode=lambda text: self.encode(text),
+            encode_batch=partial(
+                self._tokenizer.encode_batch,
+                allowed_special=self._allowed_special,
+                disallowed_special=self._disallowed_special,
+            ),
         )
 
         return split_single_text_on_tokens(text=text, tokenizer=tokenizer)
 
 
-def split_single_text_on_tokens(text: str, tokenizer: Tokenizer) -> list[str]:
-    """Split a single text and return chunks using the tokenizer."""
-    result = []
-    input_ids = tokenizer.encode(text)
+@dataclass(frozen=True)
+class TokenizedTexts:
+    """The token ids of several texts, concatenated in a single array.
+
+    Text `i` owns `tokens[offsets[i]:offsets[i + 1]]`, so slicing windows and finding the texts a
+    window comes from are array operations rather than walks over per-token Python objects.
+    """
+
+    tokens: np.ndarray
+    """Token ids of all texts (int32)"""
+    offsets: np.ndarray
+    """Start of each text in `tokens`, followed by the total number of tokens (int64)"""
+
+    @classmethod
+    def from_encoded(cls, encoded: Iterable[Sequence[int]]) -> "TokenizedTexts":
+        """Build from the token ids of each text."""
+        arrays = [np.asarray(ids, dtype=np.int32) for ids in encoded]
+        offsets = np.zeros(len(arrays) + 1, dtype=np.int64)
+        np.cumsum([len(ids) for ids in arrays], out=offsets[1:])
+        tokens = np.concatenate(arrays) if arrays else np.empty(0, dtype=np.int32)
+        return cls(tokens, offsets)
+
+    @classmethod
+    def concat(cls, parts: Sequence["TokenizedTexts"]) -> "TokenizedTexts":
+        """Concatenate the texts of several parts."""
+        if len(parts) == 1:
+            return parts[0]
+        ends = np.cumsum([len(part.tokens) for part in parts])
+        offsets = [np.zeros(1, dtype=np.int64)] + [
+            part.offsets[1:] + start
+            for part, start in zip(parts, np.concatenate([[0], ends]), strict=False)
+        ]
+        tokens = [part.tokens for part in parts] or [np.empty(0, dtype=np.int32)]
+        return cls(np.concatenate(tokens), np.concatenate(offsets))
+
+    @property
+    def num_texts(self) -> int:
+        """The number of texts."""
+        return len(self.offsets) - 1
+
+    def select(self, start: int, stop: int) -> "TokenizedTexts":
+        """Return texts `start` to `stop` (exclusive), sharing the token array."""
+        offsets = self.offsets[start : stop + 1]
+        return TokenizedTexts(
+            self.tokens[offsets[0] : offsets[-1]], offsets - offsets[0]
+        )
 
-    start_idx = 0
-    cur_idx = min(start_idx + tokenizer.tokens_per_chunk, len(input_ids))
-    chunk_ids = input_ids[start_idx:cur_idx]
+    def source_texts(self, starts: np.ndarray, ends: np.ndarray) -> list[list[int]]:
+        """Return the indices of the texts that have tokens in each window `tokens[start:end]`."""
+        firsts = np.searchsorted(self.offsets, starts, side="right") - 1
+        lasts = np.searchsorted(self.offsets, ends - 1, side="right") - 1
+        sizes = np.diff(self.offsets)
+        result = []
+        for first, last in zip(firsts.tolist(), lasts.tolist(), strict=True):
+            if first == last:
+                result.append([first])
+            else:
+                # texts without tokens share their offset with the next text and are skipped
+                nonempty = np.flatnonzero(sizes[first : last + 1]) + first
+                result.append(nonempty.tolist())
+        return result
+
+    def windows(self, tokens_per_chunk: int, chunk_overlap: int) -> np.ndarray:
+        """Return the start of each window of `tokens_per_chunk` tokens overlapping by `chunk_overlap`."""
+        step = tokens_per_chunk - chunk_overlap
+        if step <= 0:
+            msg = f"chunk_overlap ({chunk_overlap}) must be smaller than the chunk size ({tokens_per_chunk})"
+            raise ValueError(msg)
+        return np.arange(0, len(self.tokens), step, dtype=np.int64)
+
+    def content_defined_windows(
+        self, tokens_per_chunk: int, chunk_overlap: int
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Return the start and end of windows whose boundaries are picked by the content.
+
+        A boundary may fall after any token whose rolling hash over the preceding
+        `CONTENT_HASH_WINDOW` tokens has its top bits clear. Each chunk takes the first such
+        boundary at least half the chunk size in, or is cut at the chunk size if there is
+        none. Inserting or removing text therefore only moves the boundaries up to the next
+        boundary that does not depend on the edit, and the chunks after it are unchanged. Windows
+        reach `chunk_overlap` tokens back into the previous chunk, and never exceed
+        `tokens_per_chunk` tokens.
+        """
+        step = tokens_per_chunk - chunk_overlap
+        if step <= 0:
+            msg = f"chunk_overlap ({chunk_overlap}) must be smaller than the chunk size ({tokens_per_chunk})"
+            raise ValueError(msg)
+        total = len(self.tokens)
+        min_size = max(1, step // 2)
+        # about one boundary every quarter chunk after the minimum size
+        bits = max(1, round(math.log2(max(2, step / 4))))
+        hashes = _rolling_hash(self.tokens) >> np.uint64(64 - bits)
+        boundaries = np.flatnonzero(hashes == 0) + 1
+
+        starts = []
+        ends = []
+        start = 0
+        while start < total:
+            lowest, highest = start + min_size, min(start + step, total)
+            index = np.searchsorted(boundaries, lowest)
+            if index < len(boundaries) and boundaries[index] <= highest:
+                end = int(boundaries[index])
+            else:
+                end = highest
+            starts.append(max(0, start - chunk_overlap))
+            ends.append(end)
+            start = end
+        return np.asarray(starts, dtype=np.int64), np.asarray(ends, dtype=np.int64)
+
+
+def _rolling_hash(tokens: np.ndarray) -> np.ndarray:
+    """Gear hash of the `CONTENT_HASH_WINDOW` tokens ending at each token."""
+    # splitmix64 of the token ids gives each token a random-looking 64-bit gear
+    gear = tokens.astype(np.uint64) + np.uint64(0x9E3779B97F4A7C15)
+    gear = (gear ^ (gear >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    gear = (gear ^ (gear >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    gear ^= gear >> np.uint64(31)
+    hashes = np.zeros(len(tokens), dtype=np.uint64)
+    for shift in range(min(CONTENT_HASH_WINDOW, len(tokens))):
+        hashes[shift:] += gear[: len(tokens) - shift] << np.uint64(shift)
+    return hashes
+
+
+def encode_texts(
+    texts: Sequence[str], tokenizer: Tokenizer, tick: ProgressTicker | None = None
+) -> TokenizedTexts:
+    """Encode texts with the tokenizer, in batches when it can encode batches and there are enough texts."""
+    if tokenizer.encode_batch is None or len(texts) < MIN_ENCODE_BATCH_SIZE:
+
+        def encode(text: str) -> EncodedText:
+            encoded = tokenizer.encode(text)
+            if tick:
+                tick(1)
+            return encoded
+
+        return TokenizedTexts.from_encoded(encode(text) for text in texts)
+
+    parts = []
+    for start in range(0, len(texts), ENCODE_BATCH_SIZE):
+        batch = list(texts[start : start + ENCODE_BATCH_SIZE])
+        parts.append(TokenizedTexts.from_encoded(tokenizer.encode_batch(batch)))
+        if tick:
+            tick(len(batch))
+    return TokenizedTexts.concat(parts) if parts else TokenizedTexts.from_encoded([])
 
-    while start_idx < len(input_ids):
-        chunk_text = tokenizer.decode(list(chunk_ids))
-        result.append(chunk_text)  # Append chunked text as string
-        start_idx += tokenizer.tokens_per_chunk - tokenizer.chunk_overlap
-        cur_idx = min(start_idx + tokenizer.tokens_per_chunk, len(input_ids))
-        chunk_ids = input_ids[start_idx:cur_idx]
 
-    return result
+def decode_windows(
+    tokenized: TokenizedTexts, tokenizer: Tokenizer, content_defined: bool = False
+) -> Iterator[tuple[str, int, int, list[int]]]:
+    """Decode each window of the tokenized texts, yielding its text, start, end and source texts.
 
+    Windows are fixed-size, or content-defined (see `TokenizedTexts.content_defined_windows`).
+    """
+    if content_defined:
+        starts, ends = tokenized.content_defined_windows(
+            tokenizer.tokens_per_chunk, tokenizer.chunk_overlap
+        )
+    else:
+        starts = tokenized.windows(tokenizer.tokens_per_chunk, tokenizer.chunk_overlap)
+        ends = np.minimum(starts + tokenizer.tokens_per_chunk, len(tokenized.tokens))
+    for block in range(0, len(starts), DECODE_BLOCK_SIZE):
+        block_starts = starts[block : block + DECODE_BLOCK_SIZE]
+        block_ends = ends[block : block + DECODE_BLOCK_SIZE]
+        sources = tokenized.source_texts(block_starts, block_ends)
+        block_starts, block_ends = block_starts.tolist(), block_ends.tolist()
+        windows = [
+            tokenized.tokens[start:end].tolist()
+            for start, end in zip(block_starts, block_ends, strict=True)
+        ]
+        texts = [tokenizer.decode(window) for window in windows]
+        yield from zip(texts, block_starts, block_ends, sources, strict=True)
 
-# Adapted from - https://github.com/langchain-ai/langchain/blob/77b359edf5df0d37ef0d539f678cf64f5557cb54/libs/langchain/langchain/text_splitter.py#L471
-# So we could have better control over the chunking process
-def split_multiple_texts_on_tokens(
-    texts: list[str], tokenizer: Tokenizer, tick: ProgressTicker
-) -> list[TextChunk]:
-    """Split multiple texts and return chunks with metadata using the tokenizer."""
-    result = []
-    mapped_ids = []
 
-    for source_doc_idx, text in enumerate(texts):
-        encoded = tokenizer.encode(text)
-        if tick:
-            tick(1)  # Track progress if tick callback is provided
-        mapped_ids.append((source_doc_idx, encoded))
+def split_single_text_on_tokens(text: str, tokenizer: Tokenizer) -> list[str]:
+    """Split a single text and return chunks using the tokenizer."""
+    tokenized = encode_texts([text], tokenizer)
+    return [chunk for chunk, _, _, _ in decode_windows(tokenized, tokenizer)]
 
-    input_ids = [
-        (source_doc_idx, id) for source_doc_idx, ids in mapped_ids for id in ids
-    ]
 
-    start_idx = 0
-    cur_idx = min(start_idx + tokenizer.tokens_per_chunk, len(input_ids))
-    chunk_ids = input_ids[start_idx:cur_idx]
+def split_multiple_texts_on_tokens(
+    texts: list[str],
+    tokenizer: Tokenizer,
+    tick: ProgressTicker,
+    content_defined: bool = False,
+) -> list[TextChunk]:
+    """Split multiple texts and return chunks with metadata using the tokenizer.
+
+    The texts are joined into one token stream, so a chunk may span the end of one text and the start of the next.
+    With `content_defined`, chunk boundaries are picked by the content instead of every `tokens_per_chunk` tokens.
+    """
+    tokenized = encode_texts(texts, tokenizer, tick)
+    return _text_chunks(texts, tokenized, tokenizer, content_defined)
+
+
+def split_text_groups_on_tokens(
+    groups: Sequence[Sequence[str]],
+    tokenizer: Tokenizer,
+    tick: ProgressTicker | None = None,
+    tokens_per_chunk: Sequence[int] | None = None,
+    content_defined: bool = False,
+) -> list[list[TextChunk]]:
+    """Split several groups of texts in one pass, as if each group was split with `split_multiple_texts_on_tokens`.
+
+    All texts are encoded together, so batch encoders see large batches even when the groups are small.
+    `tokens_per_chunk` optionally overrides the chunk size of each group.
+    """
+    tokenized = encode_texts(
+        [text for group in groups for text in group], tokenizer, tick
+    )
+    result = []
+    first = 0
+    for index, group in enumerate(groups):
+        group_tokenizer = (
+            tokenizer
+            if tokens_per_chunk is None
+            else replace(tokenizer, tokens_per_chunk=tokens_per_chunk[index])
+        )
+        part = tokenized.select(first, first + len(group))
+        result.append(_text_chunks(group, part, group_tokenizer, content_defined))
+        first += len(group)
+    return result
 
-    while start_idx < len(input_ids):
-        chunk_text = tokenizer.decode([id for _, id in chunk_ids])
-        doc_indices = list({doc_idx for doc_idx, _ in chunk_ids})
-        result.append(TextChunk(chunk_text, doc_indices, len(chunk_ids)))
-        start_idx += tokenizer.tokens_per_chunk - tokenizer.chunk_overlap
-        cur_idx = min(start_idx + tokenizer.tokens_per_chunk, len(input_ids))
-        chunk_ids = input_ids[start_idx:cur_idx]
 
+def _text_chunks(
+    texts: Sequence[str],
+    tokenized: TokenizedTexts,
+    tokenizer: Tokenizer,
+    content_defined: bool = False,
+) -> list[TextChunk]:
+    result = []
+    char_offsets: list[int] = []
+    offsets_of = None
+    for chunk, start, end, sources in decode_windows(
+        tokenized, tokenizer, content_defined
+    ):
+        text_chunk = TextChunk(chunk, list(set(sources)), end - start)
+        result.append(text_chunk)
+        if tokenizer.token_offsets is None or len(sources) != 1:
+            continue
+        source = sources[0]
+        text = f"{texts[source]}"
+        text_start = int(tokenized.offsets[source])
+        if offsets_of != source:
+            # windows come in order, so the offsets of one text at a time are enough
+            offsets_of = source
+            char_offsets = tokenizer.token_offsets(
+                tokenized.tokens[text_start : tokenized.offsets[source + 1]].tolist()
+            )
+            char_offsets.append(len(text))
+        start_char = char_offsets[start - text_start]
+        end_char = char_offsets[end - text_start]
+        # a window cutting through a multi-byte character does not decode to a slice of the text
+        if text[start_char:end_char] == chunk:
+            text_chunk.start_char = start_char
+            text_chunk.end_char = end_char
+            text_chunk.start_token = start - text_start
+            text_chunk.end_token = end - text_start
     return result
@@ -8,6 +8,7 @@ from dataclasses import dataclass
 
 from graphrag.cache.pipeline_cache import PipelineCache
 from graphrag.callbacks.workflow_callbacks import WorkflowCallbacks
+from graphrag.index.run.table_registry import TableRegistry
 from graphrag.index.typing.state import PipelineState
 from graphrag.index.typing.stats import PipelineRunStats
 from graphrag.storage.pipeline_storage import PipelineStorage
@@ -20,6 +21,8 @@ class PipelineRunContext:
     stats: PipelineRunStats
     storage: PipelineStorage
     "Long-term storage for pipeline verbs to use. Items written here will be written to the storage provider."
+    tables: TableRegistry
+    "Tables handed between workflows, backed by the long-term storage. Workflows should read and write their tables here."
     cache: PipelineCache
     "Cache instance for reading previous LLM responses."
     callbacks: WorkflowCallbacks
@@ -5,14 +5,19 @@
 
 from collections.abc import Generator
 
-from graphrag.index.typing.workflow import Workflow
+from graphrag.index.typing.workflow import Workflow, WorkflowDependencies
 
 
 class Pipeline:
     """Encapsulates running workflows."""
 
-    def __init__(self, workflows: list[Workflow]):
+    def __init__(
+        self,
+        workflows: list[Workflow],
+        dependencies: dict[str, WorkflowDependencies] | None = None,
+    ):
         self.workflows = workflows
+        self.dependencies = dependencies or {}
 
     def run(self) -> Generator[Workflow]:
         """Return a Generator over the pipeline workflows."""
@@ -21,3 +26,42 @@ class Pipeline:
     def names(self) -> list[str]:
         """Return the names of the workflows in the pipeline."""
         return [name for name, _ in self.workflows]
+
+    def predecessors(self) -> list[set[int]]:
+        """Return, for each workflow position, the earlier positions it must wait for.
+
+        Edges are derived from the declared tables so that running the graph gives the same
+        result as running the list in order: a workflow waits for the last writer of each table
+        it reads, and for every earlier reader and writer of each table it writes.
+        A workflow without declared dependencies acts as a barrier.
+        """
+        last_writer: dict[str, int] = {}
+        readers: dict[str, set[int]] = {}
+        barrier: int | None = None
+        result: list[set[int]] = []
+        for index, (name, _) in enumerate(self.workflows):
+            dependencies = self.dependencies.get(name)
+            if dependencies is None:
+                result.append(set(range(index)))
+                barrier = index
+                last_writer.clear()
+                readers.clear()
+                continue
+
+            waits = {barrier} if barrier is not None else set()
+            for table in dependencies.inputs:
+                if table in last_writer:
+                    waits.add(last_writer[table])
+            for table in dependencies.outputs:
+                if table in last_writer:
+                    waits.add(last_writer[table])
+                waits.update(readers.get(table, set()))
+            waits.discard(index)
+            result.append(waits)
+
+            for table in dependencies.inputs:
+                readers.setdefault(table, set()).add(index)
+            for table in dependencies.outputs:
+                last_writer[table] = index
+                readers[table] = set()
+        return result
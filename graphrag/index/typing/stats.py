@@ -20,4 +20,7 @@ class PipelineRunStats:
     """Float representing the input load time."""
 
     workflows: dict[str, dict[str, float]] = field(default_factory=dict)
-    """A dictionary of workflows."""
+    """Resource usage per workflow, keyed by workflow name (see WorkflowProfile)."""
+
+    rate_budgets: dict[str, dict[str, float]] = field(default_factory=dict)
+    """Requests, tokens and queueing delay per model deployment since the process started (see RateBudgetStats)."""
@@ -4,7 +4,7 @@
 """Pipeline workflow types."""
 
 from collections.abc import Awaitable, Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any
 
 from graphrag.config.models.graph_rag_config import GraphRagConfig
@@ -24,3 +24,15 @@ WorkflowFunction = Callable[
     Awaitable[WorkflowFunctionOutput],
 ]
 Workflow = tuple[str, WorkflowFunction]
+
+
+@dataclass
+class WorkflowDependencies:
+    """Declares the tables a workflow reads and writes, and the config sections it depends on."""
+
+    inputs: list[str] = field(default_factory=list)
+    """Names of the tables the workflow loads from storage."""
+    outputs: list[str] = field(default_factory=list)
+    """Names of the tables the workflow writes to storage."""
+    config: list[str] = field(default_factory=list)
+    """Top-level GraphRagConfig fields that influence the workflow outputs."""
@@ -0,0 +1,206 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Adaptive concurrency limiting for LLM-bound operations.
+
+The limiter follows AIMD (additive increase, multiplicative decrease): while requests complete
+quickly and without errors the limit grows by one step per round trip, and when the service
+answers with a rate-limit response the limit is cut by a factor. The request currently holding a
+slot is kept in a context variable, so model providers can report rate limits they retry
+internally without having a reference to the limiter.
+"""
+
+import asyncio
+import logging
+import time
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+from types import TracebackType
+from typing import Any
+
+from graphrag.callbacks.workflow_callbacks import WorkflowCallbacks
+from graphrag.logger.progress import Concurrency
+
+log = logging.getLogger(__name__)
+
+RATE_LIMIT_STATUS = 429
+_LATENCY_SMOOTHING = 0.2
+
+
+@dataclass
+class _Slot:
+    generation: int
+    start: float
+    rate_limited: bool = False
+    token: Token["_Slot | None"] | None = field(default=None, repr=False)
+
+
+_current_slot: ContextVar[_Slot | None] = ContextVar("concurrency_slot", default=None)
+
+
+class AdaptiveLimiter:
+    """Async context manager that limits concurrent requests and adapts the limit to the service.
+
+    The limit starts at `initial` and grows by `increase` once per `limit` healthy completions,
+    i.e. about one step per round trip, up to `max_limit`. A completion is healthy when it did not
+    fail and the smoothed latency stays within `latency_tolerance` times the best smoothed latency
+    seen so far; other completions hold the limit. A rate-limited request multiplies the limit by
+    `decrease`, down to `min_limit`. Requests that were started before the last decrease were sent
+    under the old limit, so their rate limits do not cut the limit again.
+
+    Every limit change is reported to the `concurrency` callback together with the current
+    throughput.
+    """
+
+    def __init__(
+        self,
+        initial: int,
+        max_limit: int,
+        min_limit: int = 1,
+        increase: float = 1,
+        decrease: float = 0.5,
+        latency_tolerance: float = 2.0,
+        callbacks: WorkflowCallbacks | None = None,
+        name: str = "",
+    ):
+        if not 1 <= min_limit <= initial <= max_limit:
+            msg = f"Expected 1 <= min_limit <= initial <= max_limit, got {min_limit}, {initial}, {max_limit}"
+            raise ValueError(msg)
+        self.name = name
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self._limit = initial
+        self._increase = increase
+        self._decrease = decrease
+        self._latency_tolerance = latency_tolerance
+        self._callbacks = callbacks
+        self._condition = asyncio.Condition()
+        self._in_flight = 0
+        self._generation = 0
+        self._credit = 0.0
+        self._latency: float | None = None
+        self._best_latency: float | None = None
+        self._rate_limited = 0
+        self._window_start = time.monotonic()
+        self._window_completed = 0
+
+    @property
+    def limit(self) -> int:
+        """The number of requests currently allowed in flight."""
+        return self._limit
+
+    @property
+    def in_flight(self) -> int:
+        """The number of requests currently in flight."""
+        return self._in_flight
+
+    async def __aenter__(self) -> "AdaptiveLimiter":
+        """Wait for a free slot."""
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._in_flight < self._limit)
+            self._in_flight += 1
+        slot = _Slot(self._generation, time.monotonic())
+        slot.token = _current_slot.set(slot)
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Release the slot and adapt the limit to how the request went."""
+        slot = _current_slot.get()
+        if slot is not None and slot.token is not None:
+            _current_slot.reset(slot.token)
+            if exc is not None and is_rate_limit_error(exc):
+                slot.rate_limited = True
+            self._complete(slot, failed=exc is not None)
+        async with self._condition:
+            self._in_flight -= 1
+            self._condition.notify_all()
+
+    def _complete(self, slot: _Slot, failed: bool) -> None:
+        now = time.monotonic()
+        self._window_completed += 1
+        if slot.rate_limited:
+            self._rate_limited += 1
+            if slot.generation == self._generation:
+                self._generation += 1
+                self._set_limit(int(self._limit * self._decrease), now)
+            return
+        if failed:
+            return
+
+        latency = now - slot.start
+        self._latency = (
+            latency
+            if self._latency is None
+            else self._latency + _LATENCY_SMOOTHING * (latency - self._latency)
+        )
+        self._best_latency = min(self._best_latency or self._latency, self._latency)
+        if self._latency > self._best_latency * self._latency_tolerance:
+            return
+
+        self._credit += self._increase / self._limit
+        if self._credit >= 1:
+            self._set_limit(self._limit + int(self._credit), now)
+
+    def _set_limit(self, limit: int, now: float) -> None:
+        self._credit = 0
+        limit = max(self.min_limit, min(self.max_limit, limit))
+        if limit == self._limit:
+            return
+        self._limit = limit
+        elapsed = now - self._window_start
+        throughput = self._window_completed / elapsed if elapsed > 0 else 0
+        self._window_start = now
+        self._window_completed = 0
+        log.debug(
+            "%s concurrency limit set to %d (%.2f requests/s)",
+            self.name,
+            limit,
+            throughput,
+        )
+        if self._callbacks is not None:
+            self._callbacks.concurrency(
+                Concurrency(
+                    name=self.name,
+                    limit=limit,
+                    in_flight=self._in_flight,
+                    throughput=throughput,
+                    rate_limited=self._rate_limited,
+                )
+            )
+
+
+def create_limiter(
+    llm: dict[str, Any] | None,
+    num_threads: int,
+    callbacks: WorkflowCallbacks | None = None,
+    name: str = "",
+) -> AdaptiveLimiter | None:
+    """Create an adaptive limiter for a language model config, if it enables adaptive concurrency.
+
+    The limiter starts at `num_threads` and may grow up to the model's `max_concurrent_requests`.
+    """
+    if not llm or not llm.get("adaptive_concurrency"):
+        return None
+    return AdaptiveLimiter(
+        initial=num_threads,
+        max_limit=max(num_threads, llm.get("max_concurrent_requests") or num_threads),
+        callbacks=callbacks,
+        name=name,
+    )
+
+
+def report_rate_limit() -> None:
+    """Mark the request holding the current limiter slot as rate limited, e.g. before it is retried."""
+    if (slot := _current_slot.get()) is not None:
+        slot.rate_limited = True
+
+
+def is_rate_limit_error(error: BaseException) -> bool:
+    """Check whether an error is a rate-limit response (HTTP 429) of a model service."""
+    status = getattr(error, "status_code", None) or getattr(error, "code", None)
+    return status == RATE_LIMIT_STATUS or "RateLimit" in type(error).__name__
@@ -4,22 +4,31 @@
 """Apply a generic transform function to each row in a table."""
 
 import asyncio
+import contextlib
 import inspect
 import logging
+import math
+import pickle  # noqa: S403
 import traceback
-from collections.abc import Awaitable, Callable, Coroutine, Hashable
+from collections.abc import Awaitable, Callable, Iterable, Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
 from typing import Any, TypeVar, cast
 
+import numpy as np
 import pandas as pd
 
 from graphrag.callbacks.noop_workflow_callbacks import NoopWorkflowCallbacks
 from graphrag.callbacks.workflow_callbacks import WorkflowCallbacks
 from graphrag.config.enums import AsyncType
+from graphrag.index.utils.concurrency import AdaptiveLimiter
 from graphrag.logger.progress import progress_ticker
 
 logger = logging.getLogger(__name__)
 ItemType = TypeVar("ItemType")
 
+Row = dict[str, Any]
+"""A table row, mapping column names to values."""
+
 
 class ParallelizationError(ValueError):
     """Exception for invalid parallel processing."""
@@ -33,55 +42,98 @@ class ParallelizationError(ValueError):
 
 async def derive_from_rows(
     input: pd.DataFrame,
-    transform: Callable[[pd.Series], Awaitable[ItemType]],
+    transform: Callable[[Row], ItemType | Awaitable[ItemType]],
     callbacks: WorkflowCallbacks | None = None,
     num_threads: int = 4,
     async_type: AsyncType = AsyncType.AsyncIO,
+    initializer: Callable[..., None] | None = None,
+    initargs: tuple[Any, ...] = (),
+    limiter: AdaptiveLimiter | None = None,
+    cost: pd.Series | Sequence[float] | None = None,
 ) -> list[ItemType | None]:
-    """Apply a generic transform function to each row. Any errors will be reported and thrown."""
+    """Apply a generic transform function to each row. Any errors will be reported and thrown.
+
+    Each row is passed to the transform as a dict of column name to value.
+
+    With `AsyncType.Process` the transform runs in `num_threads` worker processes, so it must be picklable
+    (e.g. a module-level function). `initializer(*initargs)` runs once in each worker, which is where
+    expensive state such as NLP models should be set up.
+
+    With a `limiter`, the number of rows transformed at once follows the limiter instead of `num_threads`.
+
+    With a `cost` estimate per row (e.g. its `n_tokens`), the most expensive rows are started first
+    (longest processing time first), so a few large rows do not end up stretching the tail of the run.
+    The results are still returned in row order.
+    """
     callbacks = callbacks or NoopWorkflowCallbacks()
+    order = _schedule(cost, len(input)) if cost is not None else None
+    if order is not None:
+        input = input.iloc[order]
+
     match async_type:
         case AsyncType.AsyncIO:
-            return await derive_from_rows_asyncio(
-                input, transform, callbacks, num_threads
+            results = await derive_from_rows_asyncio(
+                input, transform, callbacks, num_threads, limiter
             )
         case AsyncType.Threaded:
-            return await derive_from_rows_asyncio_threads(
-                input, transform, callbacks, num_threads
+            results = await derive_from_rows_asyncio_threads(
+                input, transform, callbacks, num_threads, limiter
+            )
+        case AsyncType.Process if limiter is not None:
+            msg = "Adaptive concurrency is not supported with process scheduling"
+            raise ValueError(msg)
+        case AsyncType.Process:
+            results = await derive_from_rows_process(
+                input, transform, callbacks, num_threads, initializer, initargs
             )
         case _:
             msg = f"Unsupported scheduling type {async_type}"
             raise ValueError(msg)
 
+    if order is None:
+        return results
+    restored: list[ItemType | None] = [None] * len(results)
+    for position, index in enumerate(order):
+        restored[index] = results[position]
+    return restored
+
+
+def _schedule(cost: pd.Series | Sequence[float], num_rows: int) -> np.ndarray:
+    """Order the rows by descending cost, keeping rows of equal cost in their original order."""
+    costs = np.nan_to_num(np.asarray(cost, dtype=np.float64))
+    if len(costs) != num_rows:
+        msg = f"Expected a cost for each of the {num_rows} rows, got {len(costs)}"
+        raise ValueError(msg)
+    return np.argsort(-costs, kind="stable")
+
 
 """A module containing the derive_from_rows_async method."""
 
 
 async def derive_from_rows_asyncio_threads(
     input: pd.DataFrame,
-    transform: Callable[[pd.Series], Awaitable[ItemType]],
+    transform: Callable[[Row], ItemType | Awaitable[ItemType]],
     callbacks: WorkflowCallbacks,
     num_threads: int | None = 4,
+    limiter: AdaptiveLimiter | None = None,
 ) -> list[ItemType | None]:
     """
-    Derive from rows asynchronously.
+    Derive from rows asynchronously, calling the transform in worker threads.
 
-    This is useful for IO bound operations.
+    This is useful for blocking operations. Coroutines returned by the transform are awaited on the event loop.
     """
-    semaphore = asyncio.Semaphore(num_threads or 4)
-
-    async def gather(execute: ExecuteFn[ItemType]) -> list[ItemType | None]:
-        tasks = [asyncio.to_thread(execute, row) for row in input.iterrows()]
 
-        async def execute_task(task: Coroutine) -> ItemType | None:
-            async with semaphore:
-                # fire off the thread
-                thread = await task
-                return await thread
+    def run_in_thread(row: Row) -> Awaitable[ItemType]:
+        return asyncio.to_thread(transform, row)
 
-        return await asyncio.gather(*[execute_task(task) for task in tasks])
+    async def gather(execute: ExecuteFn[ItemType]) -> list[ItemType | None]:
+        return await _run_bounded(
+            _iter_rows(input), len(input), execute, _num_workers(num_threads, limiter)
+        )
 
-    return await _derive_from_rows_base(input, transform, callbacks, gather)
+    return await _derive_from_rows_base(
+        input, run_in_thread, callbacks, gather, limiter
+    )
 
 
 """A module containing the derive_from_rows_async method."""
@@ -89,43 +141,154 @@ async def derive_from_rows_asyncio_threads(
 
 async def derive_from_rows_asyncio(
     input: pd.DataFrame,
-    transform: Callable[[pd.Series], Awaitable[ItemType]],
+    transform: Callable[[Row], ItemType | Awaitable[ItemType]],
     callbacks: WorkflowCallbacks,
     num_threads: int = 4,
+    limiter: AdaptiveLimiter | None = None,
 ) -> list[ItemType | None]:
     """
     Derive from rows asynchronously.
 
     This is useful for IO bound operations.
     """
-    semaphore = asyncio.Semaphore(num_threads or 4)
 
     async def gather(execute: ExecuteFn[ItemType]) -> list[ItemType | None]:
-        async def execute_row_protected(
-            row: tuple[Hashable, pd.Series],
-        ) -> ItemType | None:
-            async with semaphore:
-                return await execute(row)
+        return await _run_bounded(
+            _iter_rows(input), len(input), execute, _num_workers(num_threads, limiter)
+        )
+
+    return await _derive_from_rows_base(input, transform, callbacks, gather, limiter)
+
+
+"""A module containing the derive_from_rows_process method."""
+
+
+async def derive_from_rows_process(
+    input: pd.DataFrame,
+    transform: Callable[[Row], ItemType | Awaitable[ItemType]],
+    callbacks: WorkflowCallbacks,
+    num_processes: int = 4,
+    initializer: Callable[..., None] | None = None,
+    initargs: tuple[Any, ...] = (),
+) -> list[ItemType | None]:
+    """
+    Derive from rows in a pool of worker processes.
 
-        tasks = [
-            asyncio.create_task(execute_row_protected(row)) for row in input.iterrows()
-        ]
-        return await asyncio.gather(*tasks)
+    This is useful for CPU bound operations that would otherwise be serialized by the GIL.
+    Rows are shipped to the workers in batches and the results are returned in row order.
+    """
+    num_processes = num_processes or 4
+    tick = progress_ticker(callbacks.progress, num_total=len(input))
+    errors: list[tuple[BaseException, str]] = []
+    batch_size = max(1, math.ceil(len(input) / (num_processes * 4)))
+    batches = (
+        input.iloc[start : start + batch_size]
+        for start in range(0, len(input), batch_size)
+    )
+    loop = asyncio.get_running_loop()
+
+    with ProcessPoolExecutor(
+        max_workers=num_processes, initializer=initializer, initargs=initargs
+    ) as pool:
+
+        async def execute_batch(batch: pd.DataFrame) -> list[ItemType | None]:
+            outcomes = await loop.run_in_executor(
+                pool, _execute_batch, transform, batch
+            )
+            tick(len(batch))
+            results = []
+            for result, error in outcomes:
+                if error is not None:
+                    errors.append(error)
+                results.append(result)
+            return results
+
+        # keep one batch queued per worker so the pool never idles
+        results = await _run_bounded(
+            batches,
+            math.ceil(len(input) / batch_size),
+            execute_batch,
+            num_processes * 2,
+        )
 
-    return await _derive_from_rows_base(input, transform, callbacks, gather)
+    tick.done()
+    _raise_errors(callbacks, errors)
+    return [result for batch in results for result in batch or []]
+
+
+def _execute_batch(
+    transform: Callable[[Row], Any], batch: pd.DataFrame
+) -> list[tuple[Any, tuple[BaseException, str] | None]]:
+    """Run the transform on a batch of rows inside a worker process."""
+    outcomes = []
+    for row in _iter_rows(batch):
+        try:
+            result = transform(row)
+            if inspect.iscoroutine(result):
+                result = asyncio.run(result)
+            outcomes.append((result, None))
+        except Exception as e:  # noqa: BLE001
+            stack = traceback.format_exc()
+            error: BaseException = e
+            try:
+                pickle.dumps(error)
+            except Exception:  # noqa: BLE001
+                # the error has to travel back to the parent process
+                error = RuntimeError(repr(e))
+            outcomes.append((None, (error, stack)))
+    return outcomes
 
 
 ItemType = TypeVar("ItemType")
+ValueType = TypeVar("ValueType")
 
-ExecuteFn = Callable[[tuple[Hashable, pd.Series]], Awaitable[ItemType | None]]
+ExecuteFn = Callable[[Row], Awaitable[ItemType | None]]
 GatherFn = Callable[[ExecuteFn], Awaitable[list[ItemType | None]]]
 
 
+def _num_workers(num_threads: int | None, limiter: AdaptiveLimiter | None) -> int:
+    """Start enough workers for the limiter to reach its maximum, it decides how many may run."""
+    return limiter.max_limit if limiter is not None else num_threads or 4
+
+
+def _iter_rows(input: pd.DataFrame) -> Iterator[Row]:
+    """Lazily yield each row as a dict of column name to value."""
+    columns = [str(column) for column in input.columns]
+    for values in input.itertuples(index=False, name=None):
+        yield dict(zip(columns, values, strict=True))
+
+
+async def _run_bounded(
+    items: Iterable[ValueType],
+    num_items: int,
+    execute: Callable[[ValueType], Awaitable[ItemType]],
+    concurrency: int | None,
+) -> list[ItemType | None]:
+    """Execute each item with at most `concurrency` in flight, returning results in item order.
+
+    Items are pulled from the iterable only when a worker is free, so memory and scheduling
+    overhead stay proportional to the concurrency rather than to the number of items.
+    """
+    results: list[ItemType | None] = [None] * num_items
+    queue = enumerate(items)
+
+    async def worker() -> None:
+        # the iterator is shared: each worker takes the next item once it is done with its last
+        for index, item in queue:
+            results[index] = await execute(item)
+
+    await asyncio.gather(*[
+        worker() for _ in range(min(concurrency or 4, max(num_items, 1)))
+    ])
+    return results
+
+
 async def _derive_from_rows_base(
     input: pd.DataFrame,
-    transform: Callable[[pd.Series], Awaitable[ItemType]],
+    transform: Callable[[Row], ItemType | Awaitable[ItemType]],
     callbacks: WorkflowCallbacks,
     gather: GatherFn[ItemType],
+    limiter: AdaptiveLimiter | None = None,
 ) -> list[ItemType | None]:
     """
     Derive from rows asynchronously.
@@ -135,11 +298,12 @@ async def _derive_from_rows_base(
     tick = progress_ticker(callbacks.progress, num_total=len(input))
     errors: list[tuple[BaseException, str]] = []
 
-    async def execute(row: tuple[Any, pd.Series]) -> ItemType | None:
+    async def execute(row: Row) -> ItemType | None:
         try:
-            result = transform(row[1])
-            if inspect.iscoroutine(result):
-                result = await result
+            async with limiter or contextlib.nullcontext():
+                result = transform(row)
+                while inspect.isawaitable(result):
+                    result = await result
         except Exception as e:  # noqa: BLE001
             errors.append((e, traceback.format_exc()))
             return None
@@ -151,11 +315,16 @@ async def _derive_from_rows_base(
     result = await gather(execute)
 
     tick.done()
+    _raise_errors(callbacks, errors)
+    return result
 
+
+def _raise_errors(
+    callbacks: WorkflowCallbacks, errors: list[tuple[BaseException, str]]
+) -> None:
+    """Report every error to the callbacks and raise if there were any."""
     for error, stack in errors:
         callbacks.error("parallel transformation error", error, stack)
 
     if len(errors) > 0:
         raise ParallelizationError(len(errors), errors[0][1])
-
-    return result
@@ -3,7 +3,7 @@
 
 """Hashing utilities."""
 
-from collections.abc import Iterable
+from collections.abc import Iterable, Sequence
 from hashlib import sha512
 from typing import Any
 
@@ -12,3 +12,11 @@ def gen_sha512_hash(item: dict[str, Any], hashcode: Iterable[str]):
     """Generate a SHA512 hash."""
     hashed = "".join([str(item[column]) for column in hashcode])
     return f"{sha512(hashed.encode('utf-8'), usedforsecurity=False).hexdigest()}"
+
+
+def gen_sha512_hashes(values: Sequence[Any]) -> list[str]:
+    """Generate the SHA512 hash of each value, as `gen_sha512_hash` does for a single column."""
+    return [
+        sha512(str(value).encode("utf-8"), usedforsecurity=False).hexdigest()
+        for value in values
+    ]
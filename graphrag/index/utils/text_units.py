@@ -0,0 +1,79 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Utilities for text units stored as spans of their documents."""
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pandas as pd
+
+from graphrag.data_model.schemas import (
+    DOCUMENT_ID,
+    END_CHAR,
+    ID,
+    START_CHAR,
+    TEXT,
+)
+
+if TYPE_CHECKING:
+    from graphrag.index.run.table_registry import TableRegistry
+
+
+def has_spans(text_units: pd.DataFrame) -> bool:
+    """Check whether text units reference spans of their documents."""
+    return DOCUMENT_ID in text_units.columns
+
+
+def drop_spanned_text(text_units: pd.DataFrame) -> pd.DataFrame:
+    """Drop the text of the text units that can be read back from their document span."""
+    if not has_spans(text_units):
+        return text_units
+    output = text_units.copy()
+    output[TEXT] = output[TEXT].where(output[DOCUMENT_ID].isna(), None)
+    return output
+
+
+def materialize_text(text_units: pd.DataFrame, documents: pd.DataFrame) -> pd.DataFrame:
+    """Fill in the text of the text units that only reference a span of their document."""
+    if not has_spans(text_units):
+        return text_units
+    missing = text_units[TEXT].isna() & text_units[DOCUMENT_ID].notna()
+    if not missing.any():
+        return text_units
+    document_text = dict(zip(documents[ID], documents[TEXT], strict=True))
+    spans = text_units.loc[missing, [DOCUMENT_ID, START_CHAR, END_CHAR]]
+    output = text_units.copy()
+    output.loc[missing, TEXT] = [
+        document_text[document_id][start:end]
+        for document_id, start, end in zip(
+            spans[DOCUMENT_ID],
+            spans[START_CHAR].astype(int),
+            spans[END_CHAR].astype(int),
+            strict=True,
+        )
+    ]
+    return output
+
+
+async def load_text_units(tables: "TableRegistry") -> pd.DataFrame:
+    """Load the text units of a pipeline run with their text, reading spans back from the documents."""
+    text_units = await tables.load("text_units")
+    if has_spans(text_units) and text_units[TEXT].isna().any():
+        text_units = materialize_text(text_units, await tables.load("documents"))
+    return text_units
+
+
+def deduplicate_text(
+    text_units: pd.DataFrame, column: str = TEXT
+) -> tuple[pd.DataFrame, np.ndarray]:
+    """Keep the first text unit of each distinct text.
+
+    Returns the distinct text units and, for each input text unit, the position of the distinct
+    text unit with the same text, so results computed once per text can be fanned back out.
+    """
+    codes, uniques = pd.factorize(text_units[column], use_na_sentinel=False)
+    if len(uniques) == len(text_units):
+        return text_units, codes
+    _, first = np.unique(codes, return_index=True)
+    return text_units.iloc[first], codes
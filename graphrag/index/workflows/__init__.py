@@ -4,6 +4,7 @@
 
 """A package containing all built-in workflow definitions."""
 
+from graphrag.index.typing.workflow import WorkflowDependencies
 from graphrag.index.workflows.factory import PipelineFactory
 
 from .create_base_text_units import (
@@ -33,6 +34,9 @@ from .extract_graph import (
 from .extract_graph_nlp import (
     run_workflow as run_extract_graph_nlp,
 )
+from .extract_graph_streaming import (
+    run_workflow as run_extract_graph_streaming,
+)
 from .finalize_graph import (
     run_workflow as run_finalize_graph,
 )
@@ -43,6 +47,66 @@ from .prune_graph import (
     run_workflow as run_prune_graph,
 )
 
+# tables and config sections each built-in workflow depends on
+# these are used to fingerprint workflow outputs so an interrupted run can resume
+_graph_tables = ["entities", "relationships"]
+_dependencies = {
+    "create_base_text_units": WorkflowDependencies(
+        inputs=["documents"], outputs=["text_units"], config=["chunks"]
+    ),
+    "create_communities": WorkflowDependencies(
+        inputs=_graph_tables, outputs=["communities"], config=["cluster_graph"]
+    ),
+    "create_community_reports_text": WorkflowDependencies(
+        inputs=["entities", "communities", "text_units"],
+        outputs=["community_reports"],
+        config=["community_reports", "models"],
+    ),
+    "create_community_reports": WorkflowDependencies(
+        inputs=[*_graph_tables, "communities", "covariates"],
+        outputs=["community_reports"],
+        config=["community_reports", "extract_claims", "models"],
+    ),
+    "extract_covariates": WorkflowDependencies(
+        inputs=["text_units"],
+        outputs=["covariates"],
+        config=["extract_claims", "models"],
+    ),
+    "create_final_documents": WorkflowDependencies(
+        inputs=["documents", "text_units"], outputs=["documents"]
+    ),
+    "create_final_text_units": WorkflowDependencies(
+        inputs=["text_units", *_graph_tables, "covariates"],
+        outputs=["text_units"],
+        config=["extract_claims"],
+    ),
+    "extract_graph_nlp": WorkflowDependencies(
+        inputs=["text_units"], outputs=_graph_tables, config=["extract_graph_nlp"]
+    ),
+    "extract_graph": WorkflowDependencies(
+        inputs=["text_units"],
+        outputs=_graph_tables,
+        config=["extract_graph", "summarize_descriptions", "models"],
+    ),
+    "extract_graph_streaming": WorkflowDependencies(
+        inputs=["documents"],
+        outputs=["text_units", *_graph_tables],
+        config=["chunks", "extract_graph", "summarize_descriptions", "models"],
+    ),
+    "finalize_graph": WorkflowDependencies(
+        inputs=_graph_tables,
+        outputs=_graph_tables,
+        config=["embed_graph", "umap", "snapshots"],
+    ),
+    "generate_text_embeddings": WorkflowDependencies(
+        inputs=["documents", "text_units", *_graph_tables],
+        config=["embed_text", "vector_store", "snapshots", "models"],
+    ),
+    "prune_graph": WorkflowDependencies(
+        inputs=_graph_tables, outputs=_graph_tables, config=["prune_graph"]
+    ),
+}
+
 # register all of our built-in workflows at once
 PipelineFactory.register_all({
     "create_base_text_units": run_create_base_text_units,
@@ -54,7 +118,9 @@ PipelineFactory.register_all({
     "create_final_text_units": run_create_final_text_units,
     "extract_graph_nlp": run_extract_graph_nlp,
     "extract_graph": run_extract_graph,
+    "extract_graph_streaming": run_extract_graph_streaming,
     "finalize_graph": run_finalize_graph,
     "generate_text_embeddings": run_generate_text_embeddings,
     "prune_graph": run_prune_graph,
 })
+PipelineFactory.dependencies.update(_dependencies)
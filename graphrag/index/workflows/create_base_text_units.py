@@ -4,20 +4,24 @@
 """A module containing run_workflow method definition."""
 
 import json
-from typing import Any, cast
+import logging
+from typing import cast
 
 import pandas as pd
 
 from graphrag.callbacks.workflow_callbacks import WorkflowCallbacks
 from graphrag.config.models.chunking_config import ChunkStrategyType
 from graphrag.config.models.graph_rag_config import GraphRagConfig
-from graphrag.index.operations.chunk_text.chunk_text import chunk_text
+from graphrag.data_model.schemas import TEXT_UNITS_SPAN_COLUMNS
+from graphrag.index.operations.chunk_text.chunk_text import chunk_text_groups
 from graphrag.index.operations.chunk_text.strategies import get_encoding_fn
 from graphrag.index.typing.context import PipelineRunContext
 from graphrag.index.typing.workflow import WorkflowFunctionOutput
-from graphrag.index.utils.hashing import gen_sha512_hash
+from graphrag.index.utils.hashing import gen_sha512_hashes
+from graphrag.index.utils.text_units import drop_spanned_text
 from graphrag.logger.progress import Progress
-from graphrag.utils.storage import load_table_from_storage, write_table_to_storage
+
+log = logging.getLogger(__name__)
 
 
 async def run_workflow(
@@ -25,7 +29,7 @@ async def run_workflow(
     context: PipelineRunContext,
 ) -> WorkflowFunctionOutput:
     """All the steps to transform base text_units."""
-    documents = await load_table_from_storage("documents", context.storage)
+    documents = await context.tables.load("documents")
 
     chunks = config.chunks
 
@@ -39,9 +43,11 @@ async def run_workflow(
         strategy=chunks.strategy,
         prepend_metadata=chunks.prepend_metadata,
         chunk_size_includes_metadata=chunks.chunk_size_includes_metadata,
+        spans=chunks.store_spans,
+        num_processes=chunks.num_processes,
     )
 
-    await write_table_to_storage(output, "text_units", context.storage)
+    await context.tables.write("text_units", drop_spanned_text(output))
 
     return WorkflowFunctionOutput(result=output)
 
@@ -56,8 +62,18 @@ def create_base_text_units(
     strategy: ChunkStrategyType,
     prepend_metadata: bool = False,
     chunk_size_includes_metadata: bool = False,
+    spans: bool = False,
+    num_processes: int = 1,
 ) -> pd.DataFrame:
-    """All the steps to transform base text_units."""
+    """All the steps to transform base text_units.
+
+    With `spans`, text units also record the span of their document they were cut from, see
+    `chunk_text_groups`. Chunks with prepended metadata are not a span of their document, so
+    `prepend_metadata` turns spans off.
+    """
+    if spans and prepend_metadata:
+        log.warning("Text units with prepended metadata are not stored as spans")
+        spans = False
     sort = documents.sort_values(by=["id"], ascending=[True])
 
     sort["text_with_ids"] = list(
@@ -81,69 +97,58 @@ def create_base_text_units(
     )
     aggregated.rename(columns={"text_with_ids": "texts"}, inplace=True)
 
-    def chunker(row: dict[str, Any]) -> Any:
-        line_delimiter = ".\n"
-        metadata_str = ""
-        metadata_tokens = 0
-
-        if prepend_metadata and "metadata" in row:
-            metadata = row["metadata"]
+    line_delimiter = ".\n"
+    metadata_strs = [""] * len(aggregated)
+    if prepend_metadata and "metadata" in aggregated:
+        for index, metadata in enumerate(aggregated["metadata"]):
             if isinstance(metadata, str):
                 metadata = json.loads(metadata)
             if isinstance(metadata, dict):
-                metadata_str = (
+                metadata_strs[index] = (
                     line_delimiter.join(f"{k}: {v}" for k, v in metadata.items())
                     + line_delimiter
                 )
 
-            if chunk_size_includes_metadata:
-                encode, _ = get_encoding_fn(encoding_model)
-                metadata_tokens = len(encode(metadata_str))
-                if metadata_tokens >= size:
-                    message = "Metadata tokens exceeds the maximum tokens per chunk. Please increase the tokens per chunk."
-                    raise ValueError(message)
-
-        chunked = chunk_text(
-            pd.DataFrame([row]).reset_index(drop=True),
-            column="texts",
-            size=size - metadata_tokens,
-            overlap=overlap,
-            encoding_model=encoding_model,
-            strategy=strategy,
-            callbacks=callbacks,
-        )[0]
-
-        if prepend_metadata:
-            for index, chunk in enumerate(chunked):
-                if isinstance(chunk, str):
-                    chunked[index] = metadata_str + chunk
-                else:
-                    chunked[index] = (
-                        (chunk[0], metadata_str + chunk[1], chunk[2]) if chunk else None
-                    )
-
-        row["chunks"] = chunked
-        return row
-
-    aggregated = aggregated.apply(lambda row: chunker(row), axis=1)
-
-    aggregated = cast("pd.DataFrame", aggregated[[*group_by_columns, "chunks"]])
-    aggregated = aggregated.explode("chunks")
-    aggregated.rename(
-        columns={
-            "chunks": "chunk",
-        },
-        inplace=True,
-    )
-    aggregated["id"] = aggregated.apply(
-        lambda row: gen_sha512_hash(row, ["chunk"]), axis=1
-    )
-    aggregated[["document_ids", "chunk", "n_tokens"]] = pd.DataFrame(
-        aggregated["chunk"].tolist(), index=aggregated.index
+    sizes = [size] * len(aggregated)
+    if prepend_metadata and chunk_size_includes_metadata and "metadata" in aggregated:
+        encode, _ = get_encoding_fn(encoding_model)
+        for index, metadata_str in enumerate(metadata_strs):
+            metadata_tokens = len(encode(metadata_str))
+            if metadata_tokens >= size:
+                message = "Metadata tokens exceeds the maximum tokens per chunk. Please increase the tokens per chunk."
+                raise ValueError(message)
+            sizes[index] = size - metadata_tokens
+
+    chunks = chunk_text_groups(
+        aggregated["texts"].tolist(),
+        sizes,
+        overlap=overlap,
+        encoding_model=encoding_model,
+        strategy=strategy,
+        callbacks=callbacks,
+        spans=spans,
+        num_processes=num_processes,
     )
-    # rename for downstream consumption
-    aggregated.rename(columns={"chunk": "text"}, inplace=True)
 
-    return cast(
-        "pd.DataFrame", aggregated[aggregated["text"].notna()].reset_index(drop=True)
+    groups = chunks["group"].tolist()
+    texts = chunks["text"].tolist()
+    if prepend_metadata:
+        texts = [
+            metadata_strs[group] + text
+            for group, text in zip(groups, texts, strict=True)
+        ]
+    document_ids = chunks["document_ids"].tolist()
+    n_tokens = chunks["n_tokens"].tolist()
+
+    output = cast(
+        "pd.DataFrame", aggregated[group_by_columns].iloc[groups]
+    ).reset_index(drop=True)
+    output["text"] = texts
+    output["id"] = gen_sha512_hashes(
+        list(zip(document_ids, texts, n_tokens, strict=True))
     )
+    output["document_ids"] = document_ids
+    output["n_tokens"] = chunks["n_tokens"]
+    if spans:
+        output[TEXT_UNITS_SPAN_COLUMNS] = chunks[TEXT_UNITS_SPAN_COLUMNS]
+    return output
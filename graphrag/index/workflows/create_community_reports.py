@@ -26,11 +26,6 @@ from graphrag.index.operations.summarize_communities.summarize_communities impor
 )
 from graphrag.index.typing.context import PipelineRunContext
 from graphrag.index.typing.workflow import WorkflowFunctionOutput
-from graphrag.utils.storage import (
-    load_table_from_storage,
-    storage_has_table,
-    write_table_to_storage,
-)
 
 
 async def run_workflow(
@@ -38,14 +33,12 @@ async def run_workflow(
     context: PipelineRunContext,
 ) -> WorkflowFunctionOutput:
     """All the steps to transform community reports."""
-    edges = await load_table_from_storage("relationships", context.storage)
-    entities = await load_table_from_storage("entities", context.storage)
-    communities = await load_table_from_storage("communities", context.storage)
+    edges = await context.tables.load("relationships")
+    entities = await context.tables.load("entities")
+    communities = await context.tables.load("communities")
     claims = None
-    if config.extract_claims.enabled and await storage_has_table(
-        "covariates", context.storage
-    ):
-        claims = await load_table_from_storage("covariates", context.storage)
+    if config.extract_claims.enabled and await context.tables.has("covariates"):
+        claims = await context.tables.load("covariates")
 
     community_reports_llm_settings = config.get_language_model_config(
         config.community_reports.model_id
@@ -68,7 +61,7 @@ async def run_workflow(
     #     num_threads=num_threads,
     # )
 
-    await write_table_to_storage(pd.DataFrame(), "community_reports", context.storage)
+    await context.tables.write("community_reports", pd.DataFrame())
 
     return WorkflowFunctionOutput(result=pd.DataFrame())
 
@@ -27,7 +27,7 @@ from graphrag.index.operations.summarize_communities.text_unit_context.context_b
 )
 from graphrag.index.typing.context import PipelineRunContext
 from graphrag.index.typing.workflow import WorkflowFunctionOutput
-from graphrag.utils.storage import load_table_from_storage, write_table_to_storage
+from graphrag.index.utils.text_units import load_text_units
 
 log = logging.getLogger(__name__)
 
@@ -37,10 +37,10 @@ async def run_workflow(
     context: PipelineRunContext,
 ) -> WorkflowFunctionOutput:
     """All the steps to transform community reports."""
-    entities = await load_table_from_storage("entities", context.storage)
-    communities = await load_table_from_storage("communities", context.storage)
+    entities = await context.tables.load("entities")
+    communities = await context.tables.load("communities")
 
-    text_units = await load_table_from_storage("text_units", context.storage)
+    text_units = await load_text_units(context.tables)
 
     community_reports_llm_settings = config.get_language_model_config(
         config.community_reports.model_id
@@ -62,7 +62,7 @@ async def run_workflow(
         num_threads=num_threads,
     )
 
-    await write_table_to_storage(output, "community_reports", context.storage)
+    await context.tables.write("community_reports", output)
 
     return WorkflowFunctionOutput(result=output)
 
@@ -6,14 +6,13 @@
 import pandas as pd
 
 from graphrag.config.models.graph_rag_config import GraphRagConfig
-from graphrag.data_model.schemas import TEXT_UNITS_FINAL_COLUMNS
+from graphrag.data_model.schemas import (
+    TEXT_UNITS_FINAL_COLUMNS,
+    TEXT_UNITS_SPAN_COLUMNS,
+)
 from graphrag.index.typing.context import PipelineRunContext
 from graphrag.index.typing.workflow import WorkflowFunctionOutput
-from graphrag.utils.storage import (
-    load_table_from_storage,
-    storage_has_table,
-    write_table_to_storage,
-)
+from graphrag.index.utils.text_units import has_spans
 
 
 async def run_workflow(
@@ -21,16 +20,12 @@ async def run_workflow(
     context: PipelineRunContext,
 ) -> WorkflowFunctionOutput:
     """All the steps to transform the text units."""
-    text_units = await load_table_from_storage("text_units", context.storage)
-    final_entities = await load_table_from_storage("entities", context.storage)
-    final_relationships = await load_table_from_storage(
-        "relationships", context.storage
-    )
+    text_units = await context.tables.load("text_units")
+    final_entities = await context.tables.load("entities")
+    final_relationships = await context.tables.load("relationships")
     final_covariates = None
-    if config.extract_claims.enabled and await storage_has_table(
-        "covariates", context.storage
-    ):
-        final_covariates = await load_table_from_storage("covariates", context.storage)
+    if config.extract_claims.enabled and await context.tables.has("covariates"):
+        final_covariates = await context.tables.load("covariates")
 
     output = create_final_text_units(
         text_units,
@@ -39,7 +34,7 @@ async def run_workflow(
         final_covariates,
     )
 
-    await write_table_to_storage(output, "text_units", context.storage)
+    await context.tables.write("text_units", output)
 
     return WorkflowFunctionOutput(result=output)
 
@@ -51,7 +46,10 @@ def create_final_text_units(
     final_covariates: pd.DataFrame | None,
 ) -> pd.DataFrame:
     """All the steps to transform the text units."""
-    selected = text_units.loc[:, ["id", "text", "document_ids", "n_tokens"]]
+    span_columns = TEXT_UNITS_SPAN_COLUMNS if has_spans(text_units) else []
+    selected = text_units.loc[
+        :, ["id", "text", "document_ids", "n_tokens", *span_columns]
+    ]
     selected["human_readable_id"] = selected.index + 1
 
     entity_join = _entities(final_entities)
@@ -71,7 +69,7 @@ def create_final_text_units(
 
     return aggregated.loc[
         :,
-        TEXT_UNITS_FINAL_COLUMNS,
+        [*TEXT_UNITS_FINAL_COLUMNS, *span_columns],
     ]
 
 
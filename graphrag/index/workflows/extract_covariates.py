@@ -18,7 +18,7 @@ from graphrag.index.operations.extract_covariates.extract_covariates import (
 )
 from graphrag.index.typing.context import PipelineRunContext
 from graphrag.index.typing.workflow import WorkflowFunctionOutput
-from graphrag.utils.storage import load_table_from_storage, write_table_to_storage
+from graphrag.index.utils.text_units import load_text_units
 
 
 async def run_workflow(
@@ -26,7 +26,7 @@ async def run_workflow(
     context: PipelineRunContext,
 ) -> WorkflowFunctionOutput:
     """All the steps to extract and format covariates."""
-    text_units = await load_table_from_storage("text_units", context.storage)
+    text_units = await load_text_units(context.tables)
 
     extract_claims_llm_settings = config.get_language_model_config(
         config.extract_claims.model_id
@@ -49,7 +49,7 @@ async def run_workflow(
         num_threads=num_threads,
     )
 
-    await write_table_to_storage(output, "covariates", context.storage)
+    await context.tables.write("covariates", output)
 
     return WorkflowFunctionOutput(result=output)
 
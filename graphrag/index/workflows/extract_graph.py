@@ -19,7 +19,8 @@ from graphrag.index.operations.summarize_descriptions import (
 )
 from graphrag.index.typing.context import PipelineRunContext
 from graphrag.index.typing.workflow import WorkflowFunctionOutput
-from graphrag.utils.storage import load_table_from_storage, write_table_to_storage
+from graphrag.index.utils.text_units import load_text_units
+from graphrag.storage.pipeline_storage import PipelineStorage
 
 
 async def run_workflow(
@@ -27,7 +28,7 @@ async def run_workflow(
     context: PipelineRunContext,
 ) -> WorkflowFunctionOutput:
     """All the steps to create the base entity graph."""
-    text_units = await load_table_from_storage("text_units", context.storage)
+    text_units = await load_text_units(context.tables)
 
     extract_graph_llm_settings = config.get_language_model_config(
         config.extract_graph.model_id
@@ -53,10 +54,11 @@ async def run_workflow(
         entity_types=config.extract_graph.entity_types,
         summarization_strategy=summarization_strategy,
         summarization_num_threads=summarization_llm_settings.concurrent_requests,
+        snapshot_storage=context.storage if config.snapshots.raw_graph else None,
     )
 
-    await write_table_to_storage(entities, "entities", context.storage)
-    await write_table_to_storage(relationships, "relationships", context.storage)
+    await context.tables.write("entities", entities)
+    await context.tables.write("relationships", relationships)
 
     return WorkflowFunctionOutput(
         result={
@@ -76,6 +78,7 @@ async def extract_graph(
     entity_types: list[str] | None = None,
     summarization_strategy: dict[str, Any] | None = None,
     summarization_num_threads: int = 4,
+    snapshot_storage: PipelineStorage | None = None,
 ) -> tuple[pd.DataFrame, pd.DataFrame]:
     """All the steps to create the base entity graph."""
     # this returns a graph for each text unit, to be merged later
@@ -89,6 +92,7 @@ async def extract_graph(
         async_mode=extraction_async_mode,
         entity_types=entity_types,
         num_threads=extraction_num_threads,
+        snapshot_storage=snapshot_storage,
     )
 
     if not _validate_data(extracted_entities):
@@ -14,7 +14,7 @@ from graphrag.index.operations.build_noun_graph.np_extractors.factory import (
 )
 from graphrag.index.typing.context import PipelineRunContext
 from graphrag.index.typing.workflow import WorkflowFunctionOutput
-from graphrag.utils.storage import load_table_from_storage, write_table_to_storage
+from graphrag.index.utils.text_units import load_text_units
 
 
 async def run_workflow(
@@ -22,7 +22,7 @@ async def run_workflow(
     context: PipelineRunContext,
 ) -> WorkflowFunctionOutput:
     """All the steps to create the base entity graph."""
-    text_units = await load_table_from_storage("text_units", context.storage)
+    text_units = await load_text_units(context.tables)
 
     entities, relationships = await extract_graph_nlp(
         text_units,
@@ -30,8 +30,8 @@ async def run_workflow(
         extraction_config=config.extract_graph_nlp,
     )
 
-    await write_table_to_storage(entities, "entities", context.storage)
-    await write_table_to_storage(relationships, "relationships", context.storage)
+    await context.tables.write("entities", entities)
+    await context.tables.write("relationships", relationships)
 
     return WorkflowFunctionOutput(
         result={
@@ -55,6 +55,8 @@ async def extract_graph_nlp(
         normalize_edge_weights=extraction_config.normalize_edge_weights,
         num_threads=extraction_config.concurrent_requests,
         cache=cache,
+        async_mode=extraction_config.async_mode,
+        text_analyzer_config=text_analyzer_config,
     )
 
     # add in any other columns required by downstream workflows
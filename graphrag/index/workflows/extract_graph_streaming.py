@@ -0,0 +1,393 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""A module containing run_workflow method definition."""
+
+import asyncio
+import copy
+import io
+import logging
+from typing import Any, cast
+
+import pandas as pd
+import pyarrow.parquet as pq
+
+from graphrag.cache.pipeline_cache import PipelineCache
+from graphrag.callbacks.workflow_callbacks import WorkflowCallbacks
+from graphrag.config.enums import AsyncType
+from graphrag.config.models.chunking_config import ChunkingConfig
+from graphrag.config.models.graph_rag_config import GraphRagConfig
+from graphrag.index.operations.extract_graph.extract_graph import (
+    extract_graph as extractor,
+)
+from graphrag.index.run.profiling import record_table_read, record_table_write
+from graphrag.index.typing.context import PipelineRunContext
+from graphrag.index.typing.workflow import WorkflowFunctionOutput
+from graphrag.index.utils.text_units import drop_spanned_text
+from graphrag.index.workflows.create_base_text_units import create_base_text_units
+from graphrag.index.workflows.extract_graph import (
+    get_summarized_entities_relationships,
+)
+from graphrag.storage.pipeline_storage import PipelineStorage
+from graphrag.utils.storage import (
+    delete_table_from_storage,
+    load_table_from_storage,
+    write_table_to_storage,
+)
+
+log = logging.getLogger(__name__)
+
+
+async def run_workflow(
+    config: GraphRagConfig,
+    context: PipelineRunContext,
+) -> WorkflowFunctionOutput:
+    """Chunk the documents and extract the base entity graph in micro-batches."""
+    documents = await context.tables.load("documents")
+
+    extract_graph_llm_settings = config.get_language_model_config(
+        config.extract_graph.model_id
+    )
+    extraction_strategy = config.extract_graph.resolved_strategy(
+        config.root_dir, extract_graph_llm_settings
+    )
+
+    summarization_llm_settings = config.get_language_model_config(
+        config.summarize_descriptions.model_id
+    )
+    summarization_strategy = config.summarize_descriptions.resolved_strategy(
+        config.root_dir, summarization_llm_settings
+    )
+
+    entities, relationships = await extract_graph_streaming(
+        documents=documents,
+        callbacks=context.callbacks,
+        cache=context.cache,
+        partitions=context.storage.child("partitions"),
+        text_units_storage=context.storage,
+        chunks=config.chunks,
+        batch_size=config.streaming.batch_size,
+        extraction_strategy=extraction_strategy,
+        extraction_num_threads=extract_graph_llm_settings.concurrent_requests,
+        extraction_async_mode=extract_graph_llm_settings.async_mode,
+        entity_types=config.extract_graph.entity_types,
+        summarization_strategy=summarization_strategy,
+        summarization_num_threads=summarization_llm_settings.concurrent_requests,
+        snapshot_storage=context.storage if config.snapshots.raw_graph else None,
+    )
+
+    await context.tables.write("entities", entities)
+    await context.tables.write("relationships", relationships)
+
+    return WorkflowFunctionOutput(
+        result={
+            "entities": entities,
+            "relationships": relationships,
+        }
+    )
+
+
+async def extract_graph_streaming(
+    documents: pd.DataFrame,
+    callbacks: WorkflowCallbacks,
+    cache: PipelineCache,
+    partitions: PipelineStorage,
+    text_units_storage: PipelineStorage,
+    chunks: ChunkingConfig,
+    batch_size: int,
+    extraction_strategy: dict[str, Any] | None = None,
+    extraction_num_threads: int = 4,
+    extraction_async_mode: AsyncType = AsyncType.AsyncIO,
+    entity_types: list[str] | None = None,
+    summarization_strategy: dict[str, Any] | None = None,
+    summarization_num_threads: int = 4,
+    snapshot_storage: PipelineStorage | None = None,
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Chunk and extract each micro-batch of documents, spilling its results to partitions.
+
+    The text units of a batch and its merged records are written in the background while the next
+    batch is extracted. The records are spilled in hash buckets of their merge keys, with one bucket
+    per batch, and each bucket is then merged and summarized on its own, so only one batch of text
+    units and one bucket of records is held at a time. The text units are written to
+    `text_units_storage` one partition at a time. Only the summarized graph that is returned is held
+    in full. The outputs match running create_base_text_units followed by extract_graph.
+    """
+    if len(chunks.group_by_columns) == 0:
+        log.warning(
+            "chunks.group_by_columns is empty, so all documents form one chunking group and are extracted in a single micro-batch"
+        )
+    batches = _batch_documents(documents, chunks.group_by_columns, batch_size)
+    buckets = len(batches)
+    log.info("streaming %d documents in %d micro-batches", len(documents), buckets)
+
+    extracted_entities = extracted_relationships = 0
+    # partitions written by this run, so leftovers of an interrupted run are never read
+    spilled: set[str] = set()
+    spills: list[asyncio.Task] = []
+    try:
+        for index, batch in enumerate(batches):
+            text_units = create_base_text_units(
+                batch,
+                callbacks,
+                chunks.group_by_columns,
+                chunks.size,
+                chunks.overlap,
+                chunks.encoding_model,
+                strategy=chunks.strategy,
+                prepend_metadata=chunks.prepend_metadata,
+                chunk_size_includes_metadata=chunks.chunk_size_includes_metadata,
+                spans=chunks.store_spans,
+                num_processes=chunks.num_processes,
+            )
+            if len(text_units) == 0:
+                continue
+            spilled.add(f"text_units.{index}")
+            spills.append(
+                asyncio.create_task(
+                    write_table_to_storage(
+                        drop_spanned_text(text_units), f"text_units.{index}", partitions
+                    )
+                )
+            )
+
+            entities, relationships = await extractor(
+                text_units=text_units,
+                callbacks=callbacks,
+                cache=cache,
+                text_column="text",
+                id_column="id",
+                strategy=extraction_strategy,
+                async_mode=extraction_async_mode,
+                entity_types=entity_types,
+                num_threads=extraction_num_threads,
+                snapshot_storage=snapshot_storage,
+                snapshot_suffix=f".{index}",
+            )
+            extracted_entities += len(entities)
+            extracted_relationships += len(relationships)
+            spills.extend(
+                _spill_buckets(
+                    entities, "entities", ["title"], index, buckets, partitions, spilled
+                )
+            )
+            spills.extend(
+                _spill_buckets(
+                    relationships,
+                    "relationships",
+                    ["source", "target"],
+                    index,
+                    buckets,
+                    partitions,
+                    spilled,
+                )
+            )
+        await asyncio.gather(*spills)
+    finally:
+        for spill in spills:
+            spill.cancel()
+
+    if extracted_entities == 0:
+        error_msg = "Entity Extraction failed. No entities detected during extraction."
+        callbacks.error(error_msg)
+        raise ValueError(error_msg)
+
+    if extracted_relationships == 0:
+        error_msg = (
+            "Entity Extraction failed. No relationships detected during extraction."
+        )
+        callbacks.error(error_msg)
+        raise ValueError(error_msg)
+
+    await _write_partitions(
+        "text_units", len(batches), partitions, spilled, text_units_storage
+    )
+
+    summarized_entities = []
+    summarized_relationships = []
+    for bucket in range(buckets):
+        bucket_entities = await _merge_partitions(
+            f"entities.{bucket}",
+            len(batches),
+            partitions,
+            spilled,
+            _MergedRecords(("title", "type"), "frequency"),
+        )
+        bucket_relationships = await _merge_partitions(
+            f"relationships.{bucket}",
+            len(batches),
+            partitions,
+            spilled,
+            _MergedRecords(("source", "target"), "weight"),
+        )
+        if len(bucket_entities) == 0 and len(bucket_relationships) == 0:
+            continue
+        entities, relationships = await get_summarized_entities_relationships(
+            extracted_entities=bucket_entities,
+            extracted_relationships=bucket_relationships,
+            callbacks=callbacks,
+            cache=cache,
+            # summarization fills in settings derived from the size of its input
+            summarization_strategy=copy.deepcopy(summarization_strategy),
+            summarization_num_threads=summarization_num_threads,
+        )
+        summarized_entities.append(entities)
+        summarized_relationships.append(relationships)
+
+    return (
+        _in_first_seen_order(summarized_entities),
+        _in_first_seen_order(summarized_relationships),
+    )
+
+
+def _batch_documents(
+    documents: pd.DataFrame, group_by_columns: list[str], batch_size: int
+) -> list[pd.DataFrame]:
+    """Split documents into micro-batches of whole chunking groups, in the order create_base_text_units visits them.
+
+    Without group-by columns, all documents form one chunking group, and therefore one batch, so
+    chunks can still span documents.
+    """
+    sort = documents.sort_values(by=["id"], ascending=[True])
+    if len(group_by_columns) == 0:
+        return [sort]
+    batch_size = max(batch_size, 1)
+    group_index = sort.groupby(group_by_columns, sort=False).ngroup()
+    batch_index = group_index // batch_size
+    return [
+        cast("pd.DataFrame", batch) for _, batch in sort.groupby(batch_index, sort=True)
+    ]
+
+
+def _spill_buckets(
+    records: pd.DataFrame,
+    name: str,
+    keys: list[str],
+    index: int,
+    buckets: int,
+    partitions: PipelineStorage,
+    spilled: set[str],
+) -> list[asyncio.Task]:
+    """Write the merged records of a batch to one partition per hash bucket of their keys, in the background."""
+    records = records.assign(_batch=index, _position=range(len(records)))
+    bucket = pd.util.hash_pandas_object(records[keys], index=False) % buckets
+    spills = []
+    for key, part in records.groupby(bucket.to_numpy(), sort=False):
+        spilled.add(f"{name}.{key}.{index}")
+        spills.append(
+            asyncio.create_task(
+                write_table_to_storage(part, f"{name}.{key}.{index}", partitions)
+            )
+        )
+    return spills
+
+
+async def _merge_partitions(
+    name: str,
+    count: int,
+    partitions: PipelineStorage,
+    spilled: set[str],
+    merged: "_MergedRecords",
+) -> pd.DataFrame:
+    """Fold every spilled partition of a bucket into `merged` in batch order, removing the partitions."""
+    for index in range(count):
+        partition = f"{name}.{index}"
+        if partition in spilled:
+            merged.add(await load_table_from_storage(partition, partitions))
+            await delete_table_from_storage(partition, partitions)
+    return merged.to_frame()
+
+
+async def _write_partitions(
+    name: str,
+    count: int,
+    partitions: PipelineStorage,
+    spilled: set[str],
+    storage: PipelineStorage,
+) -> None:
+    """Write the spilled partitions of a table to storage as one table, loading and removing one partition at a time."""
+    buffer = io.BytesIO()
+    writer: pq.ParquetWriter | None = None
+    rows = 0
+    try:
+        for index in range(count):
+            partition = f"{name}.{index}.parquet"
+            if f"{name}.{index}" not in spilled:
+                continue
+            data = await partitions.get(partition, as_bytes=True)
+            table = pq.read_table(io.BytesIO(data))
+            record_table_read(table.num_rows, len(data))
+            if writer is None:
+                writer = pq.ParquetWriter(buffer, table.schema)
+            writer.write_table(table.cast(writer.schema))
+            rows += table.num_rows
+            await partitions.delete(partition)
+    finally:
+        if writer is not None:
+            writer.close()
+    data = buffer.getvalue()
+    record_table_write(rows, len(data))
+    await storage.set(f"{name}.parquet", data)
+
+
+def _in_first_seen_order(tables: list[pd.DataFrame]) -> pd.DataFrame:
+    """Concatenate the records of every bucket in the order a single merge would list them."""
+    return (
+        pd.concat(tables, ignore_index=True)
+        .sort_values(["_batch", "_position"], kind="stable")
+        .drop(columns=["_batch", "_position"])
+        .reset_index(drop=True)
+    )
+
+
+class _MergedRecords:
+    """Merged entities or relationships, folded in one micro-batch at a time.
+
+    Each table is grouped by two key columns, with its description and text unit id lists
+    concatenated and one numeric column summed. Groups keep the `_batch` and `_position` of their
+    first appearance and lists the batch order, so once sorted by those the result matches merging
+    the raw records of every batch at once.
+    """
+
+    def __init__(self, keys: tuple[str, str], total: str):
+        self.keys = keys
+        self.total = total
+        self._groups: dict[tuple[str, str], int] = {}
+        self._descriptions: list[list[str]] = []
+        self._text_unit_ids: list[list[str]] = []
+        self._totals: list[Any] = []
+        self._first_seen: list[tuple[int, int]] = []
+
+    def add(self, merged: pd.DataFrame) -> None:
+        """Fold the merged records of a micro-batch into the records so far."""
+        for first, second, descriptions, text_unit_ids, total, batch, position in zip(
+            merged[self.keys[0]],
+            merged[self.keys[1]],
+            merged["description"],
+            merged["text_unit_ids"],
+            merged[self.total],
+            merged["_batch"],
+            merged["_position"],
+            strict=True,
+        ):
+            group = self._groups.setdefault((first, second), len(self._groups))
+            if group == len(self._totals):
+                self._descriptions.append(list(descriptions))
+                self._text_unit_ids.append(list(text_unit_ids))
+                self._totals.append(total)
+                self._first_seen.append((batch, position))
+            else:
+                self._descriptions[group].extend(descriptions)
+                self._text_unit_ids[group].extend(text_unit_ids)
+                self._totals[group] += total
+
+    def to_frame(self) -> pd.DataFrame:
+        """Return the merged records."""
+        return pd.DataFrame({
+            self.keys[0]: [first for first, _ in self._groups],
+            self.keys[1]: [second for _, second in self._groups],
+            "description": self._descriptions,
+            "text_unit_ids": self._text_unit_ids,
+            self.total: self._totals,
+            "_batch": [batch for batch, _ in self._first_seen],
+            "_position": [position for _, position in self._first_seen],
+        })
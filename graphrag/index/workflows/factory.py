@@ -8,24 +8,38 @@ from typing import ClassVar
 from graphrag.config.enums import IndexingMethod
 from graphrag.config.models.graph_rag_config import GraphRagConfig
 from graphrag.index.typing.pipeline import Pipeline
-from graphrag.index.typing.workflow import WorkflowFunction
+from graphrag.index.typing.workflow import WorkflowDependencies, WorkflowFunction
 
 
 class PipelineFactory:
     """A factory class for workflow pipelines."""
 
     workflows: ClassVar[dict[str, WorkflowFunction]] = {}
+    dependencies: ClassVar[dict[str, WorkflowDependencies]] = {}
 
     @classmethod
-    def register(cls, name: str, workflow: WorkflowFunction):
-        """Register a custom workflow function."""
+    def register(
+        cls,
+        name: str,
+        workflow: WorkflowFunction,
+        dependencies: WorkflowDependencies | None = None,
+    ):
+        """Register a custom workflow function, optionally declaring the tables and config it depends on."""
         cls.workflows[name] = workflow
+        if dependencies is not None:
+            cls.dependencies[name] = dependencies
+        else:
+            cls.dependencies.pop(name, None)
 
     @classmethod
-    def register_all(cls, workflows: dict[str, WorkflowFunction]):
+    def register_all(
+        cls,
+        workflows: dict[str, WorkflowFunction],
+        dependencies: dict[str, WorkflowDependencies] | None = None,
+    ):
         """Register a dict of custom workflow functions."""
         for name, workflow in workflows.items():
-            cls.register(name, workflow)
+            cls.register(name, workflow, (dependencies or {}).get(name))
 
     @classmethod
     def create_pipeline(
@@ -33,7 +47,14 @@ class PipelineFactory:
     ) -> Pipeline:
         """Create a pipeline generator."""
         workflows = _get_workflows_list(config, method)
-        return Pipeline([(name, cls.workflows[name]) for name in workflows])
+        return Pipeline(
+            [(name, cls.workflows[name]) for name in workflows],
+            {
+                name: cls.dependencies[name]
+                for name in workflows
+                if name in cls.dependencies
+            },
+        )
 
 
 def _get_workflows_list(
@@ -43,6 +64,17 @@ def _get_workflows_list(
     if config.workflows:
         return config.workflows
     match method:
+        case IndexingMethod.Standard if config.streaming.enabled:
+            return [
+                "extract_graph_streaming",
+                "create_final_documents",
+                "finalize_graph",
+                *(["extract_covariates"] if config.extract_claims.enabled else []),
+                "create_communities",
+                "create_final_text_units",
+                "create_community_reports",
+                "generate_text_embeddings",
+            ]
         case IndexingMethod.Standard:
             return [
                 "create_base_text_units",
@@ -14,7 +14,6 @@ from graphrag.index.operations.finalize_relationships import finalize_relationsh
 from graphrag.index.operations.snapshot_graphml import snapshot_graphml
 from graphrag.index.typing.context import PipelineRunContext
 from graphrag.index.typing.workflow import WorkflowFunctionOutput
-from graphrag.utils.storage import load_table_from_storage, write_table_to_storage
 
 
 async def run_workflow(
@@ -22,8 +21,8 @@ async def run_workflow(
     context: PipelineRunContext,
 ) -> WorkflowFunctionOutput:
     """All the steps to create the base entity graph."""
-    entities = await load_table_from_storage("entities", context.storage)
-    relationships = await load_table_from_storage("relationships", context.storage)
+    entities = await context.tables.load("entities")
+    relationships = await context.tables.load("relationships")
 
     final_entities, final_relationships = finalize_graph(
         entities,
@@ -33,8 +32,8 @@ async def run_workflow(
         layout_enabled=config.umap.enabled,
     )
 
-    await write_table_to_storage(final_entities, "entities", context.storage)
-    await write_table_to_storage(final_relationships, "relationships", context.storage)
+    await context.tables.write("entities", final_entities)
+    await context.tables.write("relationships", final_relationships)
 
     if config.snapshots.graphml:
         # todo: extract graphs at each level, and add in meta like descriptions
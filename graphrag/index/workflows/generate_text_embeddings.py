@@ -23,9 +23,10 @@ from graphrag.config.embeddings import (
 )
 from graphrag.config.models.graph_rag_config import GraphRagConfig
 from graphrag.index.operations.embed_text import embed_text
+from graphrag.index.operations.embed_text.embedding_store import EmbeddingStore
 from graphrag.index.typing.context import PipelineRunContext
 from graphrag.index.typing.workflow import WorkflowFunctionOutput
-from graphrag.utils.storage import load_table_from_storage, write_table_to_storage
+from graphrag.index.utils.text_units import materialize_text
 
 log = logging.getLogger(__name__)
 
@@ -35,10 +36,10 @@ async def run_workflow(
     context: PipelineRunContext,
 ) -> WorkflowFunctionOutput:
     """All the steps to transform community reports."""
-    documents = await load_table_from_storage("documents", context.storage)
-    relationships = await load_table_from_storage("relationships", context.storage)
-    text_units = await load_table_from_storage("text_units", context.storage)
-    entities = await load_table_from_storage("entities", context.storage)
+    documents = await context.tables.load("documents")
+    relationships = await context.tables.load("relationships")
+    text_units = materialize_text(await context.tables.load("text_units"), documents)
+    entities = await context.tables.load("entities")
     # community_reports = await load_table_from_storage(
     #     "community_reports", context.storage
     # )
@@ -60,11 +61,7 @@ async def run_workflow(
 
     if config.snapshots.embeddings:
         for name, table in output.items():
-            await write_table_to_storage(
-                table,
-                f"embeddings.{name}",
-                context.storage,
-            )
+            await context.tables.write(f"embeddings.{name}", table)
 
     return WorkflowFunctionOutput(result=output)
 
@@ -130,6 +127,19 @@ async def generate_text_embeddings(
         },
     }
 
+    # embeddings are stored by content next to the LLM cache, so unchanged texts are not
+    # embedded again by later fields, re-indexes or updates
+    embedding_store = None
+    if text_embed_config["strategy"].get("vector_cache"):
+        embedding_store = EmbeddingStore(cache.child("embedding_store").storage)
+        text_embed_config = {
+            **text_embed_config,
+            "strategy": {
+                **text_embed_config["strategy"],
+                "embedding_store": embedding_store,
+            },
+        }
+
     log.info("Creating embeddings")
     outputs = {}
     for field in embedded_fields:
@@ -140,6 +150,8 @@ async def generate_text_embeddings(
             text_embed_config=text_embed_config,
             **embedding_param_map[field],
         )
+        if embedding_store is not None:
+            await embedding_store.flush()
     return outputs
 
 
@@ -154,7 +166,7 @@ async def _run_and_snapshot_embeddings(
     """All the steps to generate single embedding."""
     if data is None or data.empty:
         return pd.DataFrame(columns=["id", "embedding"])
-    
+
     data["embedding"] = await embed_text(
         input=data,
         callbacks=callbacks,
@@ -11,11 +11,21 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any, ClassVar
 
+from graphrag.config.enums import ModelType
 from graphrag.language_model.factory import ModelFactory
+from graphrag.language_model.rate_budget import RateBudgetRegistry
 
 if TYPE_CHECKING:
     from graphrag.language_model.protocol import ChatModel, EmbeddingModel
 
+# The providers whose constructors take a shared rate budget
+RATE_BUDGET_MODEL_TYPES = frozenset({
+    ModelType.OpenAIChat,
+    ModelType.AzureOpenAIChat,
+    ModelType.OpenAIEmbedding,
+    ModelType.AzureOpenAIEmbedding,
+})
+
 
 class ModelManager:
     """Singleton manager for LLM instances."""
@@ -33,6 +43,7 @@ class ModelManager:
         if not hasattr(self, "_initialized"):
             self.chat_models: dict[str, ChatModel] = {}
             self.embedding_models: dict[str, EmbeddingModel] = {}
+            self.rate_budgets = RateBudgetRegistry()
             self._initialized = True
 
     @classmethod
@@ -46,12 +57,15 @@ class ModelManager:
         """
         Register a ChatLLM instance under a unique name.
 
+        Built-in models draw from the rate budget of the deployment their config calls.
+
         Args:
             name: Unique identifier for the ChatLLM instance.
             model_type: Key for the ChatLLM implementation in LLMFactory.
             **chat_kwargs: Additional parameters for instantiation.
         """
         chat_kwargs["name"] = name
+        self._add_rate_budget(model_type, chat_kwargs)
         self.chat_models[name] = ModelFactory.create_chat_model(
             model_type, **chat_kwargs
         )
@@ -63,17 +77,29 @@ class ModelManager:
         """
         Register an EmbeddingsLLM instance under a unique name.
 
+        Built-in models draw from the rate budget of the deployment their config calls.
+
         Args:
             name: Unique identifier for the EmbeddingsLLM instance.
             embedding_key: Key for the EmbeddingsLLM implementation in LLMFactory.
             **embedding_kwargs: Additional parameters for instantiation.
         """
         embedding_kwargs["name"] = name
+        self._add_rate_budget(model_type, embedding_kwargs)
         self.embedding_models[name] = ModelFactory.create_embedding_model(
             model_type, **embedding_kwargs
         )
         return self.embedding_models[name]
 
+    def _add_rate_budget(self, model_type: str, model_kwargs: dict[str, Any]) -> None:
+        # Custom providers are registered with their own constructors and don't
+        # necessarily accept a rate budget.
+        if model_type not in RATE_BUDGET_MODEL_TYPES:
+            return
+        config = model_kwargs.get("config")
+        if config is not None and "rate_budget" not in model_kwargs:
+            model_kwargs["rate_budget"] = self.rate_budgets.get(config)
+
     def get_chat_model(self, name: str) -> ChatModel | None:
         """
         Retrieve the ChatLLM instance registered under the given name.
@@ -3,18 +3,38 @@
 
 """FNLLM llm events provider."""
 
+import time
+from contextvars import ContextVar
 from typing import Any
 
 from fnllm.events import LLMEvents
+from fnllm.limiting import Manifest
+from fnllm.types.metrics import LLMUsageMetrics
 
+from graphrag.index.run.profiling import (
+    record_cache_lookup,
+    record_llm_usage,
+    record_rate_limit_wait,
+)
 from graphrag.index.typing.error_handler import ErrorHandlerFn
+from graphrag.index.utils.concurrency import is_rate_limit_error, report_rate_limit
+from graphrag.language_model.rate_budget import RateBudget
+
+# the retryer calls on_try right before entering the rate limiter, so the time until
+# the limit is acquired is the time spent waiting on it
+_attempt_start: ContextVar[float | None] = ContextVar("attempt_start", default=None)
 
 
 class FNLLMEvents(LLMEvents):
-    """FNLLM events handler that calls the error handler."""
+    """FNLLM events handler that calls the error handler, draws from the shared rate budget and reports usage, rate limits and waits."""
 
-    def __init__(self, on_error: ErrorHandlerFn):
+    def __init__(
+        self,
+        on_error: ErrorHandlerFn | None = None,
+        rate_budget: RateBudget | None = None,
+    ):
         self._on_error = on_error
+        self._rate_budget = rate_budget
 
     async def on_error(
         self,
@@ -23,4 +43,42 @@ class FNLLMEvents(LLMEvents):
         arguments: dict[str, Any] | None = None,
     ) -> None:
         """Handle an fnllm error."""
-        self._on_error(error, traceback, arguments)
+        if self._on_error is not None:
+            self._on_error(error, traceback, arguments)
+
+    async def on_usage(self, usage: LLMUsageMetrics) -> None:
+        """Record the tokens used by a request."""
+        record_llm_usage(usage.input_tokens, usage.output_tokens)
+
+    async def on_try(self, attempt_number: int) -> None:
+        """Mark the start of a request attempt."""
+        _attempt_start.set(time.monotonic())
+
+    async def on_limit_acquired(self, manifest: Manifest) -> None:
+        """Wait for the shared rate budget and record how long the request waited on the rate limiters."""
+        if self._rate_budget is not None:
+            await self._rate_budget.acquire(manifest.request_tokens)
+        start = _attempt_start.get()
+        if start is not None:
+            record_rate_limit_wait(time.monotonic() - start)
+            _attempt_start.set(None)
+
+    async def on_post_limit(self, manifest: Manifest) -> None:
+        """Charge the tokens a request used beyond its estimate to the shared rate budget."""
+        if self._rate_budget is not None:
+            self._rate_budget.consume(manifest.post_request_tokens)
+
+    async def on_retryable_error(
+        self, error: BaseException, attempt_number: int
+    ) -> None:
+        """Report rate limits that are about to be retried to the adaptive concurrency limiter."""
+        if is_rate_limit_error(error):
+            report_rate_limit()
+
+    async def on_cache_hit(self, cache_key: str, name: str | None) -> None:
+        """Record a cache hit."""
+        record_cache_lookup(hit=True)
+
+    async def on_cache_miss(self, cache_key: str, name: str | None) -> None:
+        """Record a cache miss."""
+        record_cache_lookup(hit=False)
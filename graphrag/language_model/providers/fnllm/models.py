@@ -37,6 +37,7 @@ if TYPE_CHECKING:
     from graphrag.config.models.language_model_config import (
         LanguageModelConfig,
     )
+    from graphrag.language_model.rate_budget import RateBudget
 
 
 class OpenAIChatFNLLM:
@@ -51,8 +52,11 @@ class OpenAIChatFNLLM:
         config: LanguageModelConfig,
         callbacks: WorkflowCallbacks | None = None,
         cache: PipelineCache | None = None,
+        rate_budget: RateBudget | None = None,
     ) -> None:
-        model_config = _create_openai_config(config, azure=False)
+        model_config = _create_openai_config(
+            config, azure=False, shared_rate_limits=rate_budget is not None
+        )
         error_handler = _create_error_handler(callbacks) if callbacks else None
         model_cache = _create_cache(cache, name)
         client = create_openai_client(model_config)
@@ -60,7 +64,7 @@ class OpenAIChatFNLLM:
             model_config,
             client=client,
             cache=model_cache,
-            events=FNLLMEvents(error_handler) if error_handler else None,
+            events=FNLLMEvents(error_handler, rate_budget),
         )
 
     async def achat(
@@ -156,8 +160,11 @@ class OpenAIEmbeddingFNLLM:
         config: LanguageModelConfig,
         callbacks: WorkflowCallbacks | None = None,
         cache: PipelineCache | None = None,
+        rate_budget: RateBudget | None = None,
     ) -> None:
-        model_config = _create_openai_config(config, azure=False)
+        model_config = _create_openai_config(
+            config, azure=False, shared_rate_limits=rate_budget is not None
+        )
         error_handler = _create_error_handler(callbacks) if callbacks else None
         model_cache = _create_cache(cache, name)
         client = create_openai_client(model_config)
@@ -165,7 +172,7 @@ class OpenAIEmbeddingFNLLM:
             model_config,
             client=client,
             cache=model_cache,
-            events=FNLLMEvents(error_handler) if error_handler else None,
+            events=FNLLMEvents(error_handler, rate_budget),
         )
 
     async def aembed_batch(self, text_list: list[str], **kwargs) -> list[list[float]]:
@@ -247,8 +254,11 @@ class AzureOpenAIChatFNLLM:
         config: LanguageModelConfig,
         callbacks: WorkflowCallbacks | None = None,
         cache: PipelineCache | None = None,
+        rate_budget: RateBudget | None = None,
     ) -> None:
-        model_config = _create_openai_config(config, azure=True)
+        model_config = _create_openai_config(
+            config, azure=True, shared_rate_limits=rate_budget is not None
+        )
         error_handler = _create_error_handler(callbacks) if callbacks else None
         model_cache = _create_cache(cache, name)
         client = create_openai_client(model_config)
@@ -256,7 +266,7 @@ class AzureOpenAIChatFNLLM:
             model_config,
             client=client,
             cache=model_cache,
-            events=FNLLMEvents(error_handler) if error_handler else None,
+            events=FNLLMEvents(error_handler, rate_budget),
         )
 
     async def achat(
@@ -354,8 +364,11 @@ class AzureOpenAIEmbeddingFNLLM:
         config: LanguageModelConfig,
         callbacks: WorkflowCallbacks | None = None,
         cache: PipelineCache | None = None,
+        rate_budget: RateBudget | None = None,
     ) -> None:
-        model_config = _create_openai_config(config, azure=True)
+        model_config = _create_openai_config(
+            config, azure=True, shared_rate_limits=rate_budget is not None
+        )
         error_handler = _create_error_handler(callbacks) if callbacks else None
         model_cache = _create_cache(cache, name)
         client = create_openai_client(model_config)
@@ -363,7 +376,7 @@ class AzureOpenAIEmbeddingFNLLM:
             model_config,
             client=client,
             cache=model_cache,
-            events=FNLLMEvents(error_handler) if error_handler else None,
+            events=FNLLMEvents(error_handler, rate_budget),
         )
 
     async def aembed_batch(self, text_list: list[str], **kwargs) -> list[list[float]]:
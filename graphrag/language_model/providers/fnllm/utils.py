@@ -47,8 +47,16 @@ def _create_error_handler(callbacks: WorkflowCallbacks) -> ErrorHandlerFn:
     return on_error
 
 
-def _create_openai_config(config: LanguageModelConfig, azure: bool) -> OpenAIConfig:
-    """Create an OpenAIConfig from a LanguageModelConfig."""
+def _create_openai_config(
+    config: LanguageModelConfig, azure: bool, shared_rate_limits: bool = False
+) -> OpenAIConfig:
+    """Create an OpenAIConfig from a LanguageModelConfig.
+
+    With `shared_rate_limits`, the requests and tokens per minute are enforced by a rate budget
+    shared across models instead of a limiter of the model's own.
+    """
+    requests_per_minute = None if shared_rate_limits else config.requests_per_minute
+    tokens_per_minute = None if shared_rate_limits else config.tokens_per_minute
     encoding_model = config.encoding_model
     json_strategy = (
         JsonStrategy.VALID if config.model_supports_json else JsonStrategy.LOOSE
@@ -76,8 +84,8 @@ def _create_openai_config(config: LanguageModelConfig, azure: bool) -> OpenAICon
             organization=config.organization,
             max_retries=config.max_retries,
             max_retry_wait=config.max_retry_wait,
-            requests_per_minute=config.requests_per_minute,
-            tokens_per_minute=config.tokens_per_minute,
+            requests_per_minute=requests_per_minute,
+            tokens_per_minute=tokens_per_minute,
             audience=audience,
             retry_strategy=RetryStrategy(config.retry_strategy),
             timeout=config.request_timeout,
@@ -96,8 +104,8 @@ def _create_openai_config(config: LanguageModelConfig, azure: bool) -> OpenAICon
         retry_strategy=RetryStrategy(config.retry_strategy),
         max_retries=config.max_retries,
         max_retry_wait=config.max_retry_wait,
-        requests_per_minute=config.requests_per_minute,
-        tokens_per_minute=config.tokens_per_minute,
+        requests_per_minute=requests_per_minute,
+        tokens_per_minute=tokens_per_minute,
         timeout=config.request_timeout,
         max_concurrency=config.concurrent_requests,
         model=config.model,
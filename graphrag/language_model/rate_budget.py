@@ -0,0 +1,171 @@
+# Copyright (c) 2025 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Process-wide request and token budgets, shared by all models that call the same deployment.
+
+Service quotas (requests and tokens per minute) apply to a deployment, not to a model instance.
+The registry hands out one budget per deployment, so every workflow and query engine calling it
+draws from the same buckets instead of each assuming it has the whole quota.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from graphrag.config.models.language_model_config import LanguageModelConfig
+
+log = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """A token bucket holding up to `capacity` tokens that refills `capacity` tokens every `per` seconds.
+
+    Reservations may overdraw the bucket, which makes the callers queue up in the order they
+    reserved: each one waits until the refill covers its share. The bucket is guarded by a thread
+    lock rather than asyncio primitives, so it can be shared by models running on different event
+    loops.
+    """
+
+    def __init__(self, capacity: float, per: float = 60):
+        self.capacity = capacity
+        self.rate = capacity / per
+        self._level = capacity
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, amount: float) -> float:
+        """Take `amount` from the bucket and return the seconds until it is covered."""
+        with self._lock:
+            now = time.monotonic()
+            self._level = min(
+                self.capacity, self._level + (now - self._last) * self.rate
+            )
+            self._last = now
+            # a request larger than the bucket would otherwise never be served
+            self._level -= min(amount, self.capacity)
+            return max(0.0, -self._level / self.rate)
+
+    async def acquire(self, amount: float = 1) -> float:
+        """Take `amount` from the bucket, waiting until it is covered. Returns the seconds waited."""
+        wait = self.reserve(amount)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+
+@dataclass
+class RateBudgetStats:
+    """Usage of a rate budget since it was created."""
+
+    requests: int = 0
+    """Requests admitted."""
+
+    tokens: int = 0
+    """Estimated prompt and completion tokens charged, corrected with the reported usage."""
+
+    queued_requests: int = 0
+    """Requests that had to wait for the budget."""
+
+    queueing_delay: float = 0
+    """Seconds spent waiting for the budget, summed over requests."""
+
+    max_queueing_delay: float = 0
+    """The longest time a single request waited for the budget, in seconds."""
+
+
+class RateBudget:
+    """Requests-per-minute and tokens-per-minute buckets of a single deployment."""
+
+    def __init__(
+        self, key: str, requests_per_minute: int | None, tokens_per_minute: int | None
+    ):
+        self.key = key
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.stats = RateBudgetStats()
+        self._requests = (
+            TokenBucket(requests_per_minute) if requests_per_minute else None
+        )
+        self._tokens = TokenBucket(tokens_per_minute) if tokens_per_minute else None
+        self._lock = threading.Lock()
+
+    async def acquire(self, tokens: int) -> float:
+        """Admit a request estimated to use `tokens`, waiting for both budgets. Returns the seconds waited."""
+        wait = 0.0
+        if self._requests is not None:
+            wait = self._requests.reserve(1)
+        if self._tokens is not None and tokens > 0:
+            wait = max(wait, self._tokens.reserve(tokens))
+        with self._lock:
+            self.stats.requests += 1
+            self.stats.tokens += tokens
+            if wait > 0:
+                self.stats.queued_requests += 1
+                self.stats.queueing_delay += wait
+                self.stats.max_queueing_delay = max(self.stats.max_queueing_delay, wait)
+        if wait > 0:
+            log.debug("%s: request queued for %.2fs", self.key, wait)
+            await asyncio.sleep(wait)
+        return wait
+
+    def consume(self, tokens: int) -> None:
+        """Charge tokens used beyond the estimate of a finished request, delaying later requests."""
+        if self._tokens is not None and tokens > 0:
+            self._tokens.reserve(tokens)
+            with self._lock:
+                self.stats.tokens += tokens
+
+
+class RateBudgetRegistry:
+    """Hands out one rate budget per deployment."""
+
+    def __init__(self) -> None:
+        self._budgets: dict[str, RateBudget] = {}
+        self._lock = threading.Lock()
+
+    def get(self, config: LanguageModelConfig) -> RateBudget | None:
+        """Get the budget of the deployment a model config calls, or None if it sets no rate limits.
+
+        The first config seen for a deployment sets its limits.
+        """
+        if not config.requests_per_minute and not config.tokens_per_minute:
+            return None
+        key = deployment_key(config)
+        with self._lock:
+            budget = self._budgets.get(key)
+            if budget is None:
+                budget = RateBudget(
+                    key, config.requests_per_minute, config.tokens_per_minute
+                )
+                self._budgets[key] = budget
+            elif (budget.requests_per_minute, budget.tokens_per_minute) != (
+                config.requests_per_minute,
+                config.tokens_per_minute,
+            ):
+                log.warning(
+                    "%s is configured with different rate limits, keeping requests_per_minute=%s and tokens_per_minute=%s",
+                    key,
+                    budget.requests_per_minute,
+                    budget.tokens_per_minute,
+                )
+            return budget
+
+    def stats(self) -> dict[str, dict[str, float]]:
+        """Return the usage of every budget, keyed by deployment."""
+        with self._lock:
+            return {key: asdict(budget.stats) for key, budget in self._budgets.items()}
+
+
+def deployment_key(config: LanguageModelConfig) -> str:
+    """Identify the deployment a model config calls."""
+    return ":".join([
+        config.type,
+        config.api_base or "",
+        config.deployment_name or config.model,
+    ])
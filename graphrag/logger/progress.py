@@ -27,6 +27,26 @@ class Progress:
     """Number of items completed""" ""
 
 
+@dataclass
+class Concurrency:
+    """A class representing the state of an adaptive concurrency limiter."""
+
+    name: str
+    """Name of the operation the limiter belongs to"""
+
+    limit: int
+    """Number of requests currently allowed in flight"""
+
+    in_flight: int
+    """Number of requests currently in flight"""
+
+    throughput: float
+    """Requests completed per second since the previous report"""
+
+    rate_limited: int
+    """Number of rate-limit responses seen so far"""
+
+
 ProgressHandler = Callable[[Progress], None]
 """A function to handle progress reports."""
 
@@ -8,6 +8,7 @@ from io import BytesIO
 
 import pandas as pd
 
+from graphrag.index.run.profiling import record_table_read, record_table_write
 from graphrag.storage.pipeline_storage import PipelineStorage
 
 log = logging.getLogger(__name__)
@@ -21,17 +22,22 @@ async def load_table_from_storage(name: str, storage: PipelineStorage) -> pd.Dat
         raise ValueError(msg)
     try:
         log.info("reading table from storage: %s", filename)
-        return pd.read_parquet(BytesIO(await storage.get(filename, as_bytes=True)))
+        data = await storage.get(filename, as_bytes=True)
+        table = pd.read_parquet(BytesIO(data))
     except Exception:
         log.exception("error loading table from storage: %s", filename)
         raise
+    record_table_read(len(table), len(data))
+    return table
 
 
 async def write_table_to_storage(
     table: pd.DataFrame, name: str, storage: PipelineStorage
 ) -> None:
     """Write a table to storage."""
-    await storage.set(f"{name}.parquet", table.to_parquet())
+    data = table.to_parquet()
+    record_table_write(len(table), len(data))
+    await storage.set(f"{name}.parquet", data)
 
 
 async def delete_table_from_storage(name: str, storage: PipelineStorage) -> None:
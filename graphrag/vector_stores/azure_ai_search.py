@@ -130,7 +130,7 @@ class AzureAISearchVectorStore(BaseVectorStore):
         batch = [
             {
                 "id": doc.id,
-                "vector": doc.vector,
+                "vector": doc.vector_as_list(),
                 "text": doc.text,
                 "attributes": json.dumps(doc.attributes),
             }
@@ -7,6 +7,8 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from typing import Any
 
+import numpy as np
+
 from graphrag.data_model.types import TextEmbedder
 
 DEFAULT_VECTOR_SIZE: int = 1536
@@ -20,11 +22,18 @@ class VectorStoreDocument:
     """unique id for the document"""
 
     text: str | None
-    vector: list[float] | None
+    vector: list[float] | np.ndarray | None
+    """the embedding, either a list of floats or a 1-D float32 array, e.g. a row of an embedding block"""
 
     attributes: dict[str, Any] = field(default_factory=dict)
     """store any additional metadata, e.g. title, date ranges, etc"""
 
+    def vector_as_list(self) -> list[float] | None:
+        """Return the vector as a list of floats, for stores that send vectors as JSON."""
+        if isinstance(self.vector, np.ndarray):
+            return self.vector.tolist()
+        return self.vector
+
 
 @dataclass
 class VectorStoreSearchResult:
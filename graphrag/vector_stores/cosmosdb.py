@@ -143,7 +143,7 @@ class CosmosDBVectoreStore(BaseVectorStore):
             if doc.vector is not None:
                 doc_json = {
                     "id": doc.id,
-                    "vector": doc.vector,
+                    "vector": doc.vector_as_list(),
                     "text": doc.text,
                     "attributes": json.dumps(doc.attributes),
                 }
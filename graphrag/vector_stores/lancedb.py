@@ -6,11 +6,13 @@
 import json  # noqa: I001
 from typing import Any
 
+import numpy as np
 import pyarrow as pa
 
 from graphrag.data_model.types import TextEmbedder
 
 from graphrag.vector_stores.base import (
+    DEFAULT_VECTOR_SIZE,
     BaseVectorStore,
     VectorStoreDocument,
     VectorStoreSearchResult,
@@ -31,6 +33,7 @@ class LanceDBVectorStore(BaseVectorStore):
     def connect(self, **kwargs: Any) -> Any:
         """Connect to the vector storage."""
         self.db_connection = lancedb.connect(kwargs["db_uri"])
+        self.vector_size = kwargs.get("vector_size", DEFAULT_VECTOR_SIZE)
         if (
             self.collection_name
             and self.collection_name in self.db_connection.table_names()
@@ -42,32 +45,25 @@ class LanceDBVectorStore(BaseVectorStore):
     def load_documents(
         self, documents: list[VectorStoreDocument], overwrite: bool = True
     ) -> None:
-        """Load documents into vector storage."""
-        data = [
-            {
-                "id": document.id,
-                "text": document.text,
-                "vector": document.vector,
-                "attributes": json.dumps(document.attributes),
-            }
-            for document in documents
-            if document.vector is not None
-        ]
+        """Load documents into vector storage.
 
-        if len(data) == 0:
-            data = None
+        Vectors are packed into one contiguous float32 block and handed to Arrow as a
+        FixedSizeList<float32> column without converting them element by element.
+        """
+        documents = [document for document in documents if document.vector is not None]
+        data = _to_table(documents) if documents else None
 
         schema = pa.schema([
             pa.field("id", pa.string()),
             pa.field("text", pa.string()),
-            pa.field("vector", pa.list_(pa.float64())),
+            pa.field("vector", pa.list_(pa.float32(), self.vector_size)),
             pa.field("attributes", pa.string()),
         ])
         # NOTE: If modifying the next section of code, ensure that the schema remains the same.
         #       The pyarrow format of the 'vector' field may change if the order of operations is changed
         #       and will break vector search.
         if overwrite:
-            if data:
+            if data is not None:
                 self.document_collection = self.db_connection.create_table(
                     self.collection_name, data=data, mode="overwrite"
                 )
@@ -80,8 +76,14 @@ class LanceDBVectorStore(BaseVectorStore):
             self.document_collection = self.db_connection.open_table(
                 self.collection_name
             )
-            if data:
-                self.document_collection.add(data)
+            if data is not None:
+                if self.document_collection.count_rows() == 0:
+                    # created without data, so the vector size of its schema is only the configured guess
+                    self.document_collection = self.db_connection.create_table(
+                        self.collection_name, data=data, mode="overwrite"
+                    )
+                else:
+                    self.document_collection.add(data)
 
     def filter_by_id(self, include_ids: list[str] | list[int]) -> Any:
         """Build a query filter to filter documents by id."""
@@ -160,3 +162,22 @@ class LanceDBVectorStore(BaseVectorStore):
                 attributes=json.loads(doc[0]["attributes"]),
             )
         return VectorStoreDocument(id=id, text=None, vector=None)
+
+
+def _to_table(documents: list[VectorStoreDocument]) -> pa.Table:
+    """Build an Arrow table of documents with a FixedSizeList<float32> vector column."""
+    vectors = np.stack([
+        np.asarray(document.vector, dtype=np.float32) for document in documents
+    ])
+    return pa.table({
+        "id": [document.id for document in documents],
+        "text": pa.array([document.text for document in documents], type=pa.string()),
+        # a contiguous float32 block is wrapped by Arrow without a copy
+        "vector": pa.FixedSizeListArray.from_arrays(
+            pa.array(vectors.reshape(-1)), vectors.shape[1]
+        ),
+        "attributes": pa.array(
+            [json.dumps(document.attributes) for document in documents],
+            type=pa.string(),
+        ),
+    })
@@ -0,0 +1,121 @@
+# Copyright (c) 2025 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Rate budget tests."""
+
+import time
+
+from fnllm.limiting import Manifest
+
+from graphrag.config.enums import ModelType
+from graphrag.config.models.language_model_config import LanguageModelConfig
+from graphrag.language_model.factory import ModelFactory
+from graphrag.language_model.manager import ModelManager
+from graphrag.language_model.providers.fnllm.events import FNLLMEvents
+from graphrag.language_model.rate_budget import (
+    RateBudget,
+    RateBudgetRegistry,
+    TokenBucket,
+)
+
+
+def _config(**kwargs) -> LanguageModelConfig:
+    return LanguageModelConfig(**{
+        "type": ModelType.OpenAIChat,
+        "api_key": "key",
+        "model": "gpt-4o",
+        "encoding_model": "cl100k_base",
+        **kwargs,
+    })
+
+
+async def test_token_bucket_queues_reservations_in_order():
+    bucket = TokenBucket(10, per=1)
+
+    assert bucket.reserve(10) == 0
+    first = bucket.reserve(1)
+    second = bucket.reserve(1)
+    assert 0 < first < second <= 0.2
+
+    start = time.monotonic()
+    waited = await TokenBucket(1, per=0.05).acquire(5)
+    assert waited == 0
+    assert time.monotonic() - start < 0.05
+
+
+async def test_budget_charges_requests_and_tokens():
+    budget = RateBudget("deployment", requests_per_minute=60, tokens_per_minute=600)
+
+    assert await budget.acquire(300) == 0
+    budget.consume(250)
+    # 50 tokens are left and the bucket refills 10 tokens per second
+    assert 4.9 < budget._tokens.reserve(100) <= 5  # noqa: SLF001
+
+    assert budget.stats.requests == 1
+    assert budget.stats.tokens == 550
+    assert budget.stats.queued_requests == 0
+
+
+def test_registry_shares_budgets_per_deployment():
+    registry = RateBudgetRegistry()
+
+    budget = registry.get(_config())
+    assert budget is not None
+    assert registry.get(_config(tokens_per_minute=10)) is budget
+    assert registry.get(_config(model="gpt-4o-mini")) is not budget
+    assert registry.get(_config(requests_per_minute=0, tokens_per_minute=0)) is None
+    assert set(registry.stats()) == {
+        "openai_chat::gpt-4o",
+        "openai_chat::gpt-4o-mini",
+    }
+
+
+def test_models_of_one_deployment_share_a_budget(monkeypatch):
+    budgets = []
+
+    def create_events(on_error=None, rate_budget=None):
+        budgets.append(rate_budget)
+        return FNLLMEvents(on_error, rate_budget)
+
+    monkeypatch.setattr(
+        "graphrag.language_model.providers.fnllm.models.FNLLMEvents", create_events
+    )
+    manager = ModelManager()
+    config = _config(model="gpt-4o-shared")
+
+    manager.register_chat("first", config.type, config=config)
+    manager.register_embedding(
+        "second", ModelType.OpenAIEmbedding, config=_config(model="embedding-shared")
+    )
+    manager.register_chat("third", config.type, config=config)
+
+    budget = manager.rate_budgets.get(config)
+    assert budget is not None
+    assert budgets[0] is budgets[2] is budget
+    assert budgets[1] is not budget
+
+
+def test_custom_models_are_created_without_a_budget():
+    class CustomChatModel:
+        def __init__(self, name: str, config: LanguageModelConfig):
+            self.name = name
+            self.config = config
+
+    ModelFactory.register_chat("budgetless_chat", CustomChatModel)
+    config = _config(model="gpt-4o-custom")
+
+    model = ModelManager().register_chat("custom", "budgetless_chat", config=config)
+
+    assert isinstance(model, CustomChatModel)
+    assert model.config is config
+
+
+async def test_events_draw_from_the_budget():
+    budget = RateBudget("deployment", requests_per_minute=None, tokens_per_minute=600)
+    events = FNLLMEvents(rate_budget=budget)
+
+    await events.on_limit_acquired(Manifest(request_tokens=100))
+    await events.on_post_limit(Manifest(post_request_tokens=20))
+
+    assert budget.stats.requests == 1
+    assert budget.stats.tokens == 120
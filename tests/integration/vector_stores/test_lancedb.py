@@ -0,0 +1,65 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+import numpy as np
+import pyarrow as pa
+
+from graphrag.vector_stores.base import VectorStoreDocument
+from graphrag.vector_stores.lancedb import LanceDBVectorStore
+
+
+def _documents(ids: list[str], vectors: np.ndarray) -> list[VectorStoreDocument]:
+    return [
+        VectorStoreDocument(id=id, text=f"text {id}", vector=vector, attributes={})
+        for id, vector in zip(ids, vectors, strict=True)
+    ]
+
+
+def test_array_backed_documents_are_stored_as_fixed_size_float32(tmp_path):
+    store = LanceDBVectorStore(collection_name="documents")
+    store.connect(db_uri=str(tmp_path / "lancedb"))
+    block = np.array([[1, 0, 0], [0, 1, 0], [0, 0, 1]], dtype=np.float32)
+
+    store.load_documents(_documents(["a", "b"], block[:2]))
+    # a vector given as a list is packed the same way
+    store.load_documents(
+        [VectorStoreDocument(id="c", text="text c", vector=[0.0, 0.0, 1.0])],
+        overwrite=False,
+    )
+
+    assert store.document_collection.schema.field("vector").type == pa.list_(
+        pa.float32(), 3
+    )
+    assert store.search_by_id("c").vector == [0.0, 0.0, 1.0]
+    results = store.similarity_search_by_vector([0.0, 0.9, 0.1], k=1)
+    assert [result.document.id for result in results] == ["b"]
+
+
+def test_documents_without_vectors_are_skipped(tmp_path):
+    store = LanceDBVectorStore(collection_name="documents")
+    store.connect(db_uri=str(tmp_path / "lancedb"))
+
+    store.load_documents([
+        VectorStoreDocument(id="a", text="text a", vector=None),
+        *_documents(["b"], np.ones((1, 2), dtype=np.float32)),
+    ])
+
+    assert store.document_collection.count_rows() == 1
+
+
+def test_empty_table_takes_the_vector_size_of_the_first_documents(tmp_path):
+    store = LanceDBVectorStore(collection_name="documents")
+    store.connect(db_uri=str(tmp_path / "lancedb"), vector_size=4)
+
+    store.load_documents([])
+    assert store.document_collection.schema.field("vector").type == pa.list_(
+        pa.float32(), 4
+    )
+    store.load_documents(
+        _documents(["a"], np.ones((1, 2), dtype=np.float32)), overwrite=False
+    )
+
+    assert store.document_collection.schema.field("vector").type == pa.list_(
+        pa.float32(), 2
+    )
+    assert store.document_collection.count_rows() == 1
@@ -28,6 +28,7 @@ from graphrag.config.models.output_config import OutputConfig
 from graphrag.config.models.prune_graph_config import PruneGraphConfig
 from graphrag.config.models.reporting_config import ReportingConfig
 from graphrag.config.models.snapshots_config import SnapshotsConfig
+from graphrag.config.models.streaming_config import StreamingConfig
 from graphrag.config.models.summarize_descriptions_config import (
     SummarizeDescriptionsConfig,
 )
@@ -91,6 +92,8 @@ def assert_language_model_configs(
     assert actual.max_retries == expected.max_retries
     assert actual.max_retry_wait == expected.max_retry_wait
     assert actual.concurrent_requests == expected.concurrent_requests
+    assert actual.adaptive_concurrency == expected.adaptive_concurrency
+    assert actual.max_concurrent_requests == expected.max_concurrent_requests
     assert actual.async_mode == expected.async_mode
     if actual.responses is not None:
         assert expected.responses is not None
@@ -198,6 +201,8 @@ def assert_text_embedding_configs(
     assert actual.strategy == expected.strategy
     assert actual.model_id == expected.model_id
     assert actual.vector_store_id == expected.vector_store_id
+    assert actual.vector_cache == expected.vector_cache
+    assert actual.concurrent_batches == expected.concurrent_batches
 
 
 def assert_chunking_configs(actual: ChunkingConfig, expected: ChunkingConfig) -> None:
@@ -208,6 +213,8 @@ def assert_chunking_configs(actual: ChunkingConfig, expected: ChunkingConfig) ->
     assert actual.encoding_model == expected.encoding_model
     assert actual.prepend_metadata == expected.prepend_metadata
     assert actual.chunk_size_includes_metadata == expected.chunk_size_includes_metadata
+    assert actual.store_spans == expected.store_spans
+    assert actual.num_processes == expected.num_processes
 
 
 def assert_snapshots_configs(
@@ -215,6 +222,14 @@ def assert_snapshots_configs(
 ) -> None:
     assert actual.embeddings == expected.embeddings
     assert actual.graphml == expected.graphml
+    assert actual.raw_graph == expected.raw_graph
+
+
+def assert_streaming_configs(
+    actual: StreamingConfig, expected: StreamingConfig
+) -> None:
+    assert actual.enabled == expected.enabled
+    assert actual.batch_size == expected.batch_size
 
 
 def assert_extract_graph_configs(
@@ -223,6 +238,8 @@ def assert_extract_graph_configs(
     assert actual.prompt == expected.prompt
     assert actual.entity_types == expected.entity_types
     assert actual.max_gleanings == expected.max_gleanings
+    assert actual.adaptive_gleaning == expected.adaptive_gleaning
+    assert actual.pack_tokens == expected.pack_tokens
     assert actual.strategy == expected.strategy
     assert actual.encoding_model == expected.encoding_model
     assert actual.model_id == expected.model_id
@@ -249,6 +266,7 @@ def assert_extract_graph_nlp_configs(
     assert actual.normalize_edge_weights == expected.normalize_edge_weights
     assert_text_analyzer_configs(actual.text_analyzer, expected.text_analyzer)
     assert actual.concurrent_requests == expected.concurrent_requests
+    assert actual.async_mode == expected.async_mode
 
 
 def assert_prune_graph_configs(
@@ -268,6 +286,8 @@ def assert_summarize_descriptions_configs(
 ) -> None:
     assert actual.prompt == expected.prompt
     assert actual.max_length == expected.max_length
+    assert actual.skip_within_length == expected.skip_within_length
+    assert actual.tree_reduce == expected.tree_reduce
     assert actual.strategy == expected.strategy
     assert actual.model_id == expected.model_id
 
@@ -435,6 +455,7 @@ def assert_graphrag_configs(actual: GraphRagConfig, expected: GraphRagConfig) ->
     assert_text_embedding_configs(actual.embed_text, expected.embed_text)
     assert_chunking_configs(actual.chunks, expected.chunks)
     assert_snapshots_configs(actual.snapshots, expected.snapshots)
+    assert_streaming_configs(actual.streaming, expected.streaming)
     assert_extract_graph_configs(actual.extract_graph, expected.extract_graph)
     assert_extract_graph_nlp_configs(
         actual.extract_graph_nlp, expected.extract_graph_nlp
@@ -8,10 +8,12 @@ from unittest.mock import ANY, Mock
 import pandas as pd
 import pytest
 
+from graphrag.callbacks.noop_workflow_callbacks import NoopWorkflowCallbacks
 from graphrag.config.enums import ChunkStrategyType
 from graphrag.index.operations.chunk_text.chunk_text import (
     _get_num_total,
     chunk_text,
+    chunk_text_groups,
     load_strategy,
     run_strategy,
 )
@@ -50,6 +52,14 @@ def test_load_strategy_sentence():
     assert strategy_loaded.__name__ == "run_sentences"
 
 
+def test_load_strategy_content():
+    strategy_type = ChunkStrategyType.content
+
+    strategy_loaded = load_strategy(strategy_type)
+
+    assert strategy_loaded.__name__ == "run_content"
+
+
 def test_load_strategy_none():
     strategy_type = ChunkStrategyType
 
@@ -178,3 +188,61 @@ def test_chunk_text(mock_progress_ticker, mock_run_strategy, mock_load_strategy)
     mock_run_strategy.assert_called_with(
         mock_load_strategy(), "The Shining", ANY, mock_progress_ticker()
     )
+
+
+def test_chunk_text_groups_keeps_groups_apart():
+    groups = [
+        [("doc1", "one two three four five"), ("doc2", "six seven")],
+        [],
+        [("doc3", "eight nine ten")],
+    ]
+
+    result = chunk_text_groups(
+        groups,
+        sizes=[4, 4, 2],
+        overlap=0,
+        encoding_model="cl100k_base",
+        strategy=ChunkStrategyType.tokens,
+        callbacks=NoopWorkflowCallbacks(),
+    )
+
+    assert result["group"].tolist() == [0, 0, 2, 2]
+    assert result["document_ids"].tolist() == [
+        ["doc1"],
+        ["doc1", "doc2"],
+        ["doc3"],
+        ["doc3"],
+    ]
+    assert result["text"].tolist() == [
+        "one two three four",
+        " fivesix seven",
+        "eight nine",
+        " ten",
+    ]
+    assert result["n_tokens"].tolist() == [4, 3, 2, 1]
+
+
+def test_chunk_text_groups_in_processes_matches_serial():
+    groups = [
+        [
+            (f"doc{group}.{doc}", f"text {group} {doc} " * (group + doc))
+            for doc in range(3)
+        ]
+        for group in range(12)
+    ]
+
+    def chunk(num_processes: int) -> pd.DataFrame:
+        return chunk_text_groups(
+            groups,
+            sizes=[8] * len(groups),
+            overlap=2,
+            encoding_model="cl100k_base",
+            strategy=ChunkStrategyType.tokens,
+            callbacks=NoopWorkflowCallbacks(),
+            spans=True,
+            num_processes=num_processes,
+        )
+
+    expected = chunk(1)
+    assert len(expected) > len(groups)
+    pd.testing.assert_frame_equal(chunk(2), expected)
@@ -0,0 +1,92 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+import asyncio
+import importlib
+import threading
+
+import pandas as pd
+import pytest
+
+from graphrag.cache.noop_pipeline_cache import NoopPipelineCache
+from graphrag.callbacks.noop_workflow_callbacks import NoopWorkflowCallbacks
+from graphrag.index.operations.embed_text.strategies.typing import TextEmbeddingResult
+
+# the package re-exports the operation under the module's name
+module = importlib.import_module("graphrag.index.operations.embed_text.embed_text")
+
+
+class FakeVectorStore:
+    def __init__(self):
+        self.loads: list[tuple[list[str], bool]] = []
+        self.threads: set[int] = set()
+
+    def load_documents(self, documents, overwrite=True):
+        self.threads.add(threading.get_ident())
+        self.loads.append(([document.id for document in documents], overwrite))
+
+
+@pytest.fixture
+def strategy(monkeypatch):
+    strategy = {"in_flight": 0, "max_in_flight": 0, "limiters": set()}
+
+    async def embed(texts, callbacks, cache, args):
+        strategy["limiters"].add(id(args.get("limiter")))
+        strategy["in_flight"] += 1
+        strategy["max_in_flight"] = max(
+            strategy["max_in_flight"], strategy["in_flight"]
+        )
+        await asyncio.sleep(0.01)
+        strategy["in_flight"] -= 1
+        return TextEmbeddingResult(embeddings=[[float(len(text))] for text in texts])
+
+    monkeypatch.setattr(module, "load_strategy", lambda _: embed)
+    return strategy
+
+
+async def _embed(vector_store: FakeVectorStore, concurrent_batches: int):
+    input = pd.DataFrame({
+        "id": ["1", "2", "3", "4", "5"],
+        "text": ["a", "bb", "ccc", "dddd", "eeeee"],
+    })
+    return await module._text_embed_with_vector_store(  # noqa: SLF001
+        input=input,
+        callbacks=NoopWorkflowCallbacks(),
+        cache=NoopPipelineCache(),
+        embed_column="text",
+        strategy={"type": "fake", "concurrent_batches": concurrent_batches},
+        vector_store=vector_store,  # type: ignore
+        vector_store_config={"batch_size": 2},
+    )
+
+
+async def test_pipelined_batches_are_embedded_concurrently(strategy):
+    vector_store = FakeVectorStore()
+
+    embeddings = await _embed(vector_store, concurrent_batches=3)
+
+    assert embeddings == [[1.0], [2.0], [3.0], [4.0], [5.0]]
+    assert strategy["max_in_flight"] == 3
+    # all batches share one limiter on the model's requests
+    assert len(strategy["limiters"]) == 1
+    assert sorted(ids for ids, _ in vector_store.loads) == [
+        ["1", "2"],
+        ["3", "4"],
+        ["5"],
+    ]
+    assert [overwrite for _, overwrite in vector_store.loads] == [True, False, False]
+    assert threading.get_ident() not in vector_store.threads
+
+
+async def test_sequential_batches(strategy):
+    vector_store = FakeVectorStore()
+
+    embeddings = await _embed(vector_store, concurrent_batches=1)
+
+    assert embeddings == [[1.0], [2.0], [3.0], [4.0], [5.0]]
+    assert strategy["max_in_flight"] == 1
+    assert vector_store.loads == [
+        (["1", "2"], True),
+        (["3", "4"], False),
+        (["5"], False),
+    ]
@@ -0,0 +1,93 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from graphrag.cache.json_pipeline_cache import JsonPipelineCache
+from graphrag.cache.noop_pipeline_cache import NoopPipelineCache
+from graphrag.callbacks.noop_workflow_callbacks import NoopWorkflowCallbacks
+from graphrag.index.operations.embed_text.embedding_store import EmbeddingStore
+from graphrag.index.operations.embed_text.strategies import openai
+from graphrag.storage.file_pipeline_storage import FilePipelineStorage
+from graphrag.storage.memory_pipeline_storage import MemoryPipelineStorage
+from tests.unit.config.utils import DEFAULT_EMBEDDING_MODEL_CONFIG
+
+
+class FakeEmbeddingModel:
+    def __init__(self):
+        self.requests: list[list[str]] = []
+
+    async def aembed_batch(self, text_list: list[str], **kwargs):
+        self.requests.append(text_list)
+        return [[len(text), 1.0 / 3] for text in text_list]
+
+
+@pytest.fixture
+def model(monkeypatch):
+    model = FakeEmbeddingModel()
+
+    class FakeModelManager:
+        def get_or_create_embedding_model(self, **kwargs):
+            return model
+
+    monkeypatch.setattr(openai, "ModelManager", FakeModelManager)
+    return model
+
+
+async def _embed(texts: list[str], store: EmbeddingStore | None) -> list:
+    result = await openai.run(
+        texts,
+        NoopWorkflowCallbacks(),
+        NoopPipelineCache(),
+        {
+            "llm": {**DEFAULT_EMBEDDING_MODEL_CONFIG, "max_retries": 1},
+            "embedding_store": store,
+        },
+    )
+    assert result.embeddings is not None
+    return result.embeddings
+
+
+async def test_only_texts_without_stored_embeddings_are_embedded(model):
+    storage = MemoryPipelineStorage()
+
+    store = EmbeddingStore(storage)
+    first = await _embed(["alice", "bob", "alice"], store)
+    await store.flush()
+    # a later run, e.g. an update with one new text
+    store = EmbeddingStore(storage)
+    second = await _embed(["bob", "carol", "alice"], store)
+    await store.flush()
+
+    assert model.requests == [["alice", "bob"], ["carol"]]
+    assert np.array_equal(first[1], second[0])
+    assert np.array_equal(first[0], second[2])
+    assert second[1].dtype == np.float32
+    assert second[1].tolist() == pytest.approx([5, 1 / 3])
+
+
+async def test_store_is_written_as_a_float32_parquet_file_per_model(tmp_path):
+    cache = JsonPipelineCache(FilePipelineStorage(root_dir=str(tmp_path)))
+    store = EmbeddingStore(cache.child("embedding_store").storage)
+    await store.add("models/embedding-1", ["alice", "bob"], [[1.0, 2.0], [3.0, 4.0]])
+    await store.flush()
+
+    store = EmbeddingStore(cache.child("embedding_store").storage)
+    assert await store.missing("models/embedding-1", ["bob", "carol"]) == ["carol"]
+    assert await store.missing("embedding-2", ["bob"]) == ["bob"]
+    table = pq.read_table(tmp_path / "embedding_store" / "models_embedding-1.parquet")
+    assert table.schema.field("vector").type == pa.list_(pa.float32(), 2)
+    vectors = await store.get("models/embedding-1", ["alice", "bob", "carol"])
+    assert vectors[0].tolist() == [1.0, 2.0]
+    assert vectors[1].tolist() == [3.0, 4.0]
+    assert vectors[2] is None
+
+
+async def test_embeddings_are_float32_without_a_store(model):
+    embeddings = await _embed(["alice", "bob"], None)
+
+    assert [embedding.dtype for embedding in embeddings] == [np.float32] * 2
+    assert embeddings[1].tolist() == pytest.approx([3, 1 / 3])
@@ -0,0 +1,49 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+import pandas as pd
+
+from graphrag.cache.noop_pipeline_cache import NoopPipelineCache
+from graphrag.callbacks.noop_workflow_callbacks import NoopWorkflowCallbacks
+from graphrag.index.operations.extract_covariates import (
+    extract_covariates as module,
+)
+from graphrag.index.operations.extract_covariates.typing import (
+    Covariate,
+    CovariateExtractionResult,
+)
+
+
+async def test_duplicate_texts_are_extracted_once(monkeypatch):
+    requests = []
+
+    async def run_extract_claims(input, **kwargs):  # noqa: RUF029
+        requests.append(input)
+        return CovariateExtractionResult([
+            Covariate(subject_id=input.upper(), description=f"{input} claim")
+        ])
+
+    monkeypatch.setattr(module, "run_extract_claims", run_extract_claims)
+    input = pd.DataFrame({
+        "id": ["1", "2", "3", "4"],
+        "text": ["disclaimer", "alice", "disclaimer", "disclaimer"],
+    })
+
+    covariates = await module.extract_covariates(
+        input,
+        NoopWorkflowCallbacks(),
+        NoopPipelineCache(),
+        "text",
+        "claim",
+        {},
+    )
+
+    assert sorted(requests) == ["alice", "disclaimer"]
+    assert covariates["text"].tolist() == input["text"].tolist()
+    assert covariates["subject_id"].tolist() == [
+        "DISCLAIMER",
+        "ALICE",
+        "DISCLAIMER",
+        "DISCLAIMER",
+    ]
+    assert set(covariates["covariate_type"]) == {"claim"}
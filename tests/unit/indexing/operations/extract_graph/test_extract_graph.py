@@ -0,0 +1,228 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+import pandas as pd
+import pytest
+
+from graphrag.cache.noop_pipeline_cache import NoopPipelineCache
+from graphrag.callbacks.noop_workflow_callbacks import NoopWorkflowCallbacks
+from graphrag.index.operations.extract_graph import extract_graph as module
+from graphrag.index.operations.extract_graph.records import ExtractionRecords
+from graphrag.index.operations.extract_graph.typing import (
+    Document,
+    EntityExtractionResult,
+)
+from graphrag.index.run.profiling import WorkflowProfiler
+from graphrag.storage.memory_pipeline_storage import MemoryPipelineStorage
+from graphrag.storage.pipeline_storage import PipelineStorage
+from graphrag.utils.storage import load_table_from_storage
+
+
+@pytest.fixture
+def requests(monkeypatch) -> list[str]:
+    """Record the text of each extraction request of a fake strategy."""
+    requests = []
+
+    async def strategy(docs, entity_types, callbacks, cache, config):  # noqa: RUF029
+        requests.append(docs[0].text)
+        text = docs[0].text
+        entities = [
+            {
+                "title": name,
+                "type": "PERSON",
+                "description": name.lower(),
+                "source_id": docs[0].id,
+            }
+            for name in ("ALICE", "BOB", "CAROL")
+            if name.lower() in text
+        ]
+        relationships = [
+            {
+                "source": "ALICE",
+                "target": "BOB",
+                "description": "friends",
+                "source_id": docs[0].id,
+                "weight": 2.0,
+            }
+        ]
+        return EntityExtractionResult(entities, relationships, None)
+
+    monkeypatch.setattr(module, "_load_strategy", lambda _: strategy)
+    return requests
+
+
+async def _extract(
+    pack_tokens: int, snapshot_storage: PipelineStorage | None = None
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    text_units = pd.DataFrame({
+        "id": ["1", "2", "3"],
+        "text": ["alice meets bob", "carol", "bob waves at alice"],
+        "n_tokens": [3, 1, 4],
+    })
+    return await module.extract_graph(
+        text_units,
+        NoopWorkflowCallbacks(),
+        NoopPipelineCache(),
+        "text",
+        "id",
+        {"pack_tokens": pack_tokens},
+        snapshot_storage=snapshot_storage,
+    )
+
+
+async def test_one_request_per_text_unit_without_packing(requests):
+    entities, relationships = await _extract(0)
+
+    assert sorted(requests) == ["alice meets bob", "bob waves at alice", "carol"]
+    assert entities.set_index("title")["text_unit_ids"].map(sorted).to_dict() == {
+        "ALICE": ["1", "3"],
+        "BOB": ["1", "3"],
+        "CAROL": ["2"],
+    }
+    assert relationships["weight"].tolist() == [6.0]
+
+
+async def test_packs_text_units_and_attributes_records_back(requests):
+    entities, relationships = await _extract(4)
+
+    assert sorted(requests) == ["alice meets bob\n\ncarol", "bob waves at alice"]
+    entities = entities.set_index("title")
+    assert sorted(entities.loc["ALICE", "text_unit_ids"]) == ["1", "3"]
+    assert entities.loc["CAROL", "text_unit_ids"] == ["2"]
+    assert entities.loc["CAROL", "frequency"] == 1
+    # the packed relationship is only found in text unit 1, so it keeps its weight
+    assert sorted(relationships.loc[0, "text_unit_ids"]) == ["1", "3"]
+    assert relationships["weight"].tolist() == [4.0]
+
+
+async def test_duplicate_texts_are_extracted_once(requests):
+    text_units = pd.DataFrame({
+        "id": ["1", "2", "3", "4"],
+        "text": ["alice meets bob", "carol", "alice meets bob", "alice meets bob"],
+        "n_tokens": [3, 1, 3, 3],
+    })
+
+    entities, relationships = await module.extract_graph(
+        text_units,
+        NoopWorkflowCallbacks(),
+        NoopPipelineCache(),
+        "text",
+        "id",
+        {},
+    )
+
+    assert sorted(requests) == ["alice meets bob", "carol"]
+    entities = entities.set_index("title")
+    assert entities.loc["ALICE", "text_unit_ids"] == ["1", "3", "4"]
+    assert entities.loc["ALICE", "frequency"] == 3
+    assert entities.loc["CAROL", "text_unit_ids"] == ["2"]
+    assert relationships["text_unit_ids"].tolist() == [["1", "3", "4", "2"]]
+    assert relationships["weight"].tolist() == [8.0]
+
+
+def test_attribute_records_falls_back_to_the_whole_pack():
+    docs = [Document(text="alice", id="1"), Document(text="bob", id="2")]
+    records = ExtractionRecords()
+    records.add_entity("DAVE...PERSON", "PERSON", "dave", "1")
+    records.add_relationship("ALICE", "BOB", "friends", "1", add_missing_ends=False)
+
+    with WorkflowProfiler("extract_graph") as profiler:
+        attributed = module._attribute_records(records, docs)  # noqa: SLF001
+
+    assert attributed.entity_source_ids == ["1", "2"]
+    assert attributed.relationship_source_ids == ["1", "2"]
+    assert attributed.relationship_weights == [0.5, 0.5]
+    # the relationship ends are mentioned, just not together
+    assert profiler.profile.attribution_fallbacks == 1
+
+
+def test_attribute_records_matches_whole_words():
+    docs = [
+        Document(text="Ann met the annual board.", id="1"),
+        Document(text="The planning of Ann's trip.", id="2"),
+        Document(text="Nobody here.", id="3"),
+    ]
+    records = ExtractionRecords()
+    records.add_entity("ANN", "PERSON", "ann", "1")
+    records.add_entity("PLAN", "EVENT", "plan", "1")
+
+    with WorkflowProfiler("extract_graph") as profiler:
+        attributed = module._attribute_records(records, docs)  # noqa: SLF001
+
+    assert attributed.entity_titles == ["ANN", "ANN", "PLAN", "PLAN", "PLAN"]
+    assert attributed.entity_source_ids == ["1", "2", "1", "2", "3"]
+    assert profiler.profile.attribution_fallbacks == 1
+
+
+async def test_snapshots_records_before_merging(requests):
+    storage = MemoryPipelineStorage()
+
+    await _extract(0, storage)
+
+    entities = await load_table_from_storage("non_merged_entities", storage)
+    relationships = await load_table_from_storage("non_merged_relationships", storage)
+    assert len(entities) == 5
+    assert len(relationships) == 3
+
+
+def test_merge_matches_pandas_groupby():
+    entities = pd.DataFrame({
+        "title": ["B", "A", "B", "C", "A"],
+        "type": ["T", "T", "T", "U", "T"],
+        "description": ["b1", "a1", "b2", "c1", "a1"],
+        "source_id": ["t1", "t1", "t2", "t2", "t3"],
+    })
+    relationships = pd.DataFrame({
+        "source": ["A", "B", "A"],
+        "target": ["B", "C", "B"],
+        "description": ["ab1", "bc1", "ab2"],
+        "source_id": ["t1", "t2", "t2"],
+        "weight": [1.0, 2.0, 0.5],
+    })
+
+    expected_entities = (
+        entities.groupby(["title", "type"], sort=False)
+        .agg(
+            description=("description", list),
+            text_unit_ids=("source_id", list),
+            frequency=("source_id", "count"),
+        )
+        .reset_index()
+    )
+    expected_relationships = (
+        relationships.groupby(["source", "target"], sort=False)
+        .agg(
+            description=("description", list),
+            text_unit_ids=("source_id", list),
+            weight=("weight", "sum"),
+        )
+        .reset_index()
+    )
+
+    pd.testing.assert_frame_equal(module._merge_entities(entities), expected_entities)  # noqa: SLF001
+    pd.testing.assert_frame_equal(
+        module._merge_relationships(relationships),  # noqa: SLF001
+        expected_relationships,
+    )
+    assert list(module._merge_entities(entities.iloc[:0]).columns) == [  # noqa: SLF001
+        "title",
+        "type",
+        "description",
+        "text_unit_ids",
+        "frequency",
+    ]
+
+
+def test_merge_keeps_null_descriptions():
+    entities = pd.DataFrame({
+        "title": ["A", "B", "A"],
+        "type": ["T", "T", "T"],
+        "description": [None, None, "a1"],
+        "source_id": ["t1", "t1", "t2"],
+    })
+
+    merged = module._merge_entities(entities)  # noqa: SLF001
+
+    assert merged["description"].tolist() == [[None, "a1"], [None]]
+    assert merged["text_unit_ids"].tolist() == [["t1", "t2"], ["t1"]]
+    assert merged["frequency"].tolist() == [2, 1]
@@ -0,0 +1,140 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+from graphrag.index.operations.extract_graph.gleaning import GleaningPolicy
+from graphrag.index.operations.extract_graph.graph_extractor import GraphExtractor
+from graphrag.index.run.profiling import WorkflowProfiler
+from tests.unit.indexing.verbs.helpers.mock_llm import create_mock_llm
+
+RESPONSE = """
+entities:
+ALICE
+PERSON
+Alice is a person
+relationships:
+""".strip()
+
+GLEANING = """
+entities:
+BOB
+PERSON
+Bob is a person
+relationships:
+ALICE
+PERSON
+BOB
+PERSON
+Alice knows Bob
+""".strip()
+
+
+def test_fixed_policy_always_gleans():
+    policy = GleaningPolicy(2)
+
+    assert policy.should_glean(0, 1000, 0, None, truncated=False)
+    assert policy.should_glean(1, 1000, 0, 0, truncated=False)
+    assert not policy.should_glean(2, 1000, 0, 0, truncated=False)
+    assert policy.stats.gleanings == 2
+
+
+def test_adaptive_policy_signals():
+    policy = GleaningPolicy(2, adaptive=True, min_density=2.0, explore_every=100)
+
+    # dense text units glean, sparse ones do not unless their response was cut off
+    assert policy.should_glean(0, 1000, 10, None, truncated=False)
+    assert not policy.should_glean(0, 1000, 1, None, truncated=False)
+    assert policy.should_glean(0, 1000, 1, None, truncated=True)
+    # a gleaning that found nothing ends the text unit's rounds
+    assert not policy.should_glean(1, 1000, 10, 0, truncated=False)
+
+    assert policy.stats.gleanings == 2
+    assert policy.stats.skipped == 3
+    assert policy.stats.truncated == 1
+
+
+def test_adaptive_policy_backs_off_when_gleaning_stops_paying_off():
+    policy = GleaningPolicy(1, adaptive=True, warmup=4, explore_every=3)
+    for _ in range(4):
+        assert policy.should_glean(0, 100, 10, None, truncated=False)
+        policy.record_yield(0)
+
+    decisions = [
+        policy.should_glean(0, 100, 10, None, truncated=False) for _ in range(6)
+    ]
+
+    assert decisions == [False, False, True, False, False, True]
+
+
+async def test_extractor_skips_gleaning_and_reports_stats():
+    policy = GleaningPolicy(1, adaptive=True)
+    extractor = GraphExtractor(
+        model_invoker=create_mock_llm(
+            [RESPONSE, RESPONSE, GLEANING], name="test_extractor_skips_gleaning"
+        ),
+        gleaning_policy=policy,
+        max_gleanings=1,
+    )
+
+    with WorkflowProfiler("extract_graph") as profiler:
+        # a single record in a long text unit is too sparse to glean
+        sparse = await extractor(["word " * 1000], {"entity_types": ["person"]})
+        # the same record in a short text unit is worth a gleaning round
+        dense = await extractor(["Alice and Bob"], {"entity_types": ["person"]})
+
+    assert sparse.output.num_entities == 1
+    assert dense.output.num_entities == 2
+    assert dense.output.num_relationships == 1
+    assert profiler.profile.gleanings == 1
+    assert profiler.profile.gleanings_skipped == 1
+    assert profiler.profile.gleaning_records == 2
+
+
+def test_fenced_complete_response_is_not_truncated():
+    extractor = GraphExtractor(
+        model_invoker=create_mock_llm([], name="test_fenced_response"),
+        gleaning_policy=GleaningPolicy(1, adaptive=True),
+    )
+    fenced = f"```\n{GLEANING}\n```"
+
+    # the extractor checks responses once their fences are removed
+    assert not extractor._is_truncated(fenced.replace("```", ""))  # noqa: SLF001
+    assert not extractor._is_truncated(GLEANING)  # noqa: SLF001
+    assert extractor._is_truncated(GLEANING.rsplit("\n", 1)[0])  # noqa: SLF001
+
+
+async def test_extractor_skips_gleaning_after_a_fenced_response():
+    policy = GleaningPolicy(1, adaptive=True)
+    extractor = GraphExtractor(
+        model_invoker=create_mock_llm(
+            [f"```\n{RESPONSE}\n```", GLEANING], name="test_fenced_gleaning"
+        ),
+        gleaning_policy=policy,
+        max_gleanings=1,
+    )
+
+    # a sparse, complete response: its fence must not read as a cut-off relationship
+    result = await extractor(["word " * 1000], {"entity_types": ["person"]})
+
+    assert result.output.num_entities == 1
+    assert policy.stats.gleanings == 0
+    assert policy.stats.truncated == 0
+
+
+async def test_response_cut_off_before_relationships_is_gleaned():
+    policy = GleaningPolicy(1, adaptive=True)
+    extractor = GraphExtractor(
+        model_invoker=create_mock_llm(
+            [RESPONSE.split("relationships:")[0], GLEANING],
+            name="test_cut_off_gleaning",
+        ),
+        gleaning_policy=policy,
+        max_gleanings=1,
+    )
+
+    # too sparse to glean, but the missing relationships section reads as truncated
+    result = await extractor(["word " * 1000], {"entity_types": ["person"]})
+
+    assert result.output.num_entities == 2
+    assert result.output.num_relationships == 1
+    assert policy.stats.gleanings == 1
+    assert policy.stats.truncated == 1
@@ -0,0 +1,90 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+from graphrag.index.operations.summarize_descriptions.description_summary_extractor import (
+    SummarizeExtractor,
+)
+from graphrag.index.utils.tokens import num_tokens_from_string
+
+PROMPT = "{entity_name}: {description_list}"
+
+
+class FakeModel:
+    """Summarizes a description list to the number of descriptions it covers."""
+
+    def __init__(self):
+        self.requests: list[list[str]] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def achat(self, prompt: str, **kwargs):
+        descriptions = json.loads(prompt.split(": ", 1)[1])
+        self.requests.append(descriptions)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0)
+        self.in_flight -= 1
+        covered = sum(
+            int(description.split()[1]) if description.startswith("summary") else 1
+            for description in descriptions
+        )
+        return SimpleNamespace(
+            output=SimpleNamespace(content=f"summary {covered:02} of a hub entity")
+        )
+
+
+def _descriptions(count: int) -> list[str]:
+    return [f"description {i:02} of a hub entity" for i in range(count)]
+
+
+def _extractor(
+    model: FakeModel, tree_reduce: bool, limiter: asyncio.Semaphore | None = None
+) -> SummarizeExtractor:
+    # room for three descriptions per request
+    return SummarizeExtractor(
+        model_invoker=model,  # type: ignore
+        summarization_prompt=PROMPT,
+        max_input_tokens=num_tokens_from_string(PROMPT)
+        + 3 * num_tokens_from_string(_descriptions(1)[0]),
+        tree_reduce=tree_reduce,
+        limiter=limiter,
+    )
+
+
+async def test_tree_reduce_summarizes_shards_concurrently():
+    model = FakeModel()
+    extractor = _extractor(model, tree_reduce=True, limiter=asyncio.Semaphore(4))
+
+    result = await extractor("HUB", _descriptions(27))
+
+    assert result.description == "summary 27 of a hub entity"
+    # 27 descriptions -> 9 shard summaries -> 3 -> 1
+    assert len(model.requests) == 13
+    # the 9 shards of the first level share the 4 slots of the limiter
+    assert model.max_in_flight == 4
+    assert model.requests[:2] == [_descriptions(27)[:3], _descriptions(27)[3:6]]
+
+
+async def test_tree_reduce_without_a_limiter_is_sequential():
+    model = FakeModel()
+
+    result = await _extractor(model, tree_reduce=True)("HUB", _descriptions(27))
+
+    assert result.description == "summary 27 of a hub entity"
+    assert len(model.requests) == 13
+    assert model.max_in_flight == 1
+
+
+async def test_rolling_summarization_is_sequential():
+    model = FakeModel()
+
+    result = await _extractor(model, tree_reduce=False)("HUB", _descriptions(27))
+
+    assert result.description == "summary 27 of a hub entity"
+    # one request after another, each carrying the summary so far
+    assert len(model.requests) == 9
+    assert model.max_in_flight == 1
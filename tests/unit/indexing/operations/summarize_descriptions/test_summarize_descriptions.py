@@ -0,0 +1,100 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+import importlib
+
+import pandas as pd
+import pytest
+
+from graphrag.cache.noop_pipeline_cache import NoopPipelineCache
+from graphrag.callbacks.noop_workflow_callbacks import NoopWorkflowCallbacks
+from graphrag.index.operations.summarize_descriptions.typing import (
+    SummarizedDescriptionResult,
+)
+
+# the package re-exports the verb under the module's name
+module = importlib.import_module(
+    "graphrag.index.operations.summarize_descriptions.summarize_descriptions"
+)
+
+ENTITIES = pd.DataFrame({
+    "title": ["ALICE", "BOB", "CAROL"],
+    "description": [
+        ["Alice is a baker", "Alice lives in Paris", "Alice is a baker"],
+        ["Bob is a pilot"],
+        [],
+    ],
+})
+RELATIONSHIPS = pd.DataFrame({
+    "source": ["ALICE", "ALICE"],
+    "target": ["BOB", "CAROL"],
+    "description": [
+        [
+            "Alice and Bob are siblings who grew up together in a small town",
+            "Alice taught Bob how to bake bread",
+        ],
+        ["Alice knows Carol"],
+    ],
+})
+
+
+@pytest.fixture
+def requests(monkeypatch):
+    requests = []
+
+    async def summarize(id, descriptions, callbacks, cache, args):  # noqa: RUF029
+        requests.append((id, descriptions))
+        return SummarizedDescriptionResult(id=id, description=f"summary of {id}")
+
+    monkeypatch.setattr(module, "load_strategy", lambda _: summarize)
+    return requests
+
+
+async def _summarize(**strategy):
+    return await module.summarize_descriptions(
+        ENTITIES,
+        RELATIONSHIPS,
+        NoopWorkflowCallbacks(),
+        NoopPipelineCache(),
+        strategy=strategy,
+        num_threads=1,
+    )
+
+
+async def test_summaries_are_queued_by_description_volume(requests):
+    entities, relationships = await _summarize()
+
+    # single descriptions are kept as they are, the rest is queued largest first
+    assert requests == [
+        (
+            ("ALICE", "BOB"),
+            [
+                "Alice and Bob are siblings who grew up together in a small town",
+                "Alice taught Bob how to bake bread",
+            ],
+        ),
+        ("ALICE", ["Alice is a baker", "Alice lives in Paris"]),
+    ]
+    assert entities.to_dict("records") == [
+        {"title": "ALICE", "description": "summary of ALICE"},
+        {"title": "BOB", "description": "Bob is a pilot"},
+        {"title": "CAROL", "description": ""},
+    ]
+    assert relationships.to_dict("records") == [
+        {
+            "source": "ALICE",
+            "target": "BOB",
+            "description": "summary of ('ALICE', 'BOB')",
+        },
+        {"source": "ALICE", "target": "CAROL", "description": "Alice knows Carol"},
+    ]
+
+
+async def test_descriptions_within_length_are_not_summarized(requests):
+    entities, relationships = await _summarize(
+        skip_within_length=True, max_summary_length=10
+    )
+
+    assert [id for id, _ in requests] == [("ALICE", "BOB")]
+    assert entities["description"][0] == "Alice is a baker\nAlice lives in Paris"
+    assert relationships["description"][0] == "summary of ('ALICE', 'BOB')"
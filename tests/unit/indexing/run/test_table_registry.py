@@ -0,0 +1,116 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+import asyncio
+import hashlib
+
+import pandas as pd
+
+from graphrag.index.run.table_registry import TableRegistry
+from graphrag.storage.memory_pipeline_storage import MemoryPipelineStorage
+from graphrag.utils.storage import load_table_from_storage, storage_has_table
+
+MB = 1024 * 1024
+
+
+async def test_write_through_when_disabled():
+    storage = MemoryPipelineStorage()
+    tables = TableRegistry(storage)
+
+    await tables.write("words", pd.DataFrame({"n": [1, 2]}))
+
+    assert not tables.enabled
+    assert await storage_has_table("words", storage)
+    assert tables.size == 0
+
+
+async def test_handoff_and_write_behind():
+    storage = MemoryPipelineStorage()
+    tables = TableRegistry(storage, MB)
+    words = pd.DataFrame({"n": [1, 2]})
+
+    await tables.write("words", words)
+    loaded = await tables.load("words")
+    loaded["n"] = [5, 5]
+
+    assert (await tables.load("words"))["n"].tolist() == [1, 2]
+    assert await tables.has("words")
+
+    await tables.flush()
+    stored = await load_table_from_storage("words", storage)
+    assert stored["n"].tolist() == [1, 2]
+
+
+async def test_writes_of_same_table_persist_in_order():
+    storage = MemoryPipelineStorage()
+    tables = TableRegistry(storage, MB)
+
+    await tables.write("words", pd.DataFrame({"n": list(range(10_000))}))
+    await tables.write("words", pd.DataFrame({"n": [1]}))
+    await tables.flush(["words"])
+
+    assert (await load_table_from_storage("words", storage))["n"].tolist() == [1]
+    assert tables.version("words") == 2
+
+
+async def test_evicts_least_recently_used_over_limit():
+    storage = MemoryPipelineStorage()
+    table = pd.DataFrame({"n": list(range(50_000))})
+    size = int(table.memory_usage(index=True, deep=True).sum())
+    tables = TableRegistry(storage, int(size * 2.5))
+
+    await tables.write("a", table)
+    await tables.write("b", table)
+    await tables.load("a")
+    await tables.write("c", table)
+
+    assert tables.size == size * 2
+    # b was evicted, so it must have been persisted first
+    assert await storage_has_table("b", storage)
+    assert (await tables.load("b"))["n"].tolist() == table["n"].tolist()
+
+
+async def test_table_over_limit_is_only_persisted():
+    storage = MemoryPipelineStorage()
+    tables = TableRegistry(storage, 1)
+
+    await tables.write("words", pd.DataFrame({"n": [1, 2]}))
+
+    assert tables.size == 0
+    assert (await tables.load("words"))["n"].tolist() == [1, 2]
+
+
+async def test_digest_of_persisted_bytes():
+    storage = MemoryPipelineStorage()
+
+    for memory_limit in (0, MB):
+        tables = TableRegistry(storage, memory_limit)
+        await tables.write("words", pd.DataFrame({"n": [memory_limit]}))
+        await tables.flush()
+
+        data = await storage.get("words.parquet", as_bytes=True)
+        assert await tables.digest("words") == hashlib.sha256(data).hexdigest()
+
+
+async def test_digest_does_not_wait_for_the_storage_write():
+    class SlowStorage(MemoryPipelineStorage):
+        def __init__(self):
+            super().__init__()
+            self.release = asyncio.Event()
+
+        async def set(self, key, value, encoding=None) -> None:
+            await self.release.wait()
+            await super().set(key, value, encoding)
+
+    storage = SlowStorage()
+    tables = TableRegistry(storage, MB)
+    words = pd.DataFrame({"n": [1, 2]})
+
+    await tables.write("words", words)
+    digest = await tables.digest("words")
+
+    assert digest == hashlib.sha256(words.to_parquet()).hexdigest()
+    assert not await storage_has_table("words", storage)
+    storage.release.set()
+    await tables.flush()
+    assert await tables.digest("words") == digest
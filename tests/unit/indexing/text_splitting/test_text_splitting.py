@@ -7,8 +7,10 @@ from unittest.mock import MagicMock
 import pytest
 import tiktoken
 
+from graphrag.index.text_splitting import text_splitting
 from graphrag.index.text_splitting.text_splitting import (
     NoopTextSplitter,
+    TokenizedTexts,
     Tokenizer,
     TokenTextSplitter,
     split_multiple_texts_on_tokens,
@@ -202,3 +204,111 @@ def test_split_single_text_on_tokens_no_overlap():
 
     result = split_single_text_on_tokens(text=text, tokenizer=tokenizer)
     assert result == expected_splits
+
+
+def test_split_multiple_texts_on_tokens_batches_and_tracks_sources(monkeypatch):
+    monkeypatch.setattr(text_splitting, "MIN_ENCODE_BATCH_SIZE", 1)
+    texts = ["abcdef", "", "gh", "ijklmnopq"]
+    mocked_tokenizer = MockTokenizer()
+    mock_tick = MagicMock()
+    encode_batch = MagicMock(
+        side_effect=lambda batch: [mocked_tokenizer.encode(text) for text in batch]
+    )
+    tokenizer = Tokenizer(
+        chunk_overlap=1,
+        tokens_per_chunk=4,
+        decode=mocked_tokenizer.decode,
+        encode=mocked_tokenizer.encode,
+        encode_batch=encode_batch,
+    )
+
+    result = split_multiple_texts_on_tokens(texts, tokenizer, tick=mock_tick)
+
+    encode_batch.assert_called_once_with(texts)
+    mock_tick.assert_called_once_with(4)
+    assert [
+        (chunk.text_chunk, sorted(chunk.source_doc_indices), chunk.n_tokens)
+        for chunk in result
+    ] == [
+        ("abcd", [0], 4),
+        ("defg", [0, 2], 4),
+        ("ghij", [2, 3], 4),
+        ("jklm", [3], 4),
+        ("mnop", [3], 4),
+        ("pq", [3], 2),
+    ]
+
+
+def test_few_texts_are_encoded_without_the_batch_encoder():
+    mocked_tokenizer = MockTokenizer()
+    encode_batch = MagicMock()
+    tokenizer = Tokenizer(
+        chunk_overlap=0,
+        tokens_per_chunk=4,
+        decode=mocked_tokenizer.decode,
+        encode=mocked_tokenizer.encode,
+        encode_batch=encode_batch,
+    )
+
+    result = split_single_text_on_tokens(text="abcdef", tokenizer=tokenizer)
+
+    assert result == ["abcd", "ef"]
+    encode_batch.assert_not_called()
+
+
+def test_tokenized_texts_rejects_overlap_of_a_whole_chunk():
+    tokenized = TokenizedTexts.from_encoded([[1, 2, 3]])
+
+    assert tokenized.num_texts == 1
+    with pytest.raises(ValueError, match="must be smaller than the chunk size"):
+        tokenized.windows(tokens_per_chunk=2, chunk_overlap=2)
+
+
+def test_split_multiple_texts_on_tokens_records_spans():
+    texts = ["abcdef", "ghij"]
+    mocked_tokenizer = MockTokenizer()
+    tokenizer = Tokenizer(
+        chunk_overlap=1,
+        tokens_per_chunk=4,
+        decode=mocked_tokenizer.decode,
+        encode=mocked_tokenizer.encode,
+        token_offsets=lambda token_ids: list(range(len(token_ids))),
+    )
+
+    result = split_multiple_texts_on_tokens(texts, tokenizer, tick=MagicMock())
+
+    assert [
+        (chunk.text_chunk, chunk.start_char, chunk.end_char, chunk.start_token)
+        for chunk in result
+    ] == [
+        ("abcd", 0, 4, 0),
+        ("defg", None, None, None),
+        ("ghij", 0, 4, 0),
+        ("j", 3, 4, 3),
+    ]
+
+
+def test_split_multiple_texts_on_content_keeps_chunks_around_edits():
+    text = "".join(f"Sentence {i} talks about topic {i * 7 % 13}. " for i in range(200))
+    edited = text[:300] + "An inserted sentence. " + text[300:]
+    mocked_tokenizer = MockTokenizer()
+    tokenizer = Tokenizer(
+        chunk_overlap=0,
+        tokens_per_chunk=64,
+        decode=mocked_tokenizer.decode,
+        encode=mocked_tokenizer.encode,
+    )
+
+    def split(text: str) -> list[str]:
+        chunks = split_multiple_texts_on_tokens(
+            [text], tokenizer, tick=MagicMock(), content_defined=True
+        )
+        assert all(chunk.n_tokens <= 64 for chunk in chunks)
+        return [chunk.text_chunk for chunk in chunks]
+
+    original = split(text)
+    assert "".join(original) == text
+    # only the chunks next to the edit change, fixed windows would all shift after it
+    changed = set(split(edited)) - set(original)
+    assert len(original) > 100
+    assert 1 <= len(changed) <= 3
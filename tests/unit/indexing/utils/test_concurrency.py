@@ -0,0 +1,125 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+import asyncio
+
+import pandas as pd
+import pytest
+
+from graphrag.callbacks.noop_workflow_callbacks import NoopWorkflowCallbacks
+from graphrag.index.utils.concurrency import (
+    AdaptiveLimiter,
+    create_limiter,
+    report_rate_limit,
+)
+from graphrag.index.utils.derive_from_rows import derive_from_rows
+from graphrag.logger.progress import Concurrency
+
+
+class RateLimitError(Exception):
+    pass
+
+
+class ConcurrencyRecorder(NoopWorkflowCallbacks):
+    def __init__(self):
+        self.reports: list[Concurrency] = []
+
+    def concurrency(self, concurrency: Concurrency) -> None:
+        self.reports.append(concurrency)
+
+
+async def test_grows_additively_while_healthy():
+    callbacks = ConcurrencyRecorder()
+    limiter = AdaptiveLimiter(2, max_limit=4, callbacks=callbacks, name="test")
+
+    # one step per `limit` completions
+    for _ in range(2 + 3):
+        async with limiter:
+            pass
+
+    assert limiter.limit == 4
+    assert [report.limit for report in callbacks.reports] == [3, 4]
+    assert callbacks.reports[0].name == "test"
+    assert callbacks.reports[0].throughput > 0
+
+    for _ in range(10):
+        async with limiter:
+            pass
+    assert limiter.limit == 4
+
+
+async def test_cuts_multiplicatively_once_per_round_trip():
+    limiter = AdaptiveLimiter(8, max_limit=8)
+
+    async def rate_limited():
+        async with limiter:
+            await asyncio.sleep(0.01)
+            raise RateLimitError
+
+    # all eight requests were sent under the old limit, so they cut it only once
+    results = await asyncio.gather(
+        *[rate_limited() for _ in range(8)], return_exceptions=True
+    )
+    assert all(isinstance(result, RateLimitError) for result in results)
+    assert limiter.limit == 4
+
+    async with limiter:
+        report_rate_limit()
+    assert limiter.limit == 2
+    assert limiter.in_flight == 0
+
+
+async def test_holds_on_errors_and_slow_responses():
+    limiter = AdaptiveLimiter(1, max_limit=10, latency_tolerance=2.0)
+
+    async def fail():
+        async with limiter:
+            msg = "boom"
+            raise ValueError(msg)
+
+    with pytest.raises(ValueError, match="boom"):
+        await fail()
+    assert limiter.limit == 1
+
+    async with limiter:
+        pass
+    assert limiter.limit == 2
+
+    for _ in range(4):
+        async with limiter:
+            await asyncio.sleep(0.05)
+    assert limiter.limit == 2
+
+
+async def test_never_exceeds_the_limit_in_derive_from_rows():
+    limiter = AdaptiveLimiter(2, max_limit=6)
+    in_flight = 0
+    peak = 0
+
+    async def transform(row: dict) -> int:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        assert in_flight <= limiter.limit
+        await asyncio.sleep(0)
+        in_flight -= 1
+        return row["n"]
+
+    input = pd.DataFrame({"n": range(100)})
+    results = await derive_from_rows(input, transform, limiter=limiter)
+
+    assert results == list(range(100))
+    assert limiter.limit == 6
+    assert 2 < peak <= 6
+
+
+def test_create_limiter_follows_model_config():
+    assert create_limiter(None, 4) is None
+    assert create_limiter({"adaptive_concurrency": False}, 4) is None
+
+    limiter = create_limiter(
+        {"adaptive_concurrency": True, "max_concurrent_requests": 50}, 4
+    )
+    assert limiter is not None
+    assert limiter.limit == 4
+    assert limiter.max_limit == 50
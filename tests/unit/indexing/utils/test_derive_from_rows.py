@@ -0,0 +1,131 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+import asyncio
+import os
+import threading
+
+import pandas as pd
+import pytest
+
+from graphrag.callbacks.noop_workflow_callbacks import NoopWorkflowCallbacks
+from graphrag.config.enums import AsyncType
+from graphrag.index.utils.derive_from_rows import (
+    ParallelizationError,
+    derive_from_rows,
+)
+
+_offset = 0
+
+
+def _init_offset(offset: int) -> None:
+    global _offset
+    _offset = offset
+
+
+def _add_offset(row: dict) -> tuple[int, int]:
+    return (row["n"] + _offset, os.getpid())
+
+
+def _fail_on_odd(row: dict) -> int:
+    if row["n"] % 2:
+        msg = f"odd {row['n']}"
+        raise ValueError(msg)
+    return row["n"]
+
+
+class ErrorCounter(NoopWorkflowCallbacks):
+    def __init__(self):
+        self.errors = 0
+
+    def error(self, *args, **kwargs):
+        self.errors += 1
+
+
+async def test_process_mode_keeps_order_and_initializes_workers():
+    input = pd.DataFrame({"n": range(100)})
+
+    results = await derive_from_rows(
+        input,
+        _add_offset,
+        num_threads=2,
+        async_type=AsyncType.Process,
+        initializer=_init_offset,
+        initargs=(1000,),
+    )
+
+    assert [value for value, _ in results] == list(range(1000, 1100))
+    assert os.getpid() not in {pid for _, pid in results}
+
+
+async def test_process_mode_aggregates_errors():
+    input = pd.DataFrame({"n": range(10)})
+    callbacks = ErrorCounter()
+
+    with pytest.raises(ParallelizationError, match="5 Errors occurred"):
+        await derive_from_rows(
+            input, _fail_on_odd, callbacks, num_threads=2, async_type=AsyncType.Process
+        )
+
+    assert callbacks.errors == 5
+
+
+@pytest.mark.parametrize("async_type", [AsyncType.AsyncIO, AsyncType.Threaded])
+async def test_bounded_concurrency_keeps_order(async_type):
+    input = pd.DataFrame({"n": range(200), "text": [f"t{i}" for i in range(200)]})
+    in_flight = 0
+    peak = 0
+
+    async def transform(row: dict) -> str:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        return f"{row['n']}:{row['text']}"
+
+    results = await derive_from_rows(
+        input, transform, num_threads=8, async_type=async_type
+    )
+
+    assert results == [f"{i}:t{i}" for i in range(200)]
+    assert peak <= 8
+
+
+async def test_threaded_mode_runs_blocking_transforms_in_threads():
+    input = pd.DataFrame({"n": range(4)})
+
+    results = await derive_from_rows(
+        input,
+        lambda _: threading.get_ident(),
+        num_threads=4,
+        async_type=AsyncType.Threaded,
+    )
+
+    assert threading.get_ident() not in results
+
+
+async def test_empty_input():
+    assert await derive_from_rows(pd.DataFrame({"n": []}), _fail_on_odd) == []
+
+
+async def test_cost_schedules_expensive_rows_first_and_keeps_order():
+    input = pd.DataFrame({"n": range(6), "n_tokens": [5, 50, 5, 20, 50, 1]})
+    started = []
+
+    async def transform(row: dict) -> int:
+        started.append(row["n"])
+        await asyncio.sleep(0)
+        return row["n"]
+
+    results = await derive_from_rows(
+        input, transform, num_threads=1, cost=input["n_tokens"]
+    )
+
+    assert results == list(range(6))
+    assert started == [1, 4, 3, 0, 2, 5]
+
+
+async def test_cost_must_cover_every_row():
+    with pytest.raises(ValueError, match="Expected a cost for each of the 2 rows"):
+        await derive_from_rows(pd.DataFrame({"n": [1, 2]}), _fail_on_odd, cost=[1])
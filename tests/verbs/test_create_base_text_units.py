@@ -2,6 +2,7 @@
 # Licensed under the MIT License
 
 from graphrag.config.create_graphrag_config import create_graphrag_config
+from graphrag.index.utils.text_units import materialize_text
 from graphrag.index.workflows.create_base_text_units import run_workflow
 from graphrag.utils.storage import load_table_from_storage
 
@@ -28,6 +29,28 @@ async def test_create_base_text_units():
     compare_outputs(actual, expected, columns=["text", "document_ids", "n_tokens"])
 
 
+async def test_create_base_text_units_spans():
+    expected = load_test_table("text_units")
+
+    context = await create_test_context()
+
+    config = create_graphrag_config({"models": DEFAULT_MODEL_CONFIG})
+    config.chunks.store_spans = True
+
+    await run_workflow(config, context)
+
+    actual = await load_table_from_storage("text_units", context.storage)
+    documents = await load_table_from_storage("documents", context.storage)
+
+    assert actual["text"].isna().all()
+    assert (actual["end_token"] - actual["start_token"] == actual["n_tokens"]).all()
+    compare_outputs(
+        materialize_text(actual, documents),
+        expected,
+        columns=["text", "document_ids", "n_tokens"],
+    )
+
+
 async def test_create_base_text_units_metadata():
     expected = load_test_table("text_units_metadata")
 
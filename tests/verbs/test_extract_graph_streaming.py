@@ -0,0 +1,178 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+import pandas as pd
+
+from graphrag.cache.noop_pipeline_cache import NoopPipelineCache
+from graphrag.callbacks.noop_workflow_callbacks import NoopWorkflowCallbacks
+from graphrag.config.create_graphrag_config import create_graphrag_config
+from graphrag.index.operations.extract_graph.extract_graph import (
+    _merge_entities,
+    _merge_relationships,
+)
+from graphrag.index.workflows import extract_graph_streaming as module
+from graphrag.index.workflows.create_base_text_units import create_base_text_units
+from graphrag.index.workflows.extract_graph_streaming import (
+    _batch_documents,
+    _in_first_seen_order,
+    _MergedRecords,
+)
+from graphrag.index.workflows.factory import PipelineFactory
+from graphrag.storage.file_pipeline_storage import FilePipelineStorage
+from graphrag.utils.storage import load_table_from_storage
+
+from .util import DEFAULT_MODEL_CONFIG, create_test_context
+
+
+async def test_batched_chunking_matches_full_chunking():
+    context = await create_test_context()
+    documents = await load_table_from_storage("documents", context.storage)
+    chunks = create_graphrag_config({"models": DEFAULT_MODEL_CONFIG}).chunks
+
+    def chunk(docs: pd.DataFrame) -> pd.DataFrame:
+        return create_base_text_units(
+            docs,
+            NoopWorkflowCallbacks(),
+            chunks.group_by_columns,
+            chunks.size,
+            chunks.overlap,
+            chunks.encoding_model,
+            strategy=chunks.strategy,
+        )
+
+    batches = _batch_documents(documents, chunks.group_by_columns, 2)
+    assert len(batches) == (len(documents) + 1) // 2
+
+    expected = chunk(documents)
+    actual = pd.concat([chunk(batch) for batch in batches], ignore_index=True)
+    assert actual["text"].tolist() == expected["text"].tolist()
+    assert actual["document_ids"].tolist() == expected["document_ids"].tolist()
+
+
+def test_incremental_merge_matches_single_merge():
+    entities = [
+        pd.DataFrame({
+            "title": ["A", "B"],
+            "type": ["PERSON", "PERSON"],
+            "description": ["a1", "b1"],
+            "source_id": ["t1", "t1"],
+        }),
+        pd.DataFrame({
+            "title": ["A", "C"],
+            "type": ["PERSON", "GEO"],
+            "description": ["a2", "c1"],
+            "source_id": ["t2", "t2"],
+        }),
+    ]
+    relationships = [
+        pd.DataFrame({
+            "source": ["A"],
+            "target": ["B"],
+            "description": ["ab1"],
+            "source_id": ["t1"],
+            "weight": [1.0],
+        }),
+        pd.DataFrame({
+            "source": ["A", "A"],
+            "target": ["B", "C"],
+            "description": ["ab2", "ac1"],
+            "source_id": ["t2", "t2"],
+            "weight": [2.0, 1.0],
+        }),
+    ]
+
+    def first_seen(merged: pd.DataFrame, batch: int) -> pd.DataFrame:
+        return merged.assign(_batch=batch, _position=range(len(merged)))
+
+    # the records of each key are spread over buckets, folded separately
+    titles = [{"A"}, {"B", "C"}]
+    merged_entities = [_MergedRecords(("title", "type"), "frequency") for _ in titles]
+    for batch, records in enumerate(entities):
+        merged = first_seen(_merge_entities(records), batch)
+        for bucket, bucket_titles in zip(merged_entities, titles, strict=True):
+            bucket.add(merged[merged["title"].isin(bucket_titles)])
+    merged_relationships = _MergedRecords(("source", "target"), "weight")
+    for batch, records in enumerate(relationships):
+        merged_relationships.add(first_seen(_merge_relationships(records), batch))
+
+    pd.testing.assert_frame_equal(
+        _in_first_seen_order([bucket.to_frame() for bucket in merged_entities]),
+        _merge_entities(pd.concat(entities, ignore_index=True)),
+        check_dtype=False,
+    )
+    pd.testing.assert_frame_equal(
+        _in_first_seen_order([merged_relationships.to_frame()]),
+        _merge_relationships(pd.concat(relationships, ignore_index=True)),
+    )
+
+
+def test_documents_without_groups_form_one_batch():
+    documents = pd.DataFrame({"id": ["3", "1", "2", "5", "4"], "text": list("abcde")})
+
+    batches = _batch_documents(documents, [], 2)
+
+    assert [batch["id"].tolist() for batch in batches] == [["1", "2", "3", "4", "5"]]
+
+
+async def test_streaming_extracts_and_merges_every_batch(monkeypatch, tmp_path):
+    async def extract(text_units, snapshot_suffix, **_kwargs):  # noqa: RUF029
+        ids = text_units["id"].tolist()
+        entities = pd.DataFrame({
+            "title": [f"B{snapshot_suffix}", "A"],
+            "type": ["PERSON", "PERSON"],
+            "description": [["b"], ["a"] * len(ids)],
+            "text_unit_ids": [ids, ids],
+            "frequency": [len(ids), len(ids)],
+        })
+        relationships = pd.DataFrame({
+            "source": ["A"],
+            "target": ["B"],
+            "description": [["ab"]],
+            "text_unit_ids": [ids],
+            "weight": [1.0],
+        })
+        return entities, relationships
+
+    async def summarize(extracted_entities, extracted_relationships, **_kwargs):  # noqa: RUF029
+        return extracted_entities, extracted_relationships
+
+    monkeypatch.setattr(module, "extractor", extract)
+    monkeypatch.setattr(module, "get_summarized_entities_relationships", summarize)
+    documents = pd.DataFrame({
+        "id": ["1", "2", "3"],
+        "title": ["a", "b", "c"],
+        "text": ["one", "two", "three"],
+    })
+    chunks = create_graphrag_config({"models": DEFAULT_MODEL_CONFIG}).chunks
+    storage = FilePipelineStorage(str(tmp_path))
+    partitions = storage.child("partitions")
+
+    entities, relationships = await module.extract_graph_streaming(
+        documents,
+        NoopWorkflowCallbacks(),
+        NoopPipelineCache(),
+        partitions,
+        storage,
+        chunks,
+        batch_size=2,
+    )
+
+    text_units = await load_table_from_storage("text_units", storage)
+    assert text_units["text"].tolist() == ["one", "two", "three"]
+    assert entities["title"].tolist() == ["B.0", "A", "B.1"]
+    assert entities["text_unit_ids"].tolist()[1] == text_units["id"].tolist()
+    assert entities["frequency"].tolist() == [2, 3, 1]
+    assert relationships["weight"].tolist() == [2.0]
+    assert list((tmp_path / "partitions").iterdir()) == []
+
+
+def test_streaming_pipeline():
+    config = create_graphrag_config({"models": DEFAULT_MODEL_CONFIG})
+    config.streaming.enabled = True
+
+    pipeline = PipelineFactory.create_pipeline(config)
+    names = pipeline.names()
+
+    assert names[0] == "extract_graph_streaming"
+    assert "create_base_text_units" not in names
+    assert "extract_graph" not in names
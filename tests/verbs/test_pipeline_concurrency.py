@@ -0,0 +1,99 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Tests for running independent workflows concurrently."""
+
+import asyncio
+
+import pandas as pd
+
+from graphrag.cache.memory_pipeline_cache import InMemoryCache
+from graphrag.callbacks.noop_workflow_callbacks import NoopWorkflowCallbacks
+from graphrag.config.create_graphrag_config import create_graphrag_config
+from graphrag.config.models.graph_rag_config import GraphRagConfig
+from graphrag.index.run.run_pipeline import _run_pipeline
+from graphrag.index.typing.context import PipelineRunContext
+from graphrag.index.typing.pipeline import Pipeline
+from graphrag.index.typing.workflow import WorkflowDependencies, WorkflowFunctionOutput
+from graphrag.index.workflows.factory import PipelineFactory
+from graphrag.logger.null_progress import NullProgressLogger
+from graphrag.storage.memory_pipeline_storage import MemoryPipelineStorage
+from tests.verbs.util import DEFAULT_MODEL_CONFIG
+
+
+def test_standard_pipeline_predecessors():
+    config = create_graphrag_config({"models": DEFAULT_MODEL_CONFIG})
+    config.extract_claims.enabled = True
+    pipeline = PipelineFactory.create_pipeline(config)
+    names = pipeline.names()
+    waits = {
+        names[index]: {names[p] for p in predecessors}
+        for index, predecessors in enumerate(pipeline.predecessors())
+    }
+
+    assert waits["extract_graph"] == {"create_base_text_units"}
+    assert waits["extract_covariates"] == {"create_base_text_units"}
+    assert waits["finalize_graph"] == {"extract_graph"}
+    assert waits["create_communities"] == {"finalize_graph"}
+    # create_final_text_units rewrites text_units, so it waits for every earlier reader
+    assert waits["create_final_text_units"] == {
+        "create_base_text_units",
+        "create_final_documents",
+        "extract_graph",
+        "finalize_graph",
+        "extract_covariates",
+    }
+
+
+def test_undeclared_workflow_is_a_barrier():
+    pipeline = Pipeline(
+        [("a", None), ("custom", None), ("b", None)],  # type: ignore
+        {
+            "a": WorkflowDependencies(outputs=["x"]),
+            "b": WorkflowDependencies(inputs=["y"]),
+        },
+    )
+    assert pipeline.predecessors() == [set(), {0}, {1}]
+
+
+async def test_independent_workflows_overlap():
+    events: list[str] = []
+
+    def sleeper(name: str):
+        async def run(_config: GraphRagConfig, _context: PipelineRunContext):
+            events.append(f"start {name}")
+            await asyncio.sleep(0.01)
+            events.append(f"end {name}")
+            return WorkflowFunctionOutput(result=None)
+
+        return run
+
+    pipeline = Pipeline(
+        [(name, sleeper(name)) for name in ["first", "left", "right", "last"]],
+        {
+            "first": WorkflowDependencies(outputs=["a"]),
+            "left": WorkflowDependencies(inputs=["a"], outputs=["b"]),
+            "right": WorkflowDependencies(inputs=["a"], outputs=["c"]),
+            "last": WorkflowDependencies(inputs=["b", "c"]),
+        },
+    )
+    config = create_graphrag_config({"models": DEFAULT_MODEL_CONFIG})
+    config.concurrent_workflows = True
+
+    results = [
+        result
+        async for result in _run_pipeline(
+            pipeline=pipeline,
+            config=config,
+            dataset=pd.DataFrame({"id": ["1"], "text": ["a"]}),
+            cache=InMemoryCache(),
+            storage=MemoryPipelineStorage(),
+            callbacks=NoopWorkflowCallbacks(),
+            logger=NullProgressLogger(),
+        )
+    ]
+
+    assert all(result.errors is None for result in results)
+    assert events[:2] == ["start first", "end first"]
+    assert events[2:4] == ["start left", "start right"]
+    assert events[-2:] == ["start last", "end last"]
@@ -0,0 +1,196 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Tests for per-workflow resource profiling."""
+
+import asyncio
+import json
+
+import pandas as pd
+from fnllm.limiting import Manifest
+from fnllm.types.metrics import LLMUsageMetrics
+
+from graphrag.cache.memory_pipeline_cache import InMemoryCache
+from graphrag.callbacks.noop_workflow_callbacks import NoopWorkflowCallbacks
+from graphrag.config.create_graphrag_config import create_graphrag_config
+from graphrag.config.models.graph_rag_config import GraphRagConfig
+from graphrag.index.run.profiling import WorkflowProfiler
+from graphrag.index.run.run_pipeline import _run_pipeline
+from graphrag.index.typing.context import PipelineRunContext
+from graphrag.index.typing.pipeline import Pipeline
+from graphrag.index.typing.workflow import WorkflowDependencies, WorkflowFunctionOutput
+from graphrag.language_model.providers.fnllm.events import FNLLMEvents
+from graphrag.logger.null_progress import NullProgressLogger
+from graphrag.storage.file_pipeline_storage import FilePipelineStorage
+from graphrag.utils.storage import load_table_from_storage
+from tests.verbs.util import DEFAULT_MODEL_CONFIG
+
+
+async def count_words(_config: GraphRagConfig, context: PipelineRunContext):
+    documents = await context.tables.load("documents")
+    words = pd.DataFrame({"n": documents["text"].str.split().str.len()})
+    words = pd.concat([words, words], ignore_index=True)
+    await context.tables.write("words", words)
+    return WorkflowFunctionOutput(result=None)
+
+
+async def sum_words(_config: GraphRagConfig, context: PipelineRunContext):
+    words = await context.tables.load("words")
+    await context.tables.write("total", pd.DataFrame({"n": [words["n"].sum()]}))
+    return WorkflowFunctionOutput(result=None)
+
+
+async def run(
+    storage,
+    profile: bool,
+    *workflows,
+    extra_dependencies=None,
+    table_memory_limit=0,
+    concurrent_workflows=False,
+):
+    config = create_graphrag_config({
+        "models": DEFAULT_MODEL_CONFIG,
+        "table_memory_limit": table_memory_limit,
+        "concurrent_workflows": concurrent_workflows,
+    })
+    dataset = pd.DataFrame({"id": ["1", "2", "3"], "text": ["a b c", "d e", "f"]})
+    workflows = workflows or (count_words,)
+    dependencies = {
+        "count_words": WorkflowDependencies(inputs=["documents"], outputs=["words"]),
+        "sum_words": WorkflowDependencies(inputs=["words"], outputs=["total"]),
+        **(extra_dependencies or {}),
+    }
+    return [
+        result
+        async for result in _run_pipeline(
+            pipeline=Pipeline(
+                [(workflow.__name__, workflow) for workflow in workflows],
+                dependencies,
+            ),
+            config=config,
+            dataset=dataset,
+            cache=InMemoryCache(),
+            storage=storage,
+            callbacks=NoopWorkflowCallbacks(),
+            logger=NullProgressLogger(),
+            profile=profile,
+        )
+    ]
+
+
+async def test_workflow_stats(tmp_path):
+    storage = FilePipelineStorage(str(tmp_path))
+    await run(storage, profile=False)
+
+    stats = json.loads(await storage.get("stats.json"))
+    workflow = stats["workflows"]["count_words"]
+    assert workflow["rows_read"] == 3
+    assert workflow["rows_written"] == 6
+    assert workflow["bytes_read"] == (tmp_path / "documents.parquet").stat().st_size
+    assert workflow["bytes_written"] == (tmp_path / "words.parquet").stat().st_size
+    assert workflow["overall"] >= 0
+    assert workflow["rss"] >= 0
+    assert "rss_delta" in workflow
+    assert workflow["peak_traced_memory"] == 0
+    assert not (tmp_path / "profiles").exists()
+
+
+async def test_workflow_profile_artifacts(tmp_path):
+    storage = FilePipelineStorage(str(tmp_path))
+    await run(storage, profile=True)
+
+    stats = json.loads(await storage.get("stats.json"))
+    assert stats["workflows"]["count_words"]["peak_traced_memory"] > 0
+    profiles = {path.name for path in (tmp_path / "profiles").iterdir()}
+    assert profiles == {
+        "count_words.prof",
+        "count_words.cpu.txt",
+        "count_words.memory.txt",
+    }
+
+
+async def test_process_wide_stats_are_skipped_for_concurrent_workflows(tmp_path):
+    storage = FilePipelineStorage(str(tmp_path))
+    await run(storage, True, count_words, sum_words, concurrent_workflows=True)
+
+    stats = json.loads(await storage.get("stats.json"))
+    for workflow in stats["workflows"].values():
+        assert workflow["cpu_time"] == 0
+        assert workflow["rss"] == 0
+        assert workflow["rss_delta"] == 0
+        assert workflow["peak_traced_memory"] == 0
+    assert stats["workflows"]["sum_words"]["rows_read"] == 6
+    assert not (tmp_path / "profiles").exists()
+
+
+async def test_llm_events_are_attributed_to_workflow():
+    events = FNLLMEvents()
+
+    await events.on_usage(LLMUsageMetrics(input_tokens=10, output_tokens=3))
+
+    with WorkflowProfiler("extract") as profiler:
+        await events.on_try(1)
+        await events.on_limit_acquired(Manifest(request_tokens=10))
+        await events.on_usage(LLMUsageMetrics(input_tokens=10, output_tokens=3))
+        await events.on_usage(LLMUsageMetrics(input_tokens=5, output_tokens=1))
+        await events.on_cache_hit("key", None)
+        await events.on_cache_miss("key", None)
+        await events.on_cache_miss("key", None)
+
+    profile = profiler.profile
+    assert profile.llm_calls == 2
+    assert profile.prompt_tokens == 15
+    assert profile.completion_tokens == 4
+    assert profile.cache_hits == 1
+    assert profile.cache_misses == 2
+    assert profile.rate_limit_wait >= 0
+
+
+async def test_workflows_do_not_wait_for_their_tables_to_persist(tmp_path):
+    class SlowStorage(FilePipelineStorage):
+        def __init__(self, root_dir: str):
+            super().__init__(root_dir)
+            self.release = asyncio.Event()
+
+        async def set(self, key, value, encoding=None) -> None:
+            if key == "words.parquet":
+                await self.release.wait()
+            await super().set(key, value, encoding)
+
+    storage = SlowStorage(str(tmp_path))
+
+    async def release_words(_config: GraphRagConfig, context: PipelineRunContext):
+        # runs while words is still being written
+        storage.release.set()
+        return await sum_words(_config, context)
+
+    dependencies = {
+        "release_words": WorkflowDependencies(inputs=["words"], outputs=["total"])
+    }
+    results = await asyncio.wait_for(
+        run(
+            storage,
+            False,
+            count_words,
+            release_words,
+            extra_dependencies=dependencies,
+            table_memory_limit=16,
+        ),
+        timeout=30,
+    )
+
+    assert all(result.errors is None for result in results)
+    assert (await load_table_from_storage("words", storage))["n"].sum() == 12
+
+
+async def test_tables_are_handed_over_in_memory(tmp_path):
+    storage = FilePipelineStorage(str(tmp_path))
+    await run(storage, False, count_words, sum_words, table_memory_limit=16)
+
+    stats = json.loads(await storage.get("stats.json"))
+    workflow = stats["workflows"]["sum_words"]
+    assert workflow["rows_read"] == 6
+    assert workflow["bytes_read"] == 0
+    assert workflow["bytes_written"] == (tmp_path / "total.parquet").stat().st_size
+    total = await load_table_from_storage("total", storage)
+    assert total["n"].tolist() == [12]
@@ -0,0 +1,208 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Tests for resuming a pipeline run from workflow checkpoints."""
+
+import hashlib
+import json
+
+import pandas as pd
+
+from graphrag.cache.memory_pipeline_cache import InMemoryCache
+from graphrag.callbacks.noop_workflow_callbacks import NoopWorkflowCallbacks
+from graphrag.config.create_graphrag_config import create_graphrag_config
+from graphrag.config.models.graph_rag_config import GraphRagConfig
+from graphrag.index.run.run_pipeline import _run_pipeline
+from graphrag.index.typing.context import PipelineRunContext
+from graphrag.index.typing.pipeline import Pipeline
+from graphrag.index.typing.workflow import WorkflowDependencies, WorkflowFunctionOutput
+from graphrag.logger.null_progress import NullProgressLogger
+from graphrag.storage.memory_pipeline_storage import MemoryPipelineStorage
+from graphrag.utils.storage import load_table_from_storage, write_table_to_storage
+from tests.verbs.util import DEFAULT_MODEL_CONFIG
+
+calls: list[str] = []
+
+
+async def count_words(_config: GraphRagConfig, context: PipelineRunContext):
+    calls.append("count_words")
+    documents = await load_table_from_storage("documents", context.storage)
+    words = pd.DataFrame({"n": documents["text"].str.split().str.len()})
+    await write_table_to_storage(words, "words", context.storage)
+    return WorkflowFunctionOutput(result=None)
+
+
+async def double_words(_config: GraphRagConfig, context: PipelineRunContext):
+    calls.append("double_words")
+    words = await load_table_from_storage("words", context.storage)
+    words["n"] = words["n"] * 2
+    await write_table_to_storage(words, "words", context.storage)
+    return WorkflowFunctionOutput(result=None)
+
+
+async def count_words_in_memory(_config: GraphRagConfig, context: PipelineRunContext):
+    calls.append("count_words")
+    documents = await context.tables.load("documents")
+    words = pd.DataFrame({"n": documents["text"].str.split().str.len()})
+    await context.tables.write("words", words)
+    return WorkflowFunctionOutput(result=None)
+
+
+class ReadTrackingStorage(MemoryPipelineStorage):
+    def __init__(self):
+        super().__init__()
+        self.reads: list[str] = []
+
+    async def get(self, key: str, as_bytes: bool | None = None, encoding=None):
+        self.reads.append(key)
+        return await super().get(key, as_bytes, encoding)
+
+
+async def fail(_config: GraphRagConfig, _context: PipelineRunContext):  # noqa: RUF029
+    calls.append("fail")
+    msg = "boom"
+    raise ValueError(msg)
+
+
+def create_pipeline(*workflows) -> Pipeline:
+    dependencies = {
+        "count_words": WorkflowDependencies(
+            inputs=["documents"], outputs=["words"], config=["chunks"]
+        ),
+        "count_words_in_memory": WorkflowDependencies(
+            inputs=["documents"], outputs=["words"], config=["chunks"]
+        ),
+        "double_words": WorkflowDependencies(
+            inputs=["words"], outputs=["words"], config=["cluster_graph"]
+        ),
+    }
+    return Pipeline(
+        [(workflow.__name__, workflow) for workflow in workflows], dependencies
+    )
+
+
+def create_config() -> GraphRagConfig:
+    config = create_graphrag_config({"models": DEFAULT_MODEL_CONFIG})
+    config.checkpoints = True
+    return config
+
+
+def preserved_tables(storage: MemoryPipelineStorage) -> list[str]:
+    keys = storage.keys()
+    return [key for key in keys if key.endswith(".checkpoint")]
+
+
+async def run(pipeline: Pipeline, config, storage, is_resume_run: bool = True):
+    dataset = pd.DataFrame({"id": ["1", "2"], "text": ["a b c", "d e"]})
+    return [
+        result
+        async for result in _run_pipeline(
+            pipeline=pipeline,
+            config=config,
+            dataset=dataset,
+            cache=InMemoryCache(),
+            storage=storage,
+            callbacks=NoopWorkflowCallbacks(),
+            logger=NullProgressLogger(),
+            is_resume_run=is_resume_run,
+        )
+    ]
+
+
+async def test_resume_skips_completed_workflows():
+    config = create_config()
+    storage = MemoryPipelineStorage()
+    calls.clear()
+
+    results = await run(
+        create_pipeline(count_words, double_words, fail), config, storage, False
+    )
+    assert results[-1].errors
+    assert calls == ["count_words", "double_words", "fail"]
+
+    calls.clear()
+    results = await run(create_pipeline(count_words, double_words), config, storage)
+    assert calls == []
+    assert all(result.errors is None for result in results)
+    words = await load_table_from_storage("words", storage)
+    assert words["n"].tolist() == [6, 4]
+
+
+async def test_resume_reruns_from_changed_config():
+    config = create_config()
+    storage = MemoryPipelineStorage()
+    calls.clear()
+
+    await run(create_pipeline(count_words, double_words, fail), config, storage, False)
+    config.cluster_graph.max_cluster_size += 1
+
+    calls.clear()
+    await run(create_pipeline(count_words, double_words), config, storage)
+
+    # double_words rewrites its own input, so it must read the restored original
+    assert calls == ["double_words"]
+    words = await load_table_from_storage("words", storage)
+    assert words["n"].tolist() == [6, 4]
+
+
+async def test_completed_run_deletes_preserved_tables():
+    config = create_config()
+    storage = MemoryPipelineStorage()
+    pipeline = create_pipeline(count_words, double_words)
+
+    await run(pipeline, config, storage, False)
+
+    assert preserved_tables(storage) == []
+    config.cluster_graph.max_cluster_size += 1
+
+    calls.clear()
+    await run(pipeline, config, storage)
+
+    # the version of words double_words read is gone, so count_words runs again
+    assert calls == ["count_words", "double_words"]
+    words = await load_table_from_storage("words", storage)
+    assert words["n"].tolist() == [6, 4]
+
+
+async def test_checkpoints_hash_the_written_tables():
+    config = create_config()
+    storage = ReadTrackingStorage()
+
+    await run(create_pipeline(count_words_in_memory), config, storage, False)
+
+    assert "words.parquet" not in storage.reads
+    state = json.loads(await storage.get("context.json"))
+    record = state["checkpoints"]["workflows"]["count_words_in_memory"]
+    data = await storage.get("words.parquet", as_bytes=True)
+    assert record["outputs"]["words"] == hashlib.sha256(data).hexdigest()
+
+
+async def test_no_checkpoints_unless_enabled():
+    config = create_graphrag_config({"models": DEFAULT_MODEL_CONFIG})
+    storage = MemoryPipelineStorage()
+    pipeline = create_pipeline(count_words, double_words, fail)
+
+    await run(pipeline, config, storage, False)
+
+    state = json.loads(await storage.get("context.json"))
+    assert "checkpoints" not in state
+    assert preserved_tables(storage) == []
+
+    calls.clear()
+    await run(create_pipeline(count_words, double_words), config, storage)
+    assert calls == ["count_words", "double_words"]
+
+
+async def test_resume_reruns_on_changed_input():
+    config = create_config()
+    storage = MemoryPipelineStorage()
+    pipeline = create_pipeline(count_words, double_words)
+
+    await run(pipeline, config, storage, False)
+    config.chunks.size += 1
+
+    calls.clear()
+    await run(pipeline, config, storage)
+
+    # count_words produces the same table, so double_words can still be skipped
+    assert calls == ["count_words"]